@@ -16,13 +16,31 @@ from pycspr import crypto
 from pycspr import factory
 from pycspr import verifier
 
+from pycspr.api import NodeCircuitBreakerPolicy
+from pycspr.api import NodeCircuitOpenError
+from pycspr.api import NodeDeadlineExceededError
+from pycspr.api import NodeRetryPolicy
 from pycspr.api import NodeRestClient
 from pycspr.api import NodeRestConnectionInfo
+from pycspr.api import NodeRestSyncClient
+from pycspr.api import NodeRpcCachePolicy
+from pycspr.api import NodeRpcCassette
+from pycspr.api import NodeRpcCassetteError
 from pycspr.api import NodeRpcClient
 from pycspr.api import NodeRpcConnectionInfo
+from pycspr.api import NodeRpcGlobalStateCache
+from pycspr.api import NodeRpcPriority
 from pycspr.api import NodeRpcProxyError
+from pycspr.api import NodeRpcReplayTransport
+from pycspr.api import NodeRpcResponseCache
+from pycspr.api import NodeRpcSelectionStrategy
+from pycspr.api import NodeRpcStateCachePolicy
+from pycspr.api import NodeRpcSyncClient
+from pycspr.api import NodeSession
+from pycspr.api import NodeSessionConnectionInfo
 from pycspr.api import NodeSpeculativeRpcClient
 from pycspr.api import NodeSpeculativeRpcConnectionInfo
+from pycspr.api import NodeSpeculativeRpcSyncClient
 from pycspr.api import NodeSseClient
 from pycspr.api import NodeSseConnectionInfo
 from pycspr.api import NodeEventChannel
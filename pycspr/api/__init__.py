@@ -1,12 +1,31 @@
+from pycspr.api.deadlines import deadline
+from pycspr.api.deadlines import DeadlineExceededError as NodeDeadlineExceededError
+from pycspr.api.resilience import CircuitBreakerPolicy as NodeCircuitBreakerPolicy
+from pycspr.api.resilience import CircuitOpenError as NodeCircuitOpenError
+from pycspr.api.resilience import RetryPolicy as NodeRetryPolicy
 from pycspr.api.rest import Client as NodeRestClient
 from pycspr.api.rest import ConnectionInfo as NodeRestConnectionInfo
+from pycspr.api.rpc import CachePolicy as NodeRpcCachePolicy
+from pycspr.api.rpc import Cassette as NodeRpcCassette
+from pycspr.api.rpc import CassetteError as NodeRpcCassetteError
 from pycspr.api.rpc import Client as NodeRpcClient
 from pycspr.api.rpc import ConnectionInfo as NodeRpcConnectionInfo
+from pycspr.api.rpc import GlobalStateCache as NodeRpcGlobalStateCache
+from pycspr.api.rpc import Priority as NodeRpcPriority
 from pycspr.api.rpc import ProxyError as NodeRpcProxyError
+from pycspr.api.rpc import ReplayTransport as NodeRpcReplayTransport
+from pycspr.api.rpc import ResponseCache as NodeRpcResponseCache
+from pycspr.api.rpc import SelectionStrategy as NodeRpcSelectionStrategy
+from pycspr.api.rpc import StateCachePolicy as NodeRpcStateCachePolicy
 from pycspr.api.rpc_speculative import Client as NodeSpeculativeRpcClient
 from pycspr.api.rpc_speculative import ConnectionInfo as NodeSpeculativeRpcConnectionInfo
+from pycspr.api.session import ConnectionInfo as NodeSessionConnectionInfo
+from pycspr.api.session import Session as NodeSession
 from pycspr.api.sse import Client as NodeSseClient
 from pycspr.api.sse import ConnectionInfo as NodeSseConnectionInfo
+from pycspr.api.sync import SyncRestClient as NodeRestSyncClient
+from pycspr.api.sync import SyncRpcClient as NodeRpcSyncClient
+from pycspr.api.sync import SyncSpeculativeRpcClient as NodeSpeculativeRpcSyncClient
 from pycspr.types.node import NodeEventChannel
 from pycspr.types.node import NodeEventInfo
 from pycspr.types.node import NodeEventType
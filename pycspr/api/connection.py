@@ -0,0 +1,13 @@
+def get_address(connection_info: object, path: str = "") -> str:
+    """Returns URL of a node API as derived from information required to connect to it.
+
+    :param connection_info: Information required to connect to a node's API.
+    :param path: Path of API beneath connection's base path, e.g. /rpc.
+    :returns: URL of node API.
+
+    """
+    base_path = connection_info.base_path.strip("/")
+    base_path = f"/{base_path}" if base_path else ""
+    origin = f"{connection_info.scheme}://{connection_info.host}:{connection_info.port}"
+
+    return f"{origin}{base_path}{path}"
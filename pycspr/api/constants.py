@@ -7,6 +7,74 @@ DEFAULT_PORT_RPC = 7777
 DEFAULT_PORT_SPECULATIVE_RPC = 7778
 DEFAULT_PORT_SSE = 9999
 
+# Default maximum number of pooled keep-alive connections per node endpoint.
+DEFAULT_POOL_SIZE = 32
+
+# Default period (seconds) for which idle pooled connections are kept alive.
+DEFAULT_KEEPALIVE_TIMEOUT = 60.0
+
+# Size (bytes) of chunks in which response bodies are streamed.
+TRANSPORT_CHUNK_SIZE = 65536
+
+# Minimum size (bytes) of a request body for it to be compressed.
+TRANSPORT_COMPRESSION_MIN_SIZE = 1024
+
+# Default size (bytes) of a JSON-RPC response body from which it is decoded within a worker.
+DEFAULT_OFFLOAD_MIN_SIZE = 256 * 1024
+
+# Default maximum size (bytes) of responses held in memory by a response cache.
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Default maximum size (bytes) of responses held on disk by a response cache.
+DEFAULT_CACHE_MAX_DISK_BYTES = 1024 * 1024 * 1024
+
+# Age (seconds) from which a temporary file within an on-disk response cache is deemed
+# abandoned, i.e. by a process that exited mid write.
+CACHE_STALE_FILE_AGE = 60
+
+# Default maximum size (bytes) of results held by a global state cache.
+DEFAULT_STATE_CACHE_MAX_BYTES = 4 * 1024 * 1024 * 1024
+
+# Default maximum number of nodes scraped concurrently.
+DEFAULT_SCRAPE_CONCURRENCY = 16
+
+# Default period (seconds) within which a node must be scraped.
+DEFAULT_SCRAPE_TIMEOUT = 10.0
+
+# Default maximum number of calls dispatched within a single JSON-RPC batch request.
+DEFAULT_BATCH_SIZE = 100
+
+# Period (seconds) for which a batch awaits calls blocked upon other awaitables before
+# dispatching those calls already enqueued.
+BATCH_BARRIER_TIMEOUT = 0.01
+
+# Default time window (seconds) within which calls are automatically batched.
+DEFAULT_AUTO_BATCH_WINDOW = 0.002
+
+# Default number of consecutive failed calls after which a node is ejected from a pool.
+DEFAULT_POOL_MAX_FAILURES = 3
+
+# Default initial period (seconds) for which a node is ejected from a pool.
+DEFAULT_POOL_EJECTION_PERIOD = 5.0
+
+# Maximum period (seconds) for which a node is ejected from a pool.
+POOL_EJECTION_PERIOD_MAX = 60.0
+
+# Smoothing factor applied to moving average of node call latency.
+POOL_LATENCY_SMOOTHING = 0.2
+
+# Number of points per node upon a consistent hash ring - smooths distribution of keys.
+POOL_HASH_RING_REPLICAS = 64
+
+# Minimum number of latency observations required to derive an endpoint's hedging delay.
+HEDGING_MIN_OBSERVATIONS = 20
+
+# Default initial number of in-flight calls permitted per node by an adaptive limiter.
+DEFAULT_LIMITER_INITIAL_LIMIT = 8
+
+# Rate at which an adaptive limiter's baseline latency drifts towards observed latency.
+LIMITER_BASELINE_DRIFT = 0.01
+
 # Node RPC endpoints.
 RPC_ACCOUNT_PUT_DEPLOY = "account_put_deploy"
 RPC_CHAIN_GET_BLOCK = "chain_get_block"
@@ -29,6 +97,37 @@ RPC_STATE_GET_DICTIONARY_ITEM = "state_get_dictionary_item"
 RPC_STATE_GET_ITEM = "state_get_item"
 RPC_STATE_GET_TRIE = "state_get_trie"
 
+# Node RPC endpoints whose invocation changes state - and thus are never re-issued.
+RPC_WRITE_ENDPOINTS: set = {
+    RPC_ACCOUNT_PUT_DEPLOY,
+    }
+
+# Node RPC endpoints whose results are immutable when scoped by block or deploy hash,
+# or by block height - and thus may be cached indefinitely.
+RPC_IMMUTABLE_ENDPOINTS: set = {
+    RPC_CHAIN_GET_BLOCK,
+    RPC_CHAIN_GET_BLOCK_TRANSFERS,
+    RPC_CHAIN_GET_ERA_INFO_BY_SWITCH_BLOCK,
+    RPC_CHAIN_GET_ERA_SUMMARY,
+    RPC_INFO_GET_DEPLOY,
+    }
+
+# Node RPC endpoints querying global state - whose results are fully determined by the
+# state root, or block, against which they are queried.
+RPC_STATE_ENDPOINTS: set = {
+    RPC_QUERY_BALANCE,
+    RPC_QUERY_GLOBAL_STATE,
+    RPC_STATE_GET_DICTIONARY_ITEM,
+    RPC_STATE_GET_ITEM,
+    }
+
+# Node RPC error codes indicating a transient failure - and thus retryable.
+RPC_RETRYABLE_ERROR_CODES: set = {
+    -32603,  # Internal error.
+    -32004,  # Query failed to execute.
+    -32007,  # Get balance failed to execute.
+    }
+
 RPC_ENDPOINTS: set = {
     RPC_ACCOUNT_PUT_DEPLOY,
     RPC_CHAIN_GET_BLOCK,
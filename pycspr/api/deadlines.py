@@ -0,0 +1,100 @@
+import asyncio
+import contextlib
+import contextvars
+import functools
+import inspect
+import typing
+
+
+# Loop time at which calls dispatched within current context must have completed.
+CURRENT_DEADLINE: contextvars.ContextVar[float] = \
+    contextvars.ContextVar("CURRENT_DEADLINE", default=None)
+
+
+class DeadlineExceededError(asyncio.TimeoutError):
+    """Raised when calls fail to complete within a deadline.
+
+    """
+    def __init__(self, timeout: float):
+        """Instance constructor.
+
+        :param timeout: Budget (seconds) that was exceeded.
+
+        """
+        super(DeadlineExceededError, self).__init__(
+            f"Deadline exceeded: calls did not complete within {timeout:.3f}s"
+        )
+        self.timeout = timeout
+
+
+@contextlib.asynccontextmanager
+async def deadline(timeout: float):
+    """Bounds the time within which calls dispatched within scope must complete.
+
+    Scopes nest: an inner scope may shorten but never extend an outer scope's deadline,
+    thus composite calls share a single budget.
+
+    :param timeout: Time budget in seconds.
+
+    """
+    loop = asyncio.get_running_loop()
+    expires = loop.time() + timeout
+    current = CURRENT_DEADLINE.get()
+    if current is not None and current <= expires:
+        yield
+        return
+
+    token = CURRENT_DEADLINE.set(expires)
+    try:
+        async with asyncio.timeout_at(expires) as scope:
+            yield
+    except TimeoutError as err:
+        if scope.expired():
+            raise DeadlineExceededError(timeout) from err
+        raise
+    finally:
+        CURRENT_DEADLINE.reset(token)
+
+
+def get_remaining() -> typing.Optional[float]:
+    """Returns time remaining until current deadline.
+
+    :returns: Remaining time in seconds - None if no deadline applies.
+
+    """
+    current = CURRENT_DEADLINE.get()
+    if current is None:
+        return None
+
+    return max(current - asyncio.get_running_loop().time(), 0.0)
+
+
+def with_deadline(
+    func: typing.Callable[..., typing.Awaitable],
+    timeout: float
+) -> typing.Callable:
+    """Returns a function whose invocations are bounded by a deadline.
+
+    :param func: Function to be wrapped.
+    :param timeout: Time budget in seconds.
+    :returns: Wrapped function.
+
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        async with deadline(timeout):
+            return await func(*args, **kwargs)
+
+    return wrapper
+
+
+def apply_timeout(client: object, timeout: float):
+    """Bounds invocations of each of a client's public coroutine methods by a deadline.
+
+    :param client: A node API client.
+    :param timeout: Time budget in seconds.
+
+    """
+    for name, func in inspect.getmembers(client, asyncio.iscoroutinefunction):
+        if not name.startswith("_") and name != "close":
+            setattr(client, name, with_deadline(func, timeout))
@@ -0,0 +1,235 @@
+import asyncio
+import dataclasses
+import random
+import time
+import typing
+
+import aiohttp
+import requests
+
+from pycspr.api import constants
+from pycspr.api.deadlines import DeadlineExceededError
+from pycspr.api.deadlines import get_remaining
+from pycspr.api.transport import TRANSPORT_ERRORS
+
+
+# HTTP status codes indicating that a node is temporarily unable to serve a request.
+_RETRYABLE_HTTP_STATUSES = {408, 429, 500, 502, 503, 504}
+
+
+@dataclasses.dataclass
+class RetryPolicy:
+    """Encapsulates parameters controlling retries of failed idempotent calls.
+
+    """
+    # Maximum number of attempts per call - i.e. initial attempt plus retries.
+    max_attempts: int = 3
+
+    # Delay (seconds) before first retry.
+    base_delay: float = 0.05
+
+    # Upper bound of delay (seconds) before a retry.
+    max_delay: float = 2.0
+
+    # Factor by which delay grows with each retry.
+    multiplier: float = 2.0
+
+    # Node error codes deemed transient and thus retryable - other codes are fatal.
+    retryable_codes: typing.Set[int] = dataclasses.field(
+        default_factory=lambda: set(constants.RPC_RETRYABLE_ERROR_CODES)
+    )
+
+
+@dataclasses.dataclass
+class CircuitBreakerPolicy:
+    """Encapsulates parameters controlling a per node circuit breaker.
+
+    """
+    # Number of consecutive node failures after which circuit opens.
+    failure_threshold: int = 5
+
+    # Period (seconds) after which an open circuit admits trial calls.
+    reset_timeout: float = 10.0
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is refused because a node's circuit is open.
+
+    """
+    def __init__(self, address: str, retry_after: float):
+        """Instance constructor.
+
+        :param address: Address of node whose circuit is open.
+        :param retry_after: Period (seconds) after which node will admit trial calls.
+
+        """
+        super(CircuitOpenError, self).__init__(
+            f"Circuit open for node {address} - retry after {retry_after:.2f}s"
+        )
+        self.address = address
+        self.retry_after = retry_after
+
+
+class CircuitBreaker():
+    """Fails calls fast whilst a node is deemed down.
+
+    After consecutive node failures the circuit opens and calls are refused. Once the
+    reset timeout has elapsed the circuit is half-open: calls are admitted, the first
+    success closes the circuit whilst a failure re-opens it.
+
+    """
+    def __init__(self, address: str, policy: CircuitBreakerPolicy):
+        """Instance constructor.
+
+        :param address: Address of node being guarded.
+        :param policy: Circuit breaker policy.
+
+        """
+        self.address = address
+        self.policy = policy
+        self.failures: int = 0
+        self.opened_until: float = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Flag indicating whether calls are currently refused."""
+        return self.opened_until > time.monotonic()
+
+    def check(self):
+        """Raises if a call is to be refused.
+
+        """
+        now = time.monotonic()
+        if self.opened_until > now:
+            raise CircuitOpenError(self.address, self.opened_until - now)
+
+    async def invoke(self, func: typing.Callable[[], typing.Awaitable]) -> object:
+        """Invokes a call - failing fast if circuit is open.
+
+        :param func: Function dispatching call.
+        :returns: Result of call.
+
+        """
+        self.check()
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            if is_node_failure(err):
+                self.on_failure()
+            else:
+                self.on_success()
+            raise
+        else:
+            self.on_success()
+
+        return result
+
+    def on_failure(self):
+        """Records a node failure.
+
+        """
+        self.failures += 1
+        # A half-open circuit re-opens upon first failure.
+        if self.failures >= self.policy.failure_threshold or self.opened_until > 0.0:
+            self.opened_until = time.monotonic() + self.policy.reset_timeout
+
+    def on_success(self):
+        """Records a successful call.
+
+        """
+        self.failures = 0
+        self.opened_until = 0.0
+
+
+class Retrier():
+    """Retries failed idempotent calls with jittered exponential backoff.
+
+    """
+    def __init__(self, policy: RetryPolicy):
+        """Instance constructor.
+
+        :param policy: Retry policy.
+
+        """
+        self.policy = policy
+        self.retries: int = 0
+
+    def get_delay(self, attempt: int) -> float:
+        """Returns delay before a retry - full jitter is applied to avoid retry storms.
+
+        :param attempt: Number of attempts made so far.
+        :returns: Delay in seconds.
+
+        """
+        ceiling = min(
+            self.policy.base_delay * self.policy.multiplier ** (attempt - 1),
+            self.policy.max_delay
+        )
+
+        return random.uniform(0, ceiling)
+
+    async def invoke(self, func: typing.Callable[[], typing.Awaitable]) -> object:
+        """Invokes a call - retrying it whilst it fails with a retryable error.
+
+        :param func: Function dispatching call.
+        :returns: Result of first successful attempt.
+
+        """
+        attempt = 1
+        while True:
+            try:
+                return await func()
+            except Exception as err:
+                if attempt >= self.policy.max_attempts or \
+                   not is_retryable(err, self.policy.retryable_codes):
+                    raise
+                # A retry is pointless if it cannot complete within current deadline.
+                delay = self.get_delay(attempt)
+                remaining = get_remaining()
+                if remaining is not None and remaining <= delay:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+            self.retries += 1
+
+
+def is_node_failure(err: Exception) -> bool:
+    """Returns flag indicating whether an error implies that a node is down.
+
+    :param err: Error raised by a call.
+    :returns: True if node is unreachable or failing to serve requests.
+
+    """
+    if isinstance(err, DeadlineExceededError):
+        return False
+    if isinstance(err, aiohttp.ClientResponseError):
+        return err.status >= 500
+    if isinstance(err, requests.HTTPError):
+        return err.response is not None and err.response.status_code >= 500
+
+    # N.B. requests errors derive from OSError and so are transport errors.
+    return isinstance(err, TRANSPORT_ERRORS)
+
+
+def is_retryable(err: Exception, retryable_codes: typing.Set[int]) -> bool:
+    """Returns flag indicating whether a failed call may be retried.
+
+    :param err: Error raised by a call.
+    :param retryable_codes: Node error codes deemed transient.
+    :returns: True if error is transient.
+
+    """
+    if isinstance(err, (CircuitOpenError, DeadlineExceededError)):
+        return False
+    if isinstance(err, aiohttp.ClientResponseError):
+        return err.status in _RETRYABLE_HTTP_STATUSES
+    if isinstance(err, requests.HTTPError):
+        return err.response is not None and \
+            err.response.status_code in _RETRYABLE_HTTP_STATUSES
+    if is_node_failure(err):
+        return True
+
+    # Node errors, i.e. JSON-RPC error responses, are classified by code.
+    return getattr(err, "code", None) in retryable_codes
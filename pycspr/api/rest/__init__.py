@@ -1,2 +1,4 @@
 from pycspr.api.rest.client import Client
 from pycspr.api.rest.connection import ConnectionInfo
+from pycspr.api.rest.scraping import scrape_many
+from pycspr.api.rest.scraping import ScrapeResult
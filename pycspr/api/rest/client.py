@@ -1,8 +1,13 @@
 import typing
 
 from pycspr import serializer
+from pycspr.api.deadlines import apply_timeout
+from pycspr.api.resilience import CircuitBreakerPolicy
+from pycspr.api.resilience import RetryPolicy
 from pycspr.api.rest.connection import ConnectionInfo
 from pycspr.api.rest.proxy import Proxy
+from pycspr.api.transport import Transport
+from pycspr.api.transport import TransportStats
 from pycspr.types.node import NodeStatus
 from pycspr.types.node import ValidatorChanges
 
@@ -11,18 +16,45 @@ class Client():
     """Node REST server client.
 
     """
-    def __init__(self, connection_info: ConnectionInfo):
+    def __init__(
+        self,
+        connection_info: ConnectionInfo,
+        retry: RetryPolicy = None,
+        circuit_breaker: CircuitBreakerPolicy = None,
+        timeout: float = None,
+        transport: Transport = None,
+    ):
         """Instance constructor.
 
         :param connection_info: Information required to connect to a node.
+        :param retry: Policy to apply when retrying failed calls (optional).
+        :param circuit_breaker: Policy to apply when failing calls fast (optional).
+        :param timeout: Time budget (seconds) within which each call must complete (optional).
+        :param transport: A shared transport over which calls are dispatched, e.g. as
+                          owned by a node session (optional).
 
         """
-        self.proxy = Proxy(connection_info)
+        self.proxy = Proxy(connection_info, retry, circuit_breaker, transport)
 
         # Extension methods -> 2nd order functions.
         ext = ClientExtensions(self)
         self.get_node_metric = ext.get_node_metric
 
+        # Deadline bound methods -> composite calls share a single time budget.
+        if timeout is not None:
+            apply_timeout(self, timeout)
+
+    @property
+    def stats(self) -> TransportStats:
+        """Counters of bytes exchanged with node."""
+        return self.proxy.stats
+
+    async def close(self):
+        """Closes pooled connections to remote server.
+
+        """
+        await self.proxy.close()
+
     async def get_chainspec(self) -> dict:
         """Returns network chainspec.
 
@@ -1,41 +1,76 @@
-import json
-
-import requests
-
 from pycspr.api import constants
+from pycspr.api.connection import get_address
+from pycspr.api.resilience import CircuitBreaker
+from pycspr.api.resilience import CircuitBreakerPolicy
+from pycspr.api.resilience import Retrier
+from pycspr.api.resilience import RetryPolicy
 from pycspr.api.rest.connection import ConnectionInfo
+from pycspr.api.transport import get_transport
+from pycspr.api.transport import Transport
+from pycspr.api.transport import TransportStats
+from pycspr.utils import json_codec
 
 
 class Proxy:
     """Node REST server proxy.
 
     """
-    def __init__(self, connection_info: ConnectionInfo):
+    def __init__(
+        self,
+        connection_info: ConnectionInfo,
+        retry: RetryPolicy = None,
+        circuit_breaker: CircuitBreakerPolicy = None,
+        transport: Transport = None,
+    ):
         """Instance constructor.
 
         :param connection_info: Information required to connect to a node.
+        :param retry: Policy to apply when retrying failed calls (optional).
+        :param circuit_breaker: Policy to apply when failing calls fast (optional).
+        :param transport: A shared transport over which calls are dispatched (optional).
 
         """
         self.connection_info = connection_info
+        self.breaker = \
+            None if circuit_breaker is None else CircuitBreaker(self.address, circuit_breaker)
+        self.retrier = None if retry is None else Retrier(retry)
+
+        # Transport pools keep-alive connections, and thus TLS sessions, across calls.
+        self.transport = transport or get_transport(connection_info)
+
+        # Flag indicating whether transport is owned, and thus closed, by proxy.
+        self.owns_transport: bool = transport is None
 
     @property
     def address(self) -> str:
         """A node's REST server base address."""
-        return f"http://{self.connection_info.host}:{self.connection_info.port}"
+        return get_address(self.connection_info)
+
+    @property
+    def stats(self) -> TransportStats:
+        """Counters of bytes exchanged with node."""
+        return self.transport.stats
 
     def __str__(self):
         """Instance string representation."""
         return self.address
 
+    async def close(self):
+        """Closes pooled connections to remote server.
+
+        """
+        if self.owns_transport:
+            await self.transport.close()
+
     async def get_chainspec(self) -> dict:
         """Returns network chainspec.
 
         :returns: Network chainspec.
 
         """
-        response: str = await self._get_response(constants.REST_GET_CHAINSPEC)
+        response = await self._get_response(constants.REST_GET_CHAINSPEC)
 
-        return json.loads(response)["chainspec_bytes"]
+        return json_codec.loads(response)["chainspec_bytes"]
 
     async def get_node_metrics(self) -> list:
         """Returns set of node metrics.
@@ -45,7 +80,10 @@ class Proxy:
         """
         response = await self._get_response(constants.REST_GET_METRICS)
 
-        return sorted([i.strip() for i in response.split("\n") if not i.startswith("#")])
+        # Comment lines, i.e. metric descriptions, are skipped prior to being decoded.
+        return sorted([
+            i.strip().decode("utf-8") for i in response.split(b"\n") if not i.startswith(b"#")
+        ])
 
     async def get_rpc_schema(self) -> dict:
         """Returns node RPC API schema.
@@ -53,9 +91,9 @@ class Proxy:
         :returns: Node RPC API schema.
 
         """
-        response: str = await self._get_response(constants.REST_GET_RPC_SCHEMA)
+        response = await self._get_response(constants.REST_GET_RPC_SCHEMA)
 
-        return json.loads(response)
+        return json_codec.loads(response)
 
     async def get_node_status(self) -> dict:
         """Returns node status information.
@@ -63,7 +101,7 @@ class Proxy:
         :returns: Node status information.
 
         """
-        return json.loads(await self._get_response(constants.REST_GET_STATUS))
+        return json_codec.loads(await self._get_response(constants.REST_GET_STATUS))
 
     async def get_validator_changes(self) -> list:
         """Returns validator change information.
@@ -73,13 +111,19 @@ class Proxy:
         """
         response = await self._get_response(constants.REST_GET_VALIDATOR_CHANGES)
 
-        return json.loads(response)["changes"]
+        return json_codec.loads(response)["changes"]
 
-    async def _get_response(self, endpoint: str) -> dict:
-        """Invokes remote REST API and returns parsed response.
+    async def _get_response(self, endpoint: str) -> bytes:
+        """Invokes remote REST API and returns response body.
 
         :endpoint: Target endpoint to invoke.
-        :returns: Parsed REST API response.
+        :returns: REST API response body.
 
         """
-        return requests.get(f"{self.address}/{endpoint}").content.decode("utf-8")
+        def get():
+            return self.transport.get(f"{self.address}/{endpoint}")
+
+        def invoke():
+            return get() if self.breaker is None else self.breaker.invoke(get)
+
+        return await (invoke() if self.retrier is None else self.retrier.invoke(invoke))
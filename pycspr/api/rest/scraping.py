@@ -0,0 +1,92 @@
+import asyncio
+import dataclasses
+import time
+import typing
+
+from pycspr.api import constants
+from pycspr.api.rest.connection import ConnectionInfo
+from pycspr.api.rest.proxy import Proxy
+from pycspr.api.transport import Transport
+
+
+@dataclasses.dataclass
+class ScrapeResult:
+    """Encapsulates outcome of scraping a node's REST API.
+
+    """
+    # Information required to connect to node.
+    connection_info: ConnectionInfo
+
+    # Node status information - None if scrape failed.
+    status: typing.Optional[dict] = None
+
+    # Node metrics information - None if scrape failed.
+    metrics: typing.Optional[list] = None
+
+    # Validator change information - None if scrape failed.
+    validator_changes: typing.Optional[list] = None
+
+    # Error raised whilst scraping - None if scrape succeeded.
+    error: typing.Optional[Exception] = None
+
+    # Time (seconds) taken to scrape node.
+    latency: float = 0.0
+
+
+async def scrape_many(
+    connection_infos: typing.Sequence[ConnectionInfo],
+    max_concurrent: int = constants.DEFAULT_SCRAPE_CONCURRENCY,
+    timeout: float = constants.DEFAULT_SCRAPE_TIMEOUT,
+    transport: Transport = None,
+) -> typing.AsyncIterator[ScrapeResult]:
+    """Scrapes status, metrics & validator changes from each of a set of nodes.
+
+    Results are yielded as each node's scrape completes, a node failing to respond within
+    timeout yields a result whose error is set.
+
+    :param connection_infos: Information required to connect to each node.
+    :param max_concurrent: Maximum number of nodes scraped concurrently.
+    :param timeout: Period (seconds) within which each node must be scraped.
+    :param transport: A shared transport over which calls are dispatched, e.g. so that
+                      connections are kept alive across periodic scrapes (optional) - by
+                      default each node is scraped over a transport configured as per its
+                      connection information.
+    :returns: An async iterator over scrape results.
+
+    """
+    if not connection_infos:
+        return
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def scrape(connection_info: ConnectionInfo) -> ScrapeResult:
+        async with semaphore:
+            result = ScrapeResult(connection_info)
+            proxy = Proxy(connection_info, transport=transport)
+            started = time.monotonic()
+            try:
+                result.status, result.metrics, result.validator_changes = \
+                    await asyncio.wait_for(
+                        asyncio.gather(
+                            proxy.get_node_status(),
+                            proxy.get_node_metrics(),
+                            proxy.get_validator_changes()
+                        ),
+                        timeout
+                    )
+            except Exception as err:
+                result.error = err
+            finally:
+                result.latency = time.monotonic() - started
+                await proxy.close()
+
+            return result
+
+    tasks = [asyncio.ensure_future(scrape(i)) for i in connection_infos]
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
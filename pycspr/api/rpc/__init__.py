@@ -1,3 +1,26 @@
+from pycspr.api.rpc.affinity import affinity
+from pycspr.api.rpc.batch import AutoBatchPolicy
+from pycspr.api.rpc.batch import Batch
+from pycspr.api.rpc.caching import CachePolicy
+from pycspr.api.rpc.caching import GlobalStateCache
+from pycspr.api.rpc.caching import ResponseCache
+from pycspr.api.rpc.caching import StateCachePolicy
+from pycspr.api.rpc.cassettes import Cassette
+from pycspr.api.rpc.cassettes import CassetteError
+from pycspr.api.rpc.cassettes import ReplayTransport
 from pycspr.api.rpc.client import Client
 from pycspr.api.rpc.connection import ConnectionInfo
+from pycspr.api.rpc.discovery import Discovery
+from pycspr.api.rpc.discovery import DiscoveryPolicy
+from pycspr.api.rpc.freshness import FreshnessPolicy
+from pycspr.api.rpc.freshness import min_height
+from pycspr.api.rpc.hedging import HedgingPolicy
+from pycspr.api.rpc.limiter import LimiterPolicy
+from pycspr.api.rpc.offload import OffloadPolicy
+from pycspr.api.rpc.pool import NodePool
+from pycspr.api.rpc.pool import SelectionStrategy
 from pycspr.api.rpc.proxy import ProxyError
+from pycspr.api.rpc.scheduling import Priority
+from pycspr.api.rpc.scheduling import PriorityPolicy
+from pycspr.api.rpc.scheduling import priority
+from pycspr.api.rpc.streaming import ArrayStream
@@ -0,0 +1,113 @@
+import bisect
+import contextlib
+import contextvars
+import hashlib
+import typing
+
+from pycspr.api import constants
+from pycspr.utils import json_codec
+
+
+# Key of global state item queried by calls dispatched within current context.
+CURRENT_AFFINITY_KEY: contextvars.ContextVar[str] = \
+    contextvars.ContextVar("CURRENT_AFFINITY_KEY", default=None)
+
+
+@contextlib.contextmanager
+def affinity(key: str):
+    """Assigns a routing key to calls dispatched within scope.
+
+    Under consistent hash selection, calls sharing a key are served by the same node.
+
+    :param key: Routing key, e.g. an account hash.
+
+    """
+    token = CURRENT_AFFINITY_KEY.set(key)
+    try:
+        yield
+    finally:
+        CURRENT_AFFINITY_KEY.reset(token)
+
+
+class HashRing():
+    """A consistent hash ring mapping keys onto members.
+
+    Each member is placed at several points upon the ring and a key is owned by the
+    first member clockwise of the key's hash. When a member joins or leaves only the
+    keys it owns move, thus the mapping of all other keys is stable.
+
+    """
+    def __init__(self, replicas: int = constants.POOL_HASH_RING_REPLICAS):
+        """Instance constructor.
+
+        :param replicas: Number of points per member upon ring.
+
+        """
+        self.replicas = replicas
+        self._owners: typing.Dict[int, str] = dict()
+        self._points: typing.List[int] = []
+
+    def add(self, member: str):
+        """Places a member upon ring.
+
+        :param member: Identifier of a member, e.g. a node address.
+
+        """
+        for replica in range(self.replicas):
+            point = _get_hash(f"{member}#{replica}")
+            if point not in self._owners:
+                bisect.insort(self._points, point)
+            self._owners[point] = member
+
+    def remove(self, member: str):
+        """Removes a member from ring.
+
+        :param member: Identifier of a member, e.g. a node address.
+
+        """
+        for replica in range(self.replicas):
+            point = _get_hash(f"{member}#{replica}")
+            if self._owners.get(point) == member:
+                del self._owners[point]
+                del self._points[bisect.bisect_left(self._points, point)]
+
+    def walk(self, key: str) -> typing.Iterator[str]:
+        """Yields distinct members clockwise from a key - i.e. its owner then successors.
+
+        :param key: Key being routed.
+        :returns: Iterator over members in order of preference.
+
+        """
+        if not self._points:
+            return
+        start = bisect.bisect(self._points, _get_hash(key))
+        seen = set()
+        for idx in range(len(self._points)):
+            member = self._owners[self._points[(start + idx) % len(self._points)]]
+            if member not in seen:
+                seen.add(member)
+                yield member
+
+
+def get_affinity_key(params: typing.Optional[dict]) -> typing.Optional[str]:
+    """Returns key of global state item queried by a call.
+
+    :param params: Endpoint parameters.
+    :returns: Key, e.g. account hash, dictionary identifier or block hash - None if call
+              does not query a keyed item.
+
+    """
+    if not params:
+        return None
+    for name in ("key", "dictionary_identifier", "purse_identifier"):
+        if params.get(name) is not None:
+            return json_codec.dumps(params[name], sort_keys=True).decode("utf-8")
+    block_identifier = params.get("block_identifier")
+    if isinstance(block_identifier, dict) and block_identifier.get("Hash") is not None:
+        return block_identifier["Hash"]
+
+    return None
+
+
+def _get_hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
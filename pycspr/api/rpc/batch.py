@@ -0,0 +1,259 @@
+import asyncio
+import collections
+import contextlib
+import contextvars
+import dataclasses
+import typing
+
+from pycspr.api import constants
+from pycspr.api.rpc.affinity import affinity
+from pycspr.api.rpc.affinity import CURRENT_AFFINITY_KEY
+from pycspr.api.rpc.affinity import get_affinity_key
+from pycspr.api.rpc.freshness import CURRENT_MIN_HEIGHT
+from pycspr.api.rpc.freshness import get_required_height
+from pycspr.api.rpc.freshness import min_height
+from pycspr.api.rpc.pool import SelectionStrategy
+
+
+# Batch to which JSON-RPC calls issued within the current context are enqueued.
+CURRENT_BATCH: contextvars.ContextVar = contextvars.ContextVar("batch", default=None)
+
+
+class Batch():
+    """Collects node JSON-RPC client calls & dispatches them as JSON-RPC batch requests.
+
+    Client methods accessed via a batch are scheduled rather than awaited, i.e. each
+    returns an asyncio task whose result becomes available once the batch has been
+    dispatched.  Composite calls, e.g. a balance query without a state root hash,
+    are dispatched over successive batch requests.
+
+    """
+    def __init__(self, client: object, max_size: int = constants.DEFAULT_BATCH_SIZE):
+        """Instance constructor.
+
+        :param client: Node RPC client.
+        :param max_size: Maximum number of calls per JSON-RPC batch request.
+
+        """
+        self.client = client
+        self.max_size = max_size
+        self._calls: typing.List[typing.Tuple[str, dict, str, asyncio.Future, tuple]] = []
+        self._enqueued = asyncio.Event()
+        self._tasks: typing.List[asyncio.Task] = []
+
+    def __getattr__(self, name: str) -> typing.Callable[..., asyncio.Task]:
+        """Returns a function scheduling a client call within the scope of this batch.
+
+        """
+        func = getattr(self.client, name)
+        if not asyncio.iscoroutinefunction(func):
+            raise AttributeError(f"Client function cannot be batched: {name}")
+
+        def schedule(*args, **kwargs) -> asyncio.Task:
+            context = contextvars.copy_context()
+            context.run(CURRENT_BATCH.set, self)
+            task = asyncio.get_running_loop().create_task(func(*args, **kwargs), context=context)
+            self._tasks.append(task)
+
+            return task
+
+        return schedule
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            await self.dispatch()
+        else:
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def dispatch(self):
+        """Dispatches enqueued calls until all scheduled client calls have completed.
+
+        """
+        while True:
+            pending = [i for i in self._tasks if not i.done()]
+            if not pending:
+                break
+
+            # Barrier: awaits each scheduled call either enqueuing its next JSON-RPC call or
+            # completing. Calls blocked upon other awaitables, e.g. a limiter slot, are not
+            # waited upon beyond a bounded period once at least one call is enqueued.
+            if len(self._calls) < len(pending):
+                timeout = constants.BATCH_BARRIER_TIMEOUT if self._calls else None
+                if await self._await_progress(pending, timeout):
+                    continue
+
+            calls, self._calls = self._calls, []
+            await asyncio.gather(*[
+                _dispatch(self.client.proxy, calls[i:i + self.max_size])
+                for i in range(0, len(calls), self.max_size)
+            ])
+
+    def enqueue(self, endpoint: str, params: dict = None, field: str = None) -> asyncio.Future:
+        """Enqueues a JSON-RPC call for dispatch within next batch request.
+
+        :endpoint: Endpoint to invoke.
+        :params: Endpoint Parameters.
+        :field: Inner response field.
+        :returns: Future resolved once batch request has been dispatched.
+
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._calls.append((endpoint, params, field, future, get_route(params)))
+        self._enqueued.set()
+
+        return future
+
+    async def _await_progress(self, pending: typing.List[asyncio.Task], timeout: float) -> bool:
+        # Returns True if a call was enqueued, or a scheduled call completed, within timeout.
+        self._enqueued.clear()
+        enqueued = asyncio.ensure_future(self._enqueued.wait())
+        try:
+            done, _ = await asyncio.wait(
+                [enqueued, *pending], timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            enqueued.cancel()
+
+        return len(done) > 0
+
+
+@dataclasses.dataclass
+class AutoBatchPolicy:
+    """Encapsulates parameters controlling automatic batching of JSON-RPC calls.
+
+    """
+    # Time window (seconds) within which calls are collected into a batch.
+    window: float = constants.DEFAULT_AUTO_BATCH_WINDOW
+
+    # Maximum number of calls per batch - a full batch is dispatched immediately.
+    max_size: int = constants.DEFAULT_BATCH_SIZE
+
+
+class AutoBatcher():
+    """Transparently coalesces JSON-RPC calls issued by independent coroutines.
+
+    Calls submitted within a policy's time window are dispatched as a single JSON-RPC
+    batch request, responses are then fanned out to the awaiting callers.
+
+    """
+    def __init__(self, proxy: object, policy: AutoBatchPolicy):
+        """Instance constructor.
+
+        :param proxy: Node RPC proxy.
+        :param policy: Automatic batching policy.
+
+        """
+        self.policy = policy
+        self.proxy = proxy
+        self._calls: typing.List[typing.Tuple[str, dict, str, asyncio.Future, tuple]] = []
+        self._timer: asyncio.TimerHandle = None
+
+        # In-flight batch requests - referenced so that they are not garbage collected.
+        self._tasks: typing.Set[asyncio.Task] = set()
+
+    async def close(self):
+        """Cancels calls awaiting dispatch & in-flight batch requests.
+
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        calls, self._calls = self._calls, []
+        for call in calls:
+            call[3].cancel()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def submit(self, endpoint: str, params: dict = None, field: str = None) -> object:
+        """Submits a JSON-RPC call for dispatch within next batch request.
+
+        :endpoint: Endpoint to invoke.
+        :params: Endpoint Parameters.
+        :field: Inner response field.
+        :returns: Parsed JSON-RPC response.
+
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._calls.append((endpoint, params, field, future, get_route(params)))
+        if len(self._calls) >= self.policy.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.policy.window, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        calls, self._calls = self._calls, []
+        if calls:
+            task = asyncio.get_running_loop().create_task(_dispatch(self.proxy, calls))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+
+def get_route(
+    params: dict = None
+) -> typing.Tuple[typing.Optional[int], typing.Optional[str]]:
+    """Returns requirements upon a node serving a batched call - calls sharing
+    requirements are dispatched within the same batch request.
+
+    :params: Endpoint Parameters.
+    :returns: Minimum tip height of serving node & affinity key - each None if unconstrained.
+
+    """
+    height, current = get_required_height(params), CURRENT_MIN_HEIGHT.get()
+    if current is not None:
+        height = current if height is None else max(current, height)
+
+    return height, get_affinity_key(params) or CURRENT_AFFINITY_KEY.get()
+
+
+async def _dispatch(
+    proxy: object,
+    calls: typing.List[typing.Tuple[str, dict, str, asyncio.Future, tuple]]
+):
+    routes = collections.defaultdict(list)
+    for call in calls:
+        routes[_resolve_route(proxy, *call[4])].append(call)
+    await asyncio.gather(*[_dispatch_route(proxy, k, v) for k, v in routes.items()])
+
+
+async def _dispatch_route(
+    proxy: object,
+    route: tuple,
+    calls: typing.List[typing.Tuple[str, dict, str, asyncio.Future, tuple]]
+):
+    try:
+        results = await proxy._get_batch_response([i[0:3] for i in calls], *route)
+    except asyncio.CancelledError:
+        for call in calls:
+            call[3].cancel()
+        raise
+    except Exception as err:
+        results = [err] * len(calls)
+
+    for (_, _, _, future, _), result in zip(calls, results):
+        if future.done():
+            continue
+        elif isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+
+def _resolve_route(proxy: object, height: typing.Optional[int], key: typing.Optional[str]):
+    # Under consistent hash selection keyed calls are grouped by node owning their key,
+    # thus a batch querying many keys requires at most one request per node.
+    if key is None or proxy.pool.strategy != SelectionStrategy.CONSISTENT_HASH:
+        return height, None
+    with affinity(key), contextlib.nullcontext() if height is None else min_height(height):
+        return height, proxy.pool.select()
@@ -0,0 +1,440 @@
+import collections
+import contextlib
+import dataclasses
+import hashlib
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+import typing
+
+from pycspr.api import constants
+from pycspr.utils import json_codec
+
+
+@dataclasses.dataclass
+class CachePolicy:
+    """Encapsulates parameters controlling caching of responses to calls querying
+    immutable data, e.g. a block by hash or height.
+
+    """
+    # Maximum size (bytes) of responses held in memory.
+    max_bytes: int = constants.DEFAULT_CACHE_MAX_BYTES
+
+    # Directory of a second, on-disk, tier - None if responses are held in memory only.
+    path: typing.Optional[str] = None
+
+    # Maximum size (bytes) of responses held on disk.
+    max_disk_bytes: int = constants.DEFAULT_CACHE_MAX_DISK_BYTES
+
+
+@dataclasses.dataclass
+class StateCachePolicy:
+    """Encapsulates parameters controlling caching of global state query results.
+
+    """
+    # Path to database file within which results are persisted.
+    path: str
+
+    # Maximum size (bytes) of results held within database.
+    max_bytes: int = constants.DEFAULT_STATE_CACHE_MAX_BYTES
+
+
+@dataclasses.dataclass
+class CacheStats:
+    """Encapsulates response cache counters.
+
+    """
+    # Number of lookups served from cache.
+    hits: int = 0
+
+    # Number of lookups not served from cache.
+    misses: int = 0
+
+    # Number of responses evicted from either tier so as to honour its size limit.
+    evictions: int = 0
+
+    # Number of hits served by on-disk tier.
+    disk_hits: int = 0
+
+
+class ResponseCache():
+    """Least recently used cache of JSON encoded responses, with an optional on-disk tier.
+
+    Responses are written through to disk, thus the on-disk tier outlives the process,
+    whilst responses read from disk are promoted to memory. Tiers are guarded by a lock
+    so that a cache with an on-disk tier may be queried from worker threads.
+
+    """
+    def __init__(self, policy: CachePolicy = None):
+        """Instance constructor.
+
+        :param policy: Cache policy (optional).
+
+        """
+        self.policy = policy or CachePolicy()
+        self.stats = CacheStats()
+
+        self._lock = threading.Lock()
+        self._memory = _Tier(self.policy.max_bytes)
+        self._disk = None if self.policy.path is None else \
+            _DiskTier(pathlib.Path(self.policy.path), self.policy.max_disk_bytes)
+
+    def __len__(self) -> int:
+        """Number of responses held in memory."""
+        return len(self._memory.entries)
+
+    @property
+    def is_blocking(self) -> bool:
+        """Flag indicating whether cache operations may block upon disk I/O."""
+        return self._disk is not None
+
+    @property
+    def size(self) -> int:
+        """Size (bytes) of responses held in memory."""
+        return self._memory.size
+
+    def get(self, key: bytes) -> typing.Optional[bytes]:
+        """Returns a cached response.
+
+        :param key: Call key.
+        :returns: JSON encoded response - None if not cached.
+
+        """
+        with self._lock:
+            value = self._memory.get(key)
+            if value is None and self._disk is not None:
+                value = self._disk.get(key)
+                if value is not None:
+                    self.stats.disk_hits += 1
+                    self.stats.evictions += self._memory.put(key, value)
+            if value is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+
+        return value
+
+    def put(self, key: bytes, value: bytes):
+        """Caches a response.
+
+        :param key: Call key.
+        :param value: JSON encoded response.
+
+        """
+        with self._lock:
+            self.stats.evictions += self._memory.put(key, value)
+            if self._disk is not None:
+                self.stats.evictions += self._disk.put(key, value)
+
+    def clear(self):
+        """Evicts all cached responses from both tiers.
+
+        """
+        with self._lock:
+            self._memory.clear()
+            if self._disk is not None:
+                self._disk.clear()
+
+
+class GlobalStateCache():
+    """Cache of global state query results persisted within an embedded database.
+
+    Results are keyed by digest of a query, which includes the state root (or block)
+    queried, thus are valid indefinitely & survive process restarts. The least recently
+    used results are evicted once the database exceeds its size limit.
+
+    The database connection may be used from any thread, e.g. a sync client's event loop
+    thread or the worker threads off which a proxy queries the cache, thus access to it
+    is serialised.
+
+    """
+    # Flag indicating whether cache operations may block upon disk I/O.
+    is_blocking: bool = True
+
+    def __init__(self, policy: StateCachePolicy):
+        """Instance constructor.
+
+        :param policy: Cache policy.
+
+        """
+        self.policy = policy
+        self.stats = CacheStats()
+
+        pathlib.Path(policy.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = \
+            sqlite3.connect(policy.path, isolation_level=None, check_same_thread=False)
+        self._connection.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS results (
+                key BLOB PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                accessed REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+        """)
+        self._size: int = \
+            self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def __len__(self) -> int:
+        """Number of results held within database."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """Size (bytes) of results held within database."""
+        return self._size
+
+    def close(self):
+        """Closes database connection.
+
+        """
+        with self._lock:
+            self._connection.close()
+
+    def get(self, key: bytes) -> typing.Optional[bytes]:
+        """Returns a cached query result.
+
+        :param key: Call key.
+        :returns: JSON encoded result - None if not cached.
+
+        """
+        digest = _get_digest(key)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM results WHERE key = ?", (digest, )
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+
+            self._connection.execute(
+                "UPDATE results SET accessed = ? WHERE key = ?", (time.time(), digest)
+            )
+            self.stats.hits += 1
+            self.stats.disk_hits += 1
+
+        return row[0]
+
+    def put(self, key: bytes, value: bytes):
+        """Caches a query result.
+
+        :param key: Call key.
+        :param value: JSON encoded result.
+
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT OR IGNORE INTO results VALUES (?, ?, ?, ?)",
+                (_get_digest(key), value, len(value), time.time())
+            )
+            self._size += len(value) * cursor.rowcount
+            while self._size > self.policy.max_bytes:
+                row = self._connection.execute(
+                    "SELECT key, size FROM results ORDER BY accessed LIMIT 1"
+                ).fetchone()
+                if row is None:
+                    self._size = 0
+                    break
+                self._connection.execute("DELETE FROM results WHERE key = ?", (row[0], ))
+                self._size -= row[1]
+                self.stats.evictions += 1
+
+    def clear(self):
+        """Evicts all cached query results.
+
+        """
+        with self._lock:
+            self._connection.execute("DELETE FROM results")
+            self._size = 0
+
+
+class _Tier():
+    """An in-memory cache tier bounded by size of its entries.
+
+    """
+    def __init__(self, max_bytes: int):
+        self.entries: collections.OrderedDict = collections.OrderedDict()
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._values: typing.Dict[bytes, bytes] = dict()
+
+    def clear(self):
+        while self.entries:
+            self._evict()
+
+    def get(self, key: bytes) -> typing.Optional[bytes]:
+        try:
+            self.entries.move_to_end(key)
+        except KeyError:
+            return None
+
+        return self._read(key)
+
+    def put(self, key: bytes, value: bytes) -> int:
+        if len(value) > self.max_bytes:
+            return 0
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return 0
+
+        self._write(key, value)
+        self.entries[key] = len(value)
+        self.size += len(value)
+        evictions = 0
+        while self.size > self.max_bytes:
+            self._evict()
+            evictions += 1
+
+        return evictions
+
+    def _evict(self):
+        key, size = self.entries.popitem(last=False)
+        self.size -= size
+        self._delete(key)
+
+    def _delete(self, key: bytes):
+        self._values.pop(key)
+
+    def _read(self, key: bytes) -> bytes:
+        return self._values[key]
+
+    def _write(self, key: bytes, value: bytes):
+        self._values[key] = value
+
+
+class _DiskTier(_Tier):
+    """An on-disk cache tier - one file per entry, named by digest of its key.
+
+    The directory may be shared by several processes, each of which indexes it upon
+    startup, thus a file is read irrespective of whether it is indexed & an entry whose
+    file cannot be read is a miss.
+
+    """
+    def __init__(self, path: pathlib.Path, max_bytes: int):
+        super().__init__(max_bytes)
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        # Temporary files abandoned by a process that exited mid write are removed.
+        for fpath in self.path.glob("*.tmp"):
+            with contextlib.suppress(OSError):
+                if time.time() - fpath.stat().st_mtime > constants.CACHE_STALE_FILE_AGE:
+                    fpath.unlink()
+
+        # Entries written by prior processes are indexed in order of last modification.
+        files = sorted(self.path.glob("*.json"), key=lambda i: i.stat().st_mtime)
+        for fpath in files:
+            self.entries[fpath.stem] = fpath.stat().st_size
+            self.size += fpath.stat().st_size
+
+    def get(self, key: bytes) -> typing.Optional[bytes]:
+        key = _get_digest(key).hex()
+        try:
+            value = self._read(key)
+        except OSError:
+            if key in self.entries:
+                self.size -= self.entries.pop(key)
+            return None
+
+        if key in self.entries:
+            self.entries.move_to_end(key)
+        else:
+            self.entries[key] = len(value)
+            self.size += len(value)
+            while self.size > self.max_bytes:
+                self._evict()
+
+        return value
+
+    def put(self, key: bytes, value: bytes) -> int:
+        key = _get_digest(key).hex()
+        if key in self.entries and not (self.path / f"{key}.json").exists():
+            self.size -= self.entries.pop(key)
+
+        return super().put(key, value)
+
+    def _delete(self, key: str):
+        (self.path / f"{key}.json").unlink(missing_ok=True)
+
+    def _read(self, key: str) -> bytes:
+        return (self.path / f"{key}.json").read_bytes()
+
+    def _write(self, key: str, value: bytes):
+        # Written atomically so that a concurrent reader never observes a partial entry.
+        fpath = self.path / f"{key}.json"
+        fpath_tmp = self.path / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        fpath_tmp.write_bytes(value)
+        fpath_tmp.replace(fpath)
+
+
+def get_cache_key(
+    endpoint: str,
+    params: dict = None,
+    field: str = None
+) -> typing.Optional[bytes]:
+    """Returns key identifying a call querying immutable data, i.e. whose response may
+    be cached indefinitely.
+
+    :param endpoint: Endpoint to invoke.
+    :param params: Endpoint Parameters.
+    :param field: Inner response field.
+    :returns: Call key - None if call queries mutable data, e.g. latest block.
+
+    """
+    if endpoint not in constants.RPC_IMMUTABLE_ENDPOINTS or not params:
+        return None
+    if endpoint != constants.RPC_INFO_GET_DEPLOY and not params.get("block_identifier"):
+        return None
+
+    return json_codec.dumps([endpoint, params, field], sort_keys=True)
+
+
+def get_state_cache_key(
+    endpoint: str,
+    params: dict = None,
+    field: str = None
+) -> typing.Optional[bytes]:
+    """Returns key identifying a global state query scoped by state root or block, i.e.
+    whose result may be cached indefinitely.
+
+    :param endpoint: Endpoint to invoke.
+    :param params: Endpoint Parameters.
+    :param field: Inner response field.
+    :returns: Call key - None if call does not query global state at a specific root.
+
+    """
+    if endpoint not in constants.RPC_STATE_ENDPOINTS or not params:
+        return None
+
+    state_id = params.get("state_identifier") or params
+    for name in ("state_root_hash", "StateRootHash", "BlockHash", "BlockHeight"):
+        if state_id.get(name) is not None:
+            return json_codec.dumps([endpoint, params, field], sort_keys=True)
+
+    return None
+
+
+def is_cacheable(endpoint: str, result: object) -> bool:
+    """Returns flag indicating whether a result to a call querying immutable data may be
+    cached, i.e. is final.
+
+    :param endpoint: Endpoint invoked.
+    :param result: Call result.
+    :returns: True if result may be cached.
+
+    """
+    # A deploy's execution results are absent until it has been processed.
+    if endpoint == constants.RPC_INFO_GET_DEPLOY:
+        return isinstance(result, dict) and bool(result.get("execution_results"))
+
+    return result is not None
+
+
+def _get_digest(key: bytes) -> bytes:
+    return hashlib.sha256(key).digest()
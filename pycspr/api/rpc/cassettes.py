@@ -0,0 +1,295 @@
+import asyncio
+import collections
+import dataclasses
+import gzip
+import time
+import typing
+
+from pycspr.api.transport import Transport
+from pycspr.api.transport import TransportStats
+from pycspr.utils import json_codec
+
+
+@dataclasses.dataclass
+class Interaction:
+    """Encapsulates a recorded JSON-RPC request/response pair.
+
+    """
+    # Endpoint invoked.
+    endpoint: str
+
+    # Endpoint parameters.
+    params: typing.Optional[typing.Union[dict, list]]
+
+    # Raw JSON-RPC response, i.e. prior to parsing, stripped of its request id.
+    response: dict
+
+    # Time (seconds) taken by node to respond.
+    latency: float
+
+
+class CassetteError(Exception):
+    """Raised when a cassette holds no recording of a request being replayed.
+
+    """
+    pass
+
+
+class Cassette():
+    """A recording of JSON-RPC traffic exchanged with a node.
+
+    Recordings of identical requests are replayed in the order in which they were
+    recorded - the final recording being replayed thereafter.
+
+    """
+    def __init__(self, interactions: typing.List[Interaction] = None):
+        """Instance constructor.
+
+        :param interactions: Recorded request/response pairs (optional).
+
+        """
+        self.interactions: typing.List[Interaction] = interactions or []
+        self._index: typing.Dict[str, typing.List[Interaction]] = None
+        self._cursors: typing.Dict[str, int] = collections.defaultdict(int)
+
+    def __len__(self) -> int:
+        """Number of recorded interactions."""
+        return len(self.interactions)
+
+    @staticmethod
+    def load(path: str) -> "Cassette":
+        """Returns a cassette loaded from a file.
+
+        :param path: Path to a cassette file.
+        :returns: A cassette.
+
+        """
+        with gzip.open(path, "rb") as fstream:
+            return Cassette([Interaction(*json_codec.loads(i)) for i in fstream if i.strip()])
+
+    def save(self, path: str):
+        """Writes cassette to a file - one gzipped JSON array per interaction.
+
+        :param path: Path to a cassette file.
+
+        """
+        with gzip.open(path, "wb") as fstream:
+            for i in self.interactions:
+                fstream.write(json_codec.dumps(dataclasses.astuple(i)))
+                fstream.write(b"\n")
+
+    def record(self, request: dict, response: dict, latency: float):
+        """Records a JSON-RPC request/response pair.
+
+        :param request: JSON-RPC request.
+        :param response: Raw JSON-RPC response.
+        :param latency: Time (seconds) taken by node to respond.
+
+        """
+        response = {k: v for k, v in response.items() if k != "id"}
+        self.interactions.append(
+            Interaction(request["method"], request.get("params"), response, latency)
+        )
+        self._index = None
+
+    def replay(self, request: dict) -> Interaction:
+        """Returns recording of a JSON-RPC request.
+
+        :param request: JSON-RPC request.
+        :returns: Recorded interaction.
+
+        """
+        if self._index is None:
+            self._index = dict()
+            for i in self.interactions:
+                self._index.setdefault(_get_key(i.endpoint, i.params), []).append(i)
+
+        key = _get_key(request["method"], request.get("params"))
+        try:
+            recordings = self._index[key]
+        except KeyError:
+            raise CassetteError(f"Cassette holds no recording of: {request['method']}")
+        cursor = self._cursors[key]
+        self._cursors[key] = min(cursor + 1, len(recordings) - 1)
+
+        return recordings[cursor]
+
+
+class RecordingTransport():
+    """Wraps a transport so as to record calls dispatched over it to a cassette.
+
+    """
+    def __init__(self, transport: Transport, cassette: Cassette):
+        """Instance constructor.
+
+        :param transport: Transport over which calls are dispatched.
+        :param cassette: Cassette to which calls are recorded.
+
+        """
+        self.cassette = cassette
+        self.transport = transport
+
+    @property
+    def stats(self) -> TransportStats:
+        """Counters of bytes exchanged by wrapped transport."""
+        return self.transport.stats
+
+    async def open(self):
+        """Opens wrapped transport.
+
+        """
+        await self.transport.open()
+
+    async def close(self):
+        """Closes wrapped transport.
+
+        """
+        await self.transport.close()
+
+    async def post(self, url: str, payload: typing.Union[dict, list]) -> bytes:
+        """Posts a JSON payload & records response body.
+
+        :param url: Target endpoint URL.
+        :param payload: JSON payload to be dispatched.
+        :returns: Response body.
+
+        """
+        started = time.perf_counter()
+        body = await self.transport.post(url, payload)
+        self._record(payload, json_codec.loads(body), time.perf_counter() - started)
+
+        return body
+
+    async def post_stream(
+        self,
+        url: str,
+        payload: typing.Union[dict, list]
+    ) -> typing.AsyncIterator[bytes]:
+        """Posts a JSON payload & yields chunks of response body - recording body once
+        fully received.
+
+        :param url: Target endpoint URL.
+        :param payload: JSON payload to be dispatched.
+        :returns: An async iterator over chunks of response body.
+
+        """
+        started = time.perf_counter()
+        chunks = []
+        async for chunk in self.transport.post_stream(url, payload):
+            chunks.append(chunk)
+            yield chunk
+        self._record(payload, json_codec.loads(b"".join(chunks)), time.perf_counter() - started)
+
+    async def post_json(
+        self,
+        url: str,
+        payload: typing.Union[dict, list]
+    ) -> typing.Union[dict, list]:
+        """Posts a JSON payload & records parsed JSON response.
+
+        :param url: Target endpoint URL.
+        :param payload: JSON payload to be dispatched.
+        :returns: Parsed JSON response.
+
+        """
+        started = time.perf_counter()
+        response = await self.transport.post_json(url, payload)
+        self._record(payload, response, time.perf_counter() - started)
+
+        return response
+
+    def _record(
+        self,
+        payload: typing.Union[dict, list],
+        response: typing.Union[dict, list],
+        latency: float
+    ):
+        if isinstance(payload, list) and isinstance(response, list):
+            responses = {i.get("id"): i for i in response}
+            for request in payload:
+                if request["id"] in responses:
+                    self.cassette.record(request, responses[request["id"]], latency)
+        elif isinstance(payload, dict):
+            self.cassette.record(payload, response, latency)
+
+
+class ReplayTransport():
+    """A transport serving calls from a cassette rather than from a node.
+
+    """
+    def __init__(self, cassette: Cassette, speed: float = None):
+        """Instance constructor.
+
+        :param cassette: Cassette from which calls are served.
+        :param speed: Factor by which recorded latencies are divided, e.g. 1.0 replays
+                      original timings - None replays without delay.
+
+        """
+        self.cassette = cassette
+        self.speed = speed
+        self.stats = TransportStats()
+
+    async def open(self):
+        """Opens transport - a no-op.
+
+        """
+        pass
+
+    async def close(self):
+        """Closes transport - a no-op.
+
+        """
+        pass
+
+    async def post(self, url: str, payload: typing.Union[dict, list]) -> bytes:
+        """Returns recorded response body to a JSON payload.
+
+        :param url: Target endpoint URL.
+        :param payload: JSON payload to be dispatched.
+        :returns: Response body.
+
+        """
+        return json_codec.dumps(await self.post_json(url, payload))
+
+    async def post_stream(
+        self,
+        url: str,
+        payload: typing.Union[dict, list]
+    ) -> typing.AsyncIterator[bytes]:
+        """Yields recorded response body to a JSON payload.
+
+        :param url: Target endpoint URL.
+        :param payload: JSON payload to be dispatched.
+        :returns: An async iterator over chunks of response body.
+
+        """
+        yield await self.post(url, payload)
+
+    async def post_json(
+        self,
+        url: str,
+        payload: typing.Union[dict, list]
+    ) -> typing.Union[dict, list]:
+        """Returns recorded response to a JSON payload.
+
+        :param url: Target endpoint URL.
+        :param payload: JSON payload to be dispatched.
+        :returns: Parsed JSON response.
+
+        """
+        requests = payload if isinstance(payload, list) else [payload]
+        interactions = [self.cassette.replay(i) for i in requests]
+        self.stats.requests += 1
+
+        if self.speed:
+            await asyncio.sleep(max(i.latency for i in interactions) / self.speed)
+
+        responses = [
+            i.response | {"id": request["id"]} for request, i in zip(requests, interactions)
+        ]
+
+        return responses if isinstance(payload, list) else responses[0]
+
+
+def _get_key(endpoint: str, params: typing.Union[dict, list] = None) -> bytes:
+    return json_codec.dumps([endpoint, params], sort_keys=True)
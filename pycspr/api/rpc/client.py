@@ -2,12 +2,32 @@ import time
 import typing
 
 from pycspr import serializer
+from pycspr.api import constants
+from pycspr.api.deadlines import apply_timeout
+from pycspr.api.resilience import CircuitBreakerPolicy
+from pycspr.api.resilience import RetryPolicy
+from pycspr.api.rpc.batch import AutoBatchPolicy
+from pycspr.api.rpc.batch import Batch
+from pycspr.api.rpc.caching import GlobalStateCache
+from pycspr.api.rpc.caching import ResponseCache
+from pycspr.api.rpc.cassettes import Cassette
 from pycspr.api.rpc.connection import ConnectionInfo
+from pycspr.api.rpc.freshness import FreshnessPolicy
+from pycspr.api.rpc.hedging import HedgingPolicy
+from pycspr.api.rpc.limiter import LimiterPolicy
+from pycspr.api.rpc.offload import decoding
+from pycspr.api.rpc.offload import from_json
+from pycspr.api.rpc.offload import OffloadPolicy
+from pycspr.api.rpc.pool import SelectionStrategy
 from pycspr.api.rpc.proxy import Proxy
+from pycspr.api.rpc.scheduling import PriorityPolicy
+from pycspr.api.transport import Transport
+from pycspr.api.transport import TransportStats
 from pycspr.types.cl import CLV_Key
 from pycspr.types.crypto import DigestBytes
 from pycspr.types.node import Address
 from pycspr.types.node import AccountInfo
+from pycspr.types.node import AuctionBidByValidator
 from pycspr.types.node import AuctionState
 from pycspr.types.node import Block
 from pycspr.types.node import BlockID
@@ -29,13 +49,76 @@ class Client():
     """Node RPC server client.
 
     """
-    def __init__(self, connection_info: ConnectionInfo):
+    def __init__(
+        self,
+        connection_info: typing.Union[ConnectionInfo, typing.Sequence[ConnectionInfo]],
+        auto_batch: AutoBatchPolicy = None,
+        strategy: SelectionStrategy = SelectionStrategy.ROUND_ROBIN,
+        hedging: HedgingPolicy = None,
+        single_flight: bool = False,
+        limiter: LimiterPolicy = None,
+        retry: RetryPolicy = None,
+        circuit_breaker: CircuitBreakerPolicy = None,
+        timeout: float = None,
+        priorities: PriorityPolicy = None,
+        freshness: FreshnessPolicy = None,
+        transport: Transport = None,
+        cassette: Cassette = None,
+        offload: OffloadPolicy = None,
+        cache: ResponseCache = None,
+        state_cache: GlobalStateCache = None,
+    ):
         """Instance constructor.
 
-        :param connection_info: Information required to connect to a node.
+        :param connection_info: Information required to connect to a node, or to each
+                                node within a pool of nodes.
+        :param auto_batch: Policy to apply when automatically batching calls (optional).
+        :param strategy: Strategy by which a pool node is selected to serve a call.
+        :param hedging: Policy to apply when hedging idempotent calls (optional).
+        :param single_flight: Flag indicating whether identical in-flight JSON-RPC calls
+                              share a single request to a node.
+        :param limiter: Policy to apply when limiting in-flight calls per node (optional).
+        :param retry: Policy to apply when retrying failed idempotent calls (optional).
+        :param circuit_breaker: Policy to apply when failing calls fast per node (optional).
+        :param timeout: Time budget (seconds) within which each call, including composite
+                        calls, must complete (optional).
+        :param priorities: Policy to apply when scheduling calls by priority class, whereby
+                           calls of higher priority are dispatched first (optional).
+        :param freshness: Policy to apply when tracking nodes' tip heights, whereby calls
+                          scoped by block height are routed to nodes that have added the
+                          block (optional).
+        :param transport: A shared transport over which calls are dispatched, e.g. as
+                          owned by a node session (optional).
+        :param cassette: Cassette to which each request/response pair is recorded, e.g.
+                         so as to be replayed offline by a replay transport (optional).
+        :param offload: Policy to apply when offloading parsing & decoding of large
+                        responses, e.g. blocks & auction state, to worker processes so
+                        that the event loop remains responsive (optional).
+        :param cache: Cache of responses to calls querying immutable data, i.e. blocks,
+                      block transfers & era summaries by block hash or height, and
+                      processed deploys - may be shared between clients (optional).
+        :param state_cache: Cache of results of global state queries, i.e. balances,
+                            dictionary items & stored values, scoped by state root or
+                            block - persisted across process restarts (optional).
 
         """
-        self.proxy = Proxy(connection_info)
+        self.proxy = Proxy(
+            connection_info,
+            auto_batch,
+            strategy,
+            hedging,
+            single_flight,
+            limiter,
+            retry,
+            circuit_breaker,
+            priorities,
+            freshness,
+            transport,
+            cassette,
+            offload,
+            cache,
+            state_cache
+        )
 
         # Alias methods.
         self.get_auction_state = self.get_auction_info
@@ -54,6 +137,15 @@ class Client():
         self.get_rpc_endpoint = ext.get_rpc_endpoint
         self.get_rpc_endpoints = ext.get_rpc_endpoints
 
+        # Deadline bound methods -> composite calls share a single time budget.
+        if timeout is not None:
+            apply_timeout(self, timeout)
+
+    @property
+    def stats(self) -> TransportStats:
+        """Counters of bytes exchanged with node(s) - aggregated across a pool."""
+        return self.proxy.stats
+
     async def account_put_deploy(self, deploy: Deploy) -> DeployHash:
         """Dispatches a deploy to a node for processing.
 
@@ -63,6 +155,21 @@ class Client():
         """
         return await self.proxy.account_put_deploy(deploy)
 
+    def batch(self, max_size: int = constants.DEFAULT_BATCH_SIZE) -> Batch:
+        """Returns a batch within which calls are dispatched as JSON-RPC batch requests.
+
+        :param max_size: Maximum number of calls per JSON-RPC batch request.
+        :returns: A batch, typically used as an async context manager.
+
+        """
+        return Batch(self, max_size)
+
+    async def close(self):
+        """Closes pooled connections to remote server.
+
+        """
+        await self.proxy.close()
+
     async def get_account_balance(
         self,
         purse_id: PurseID,
@@ -90,9 +197,10 @@ class Client():
         :returns: Account information in JSON format.
 
         """
-        encoded: dict = await self.proxy.state_get_account_info(account_id, block_id)
+        with decoding(AccountInfo, decode):
+            encoded: dict = await self.proxy.state_get_account_info(account_id, block_id)
 
-        return encoded if decode is False else serializer.from_json(AccountInfo, encoded)
+        return encoded if decode is False else from_json(AccountInfo, encoded)
 
     async def get_auction_info(
         self,
@@ -105,9 +213,10 @@ class Client():
         :returns: Current auction system contract information.
 
         """
-        encoded: dict = await self.proxy.state_get_auction_info(block_id)
+        with decoding(AuctionState, decode):
+            encoded: dict = await self.proxy.state_get_auction_info(block_id)
 
-        return encoded if decode is False else serializer.from_json(AuctionState, encoded)
+        return encoded if decode is False else from_json(AuctionState, encoded)
 
     async def get_block(
         self,
@@ -121,9 +230,10 @@ class Client():
         :returns: On-chain block information.
 
         """
-        encoded: dict = await self.proxy.chain_get_block(block_id)
+        with decoding(Block, decode):
+            encoded: dict = await self.proxy.chain_get_block(block_id)
 
-        return encoded if decode is False else serializer.from_json(Block, encoded)
+        return encoded if decode is False else from_json(Block, encoded)
 
     async def get_block_range(self) -> typing.Union[dict, typing.Tuple[int, int]]:
         """Returns available block range.
@@ -145,9 +255,10 @@ class Client():
         :returns: On-chain block transfers information.
 
         """
-        encoded: dict = await self.proxy.chain_get_block_transfers(block_id)
+        with decoding(BlockTransfers, decode):
+            encoded: dict = await self.proxy.chain_get_block_transfers(block_id)
 
-        return encoded if decode is False else serializer.from_json(BlockTransfers, encoded)
+        return encoded if decode is False else from_json(BlockTransfers, encoded)
 
     async def get_chainspec(self) -> dict:
         """Returns canonical network state information.
@@ -203,9 +314,10 @@ class Client():
         :returns: Era summary information.
 
         """
-        encoded: dict = await self.proxy.chain_get_era_summary(block_id)
+        with decoding(EraSummary, decode):
+            encoded: dict = await self.proxy.chain_get_era_summary(block_id)
 
-        return encoded if decode is False else serializer.from_json(EraSummary, encoded)
+        return encoded if decode is False else from_json(EraSummary, encoded)
 
     async def get_era_info_by_switch_block(
         self,
@@ -219,9 +331,10 @@ class Client():
         :returns: Era information.
 
         """
-        encoded: dict = await self.proxy.chain_get_era_info_by_switch_block(block_id)
+        with decoding(EraSummary, decode):
+            encoded: dict = await self.proxy.chain_get_era_info_by_switch_block(block_id)
 
-        return encoded if decode is False else serializer.from_json(EraSummary, encoded)
+        return encoded if decode is False else from_json(EraSummary, encoded)
 
     async def get_node_peers(
         self,
@@ -246,9 +359,10 @@ class Client():
         :returns: Node status information.
 
         """
-        encoded: dict = await self.proxy.info_get_status()
+        with decoding(NodeStatus, decode):
+            encoded: dict = await self.proxy.info_get_status()
 
-        return encoded if decode is False else serializer.from_json(NodeStatus, encoded)
+        return encoded if decode is False else from_json(NodeStatus, encoded)
 
     async def get_rpc_schema(self) -> dict:
         """Returns RPC schema.
@@ -326,6 +440,36 @@ class Client():
             obj if decode is False else \
             [serializer.from_json(ValidatorChanges, i) for i in obj]
 
+    async def iter_auction_bids(
+        self,
+        block_id: BlockID = None,
+        decode: bool = True
+    ) -> typing.AsyncIterator[typing.Union[dict, AuctionBidByValidator]]:
+        """Yields bids held by auction system contract as each arrives, i.e. without
+        buffering the entire auction state.
+
+        :param block_id: Identifier of a finalised block.
+        :param decode: Flag indicating whether to decode API response.
+        :returns: An async iterator over auction bids.
+
+        """
+        async for bid in self.proxy.state_iter_auction_bids(block_id):
+            yield bid if decode is False else serializer.from_json(AuctionBidByValidator, bid)
+
+    async def iter_deploy_transforms(
+        self,
+        deploy_hash: DeployHash
+    ) -> typing.AsyncIterator[dict]:
+        """Yields transforms effected by a processed deploy as each arrives, i.e. without
+        buffering the entire deploy.
+
+        :param deploy_hash: Hash of a deploy processed by network.
+        :returns: An async iterator over deploy execution transforms.
+
+        """
+        async for transform in self.proxy.info_iter_deploy_transforms(deploy_hash):
+            yield transform
+
 
 class ClientExtensions():
     """Node RPC server client extensions, i.e. 2nd order functions.
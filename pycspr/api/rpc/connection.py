@@ -1,4 +1,5 @@
 import dataclasses
+import typing
 
 from pycspr.api import constants
 
@@ -13,3 +14,27 @@ class ConnectionInfo:
 
     # Number of exposed RPC port.
     port: int = constants.DEFAULT_PORT_RPC
+
+    # Maximum number of pooled keep-alive connections.
+    pool_size: int = constants.DEFAULT_POOL_SIZE
+
+    # Flag indicating whether compressed (gzip | deflate) responses are accepted.
+    accept_compression: bool = True
+
+    # Flag indicating whether large request bodies, e.g. wasm deploys, are gzip compressed.
+    compress_requests: bool = False
+
+    # URL scheme, i.e. http | https.
+    scheme: str = "http"
+
+    # Path prefix beneath which API is exposed, e.g. by a hosted gateway.
+    base_path: str = ""
+
+    # Headers dispatched with each request, e.g. API keys.
+    headers: typing.Dict[str, str] = dataclasses.field(default_factory=dict)
+
+    # TLS certificate verification: True | False | path to a CA bundle.
+    verify: typing.Union[bool, str] = True
+
+    # Period (seconds) for which idle pooled connections, and thus TLS sessions, are kept alive.
+    keepalive_timeout: float = constants.DEFAULT_KEEPALIVE_TIMEOUT
@@ -0,0 +1,195 @@
+import asyncio
+import dataclasses
+import statistics
+import time
+import typing
+
+from pycspr.api import constants
+from pycspr.api.connection import get_address
+from pycspr.api.rpc.connection import ConnectionInfo
+from pycspr.api.rpc.pool import NodePool
+from pycspr.api.rpc.proxy import get_response
+from pycspr.api.transport import get_transport
+
+
+@dataclasses.dataclass
+class DiscoveryPolicy:
+    """Encapsulates parameters controlling discovery & ranking of nodes.
+
+    """
+    # Number of peer hops beyond seed node over which nodes are discovered.
+    max_depth: int = 1
+
+    # Maximum number of nodes retained within live set.
+    max_nodes: int = 16
+
+    # Maximum number of candidate nodes probed concurrently.
+    max_concurrent_probes: int = 32
+
+    # Number of calls per probe - median latency is retained.
+    probe_calls: int = 3
+
+    # Period (seconds) within which a probe must complete.
+    probe_timeout: float = 2.0
+
+    # Period (seconds) between re-ranking of nodes.
+    rerank_interval: float = 60.0
+
+    # Maps a peer's network address to its RPC connection information (optional).
+    # Defaults to the peer's host together with the seed's RPC port & settings.
+    resolve: typing.Callable[[str, ConnectionInfo], ConnectionInfo] = None
+
+
+@dataclasses.dataclass
+class ProbedNode:
+    """Encapsulates outcome of probing a candidate node.
+
+    """
+    # Information required to connect to node.
+    connection_info: ConnectionInfo
+
+    # Median latency (seconds) of probe calls - None if node is unreachable.
+    latency: typing.Optional[float]
+
+
+class Discovery():
+    """Discovers nodes by expanding a seed node's peers & ranks them by probed latency.
+
+    """
+    def __init__(self, seed: ConnectionInfo, policy: DiscoveryPolicy = None):
+        """Instance constructor.
+
+        :param seed: Information required to connect to seed node.
+        :param policy: Discovery policy.
+
+        """
+        self.policy = policy or DiscoveryPolicy()
+        self.seed = seed
+        self.probed: typing.List[ProbedNode] = []
+        self._task: asyncio.Task = None
+
+    @property
+    def live(self) -> typing.List[ConnectionInfo]:
+        """Reachable nodes ranked by latency - fastest first."""
+        return [i.connection_info for i in self.probed if i.latency is not None]
+
+    async def discover(self) -> typing.List[ConnectionInfo]:
+        """Discovers, probes & ranks nodes.
+
+        :returns: Reachable nodes ranked by latency - fastest first.
+
+        """
+        candidates = await self._expand()
+        semaphore = asyncio.Semaphore(self.policy.max_concurrent_probes)
+
+        async def probe(connection_info: ConnectionInfo) -> ProbedNode:
+            async with semaphore:
+                return ProbedNode(connection_info, await self._probe(connection_info))
+
+        probed = await asyncio.gather(*[probe(i) for i in candidates])
+        reachable = sorted([i for i in probed if i.latency is not None], key=lambda i: i.latency)
+        unreachable = [i for i in probed if i.latency is None]
+        self.probed = reachable[:self.policy.max_nodes] + unreachable
+
+        return self.live
+
+    async def rerank(self, pool: NodePool = None):
+        """Re-discovers & re-ranks nodes - retaining current ranking upon failure.
+
+        :param pool: A node pool to be updated with live set (optional).
+
+        """
+        try:
+            live = await self.discover()
+        except Exception:
+            return
+        if live and pool is not None:
+            pool.update(live)
+
+    def start(self, pool: NodePool = None):
+        """Starts periodic re-ranking of nodes.
+
+        :param pool: A node pool to be updated with live set upon each re-ranking (optional).
+
+        """
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._rerank(pool))
+
+    async def stop(self):
+        """Stops periodic re-ranking of nodes.
+
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _expand(self) -> typing.List[ConnectionInfo]:
+        # Breadth first expansion of peer graph from seed.
+        candidates = {get_address(self.seed, "/rpc"): self.seed}
+        frontier = [self.seed]
+        for _ in range(self.policy.max_depth):
+            peers = await asyncio.gather(
+                *[self._get_peers(i) for i in frontier],
+                return_exceptions=True
+            )
+            frontier = []
+            for connection_info in [j for i in peers if isinstance(i, list) for j in i]:
+                address = get_address(connection_info, "/rpc")
+                if address not in candidates:
+                    candidates[address] = connection_info
+                    frontier.append(connection_info)
+
+        return list(candidates.values())
+
+    async def _get_peers(self, connection_info: ConnectionInfo) -> typing.List[ConnectionInfo]:
+        transport = get_transport(connection_info)
+        try:
+            peers = await asyncio.wait_for(
+                get_response(
+                    transport,
+                    get_address(connection_info, "/rpc"),
+                    constants.RPC_INFO_GET_PEERS,
+                    field="peers"
+                    ),
+                self.policy.probe_timeout
+            )
+        finally:
+            await transport.close()
+
+        return [self._resolve(i["address"]) for i in peers]
+
+    async def _probe(self, connection_info: ConnectionInfo) -> typing.Optional[float]:
+        transport = get_transport(connection_info)
+        address = get_address(connection_info, "/rpc")
+        latencies = []
+        try:
+            for _ in range(self.policy.probe_calls):
+                started = time.monotonic()
+                await asyncio.wait_for(
+                    get_response(transport, address, constants.RPC_CHAIN_GET_STATE_ROOT_HASH),
+                    self.policy.probe_timeout
+                )
+                latencies.append(time.monotonic() - started)
+        except Exception:
+            return None
+        finally:
+            await transport.close()
+
+        return statistics.median(latencies)
+
+    async def _rerank(self, pool: typing.Optional[NodePool]):
+        while True:
+            await asyncio.sleep(self.policy.rerank_interval)
+            await self.rerank(pool)
+
+    def _resolve(self, peer_address: str) -> ConnectionInfo:
+        if self.policy.resolve is not None:
+            return self.policy.resolve(peer_address, self.seed)
+
+        host, _, _ = peer_address.rpartition(":")
+
+        return dataclasses.replace(self.seed, host=host.strip("[]"))
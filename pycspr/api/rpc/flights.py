@@ -0,0 +1,53 @@
+import asyncio
+import typing
+
+from pycspr.utils import json_codec
+
+
+class SingleFlight():
+    """De-duplicates identical in-flight calls, i.e. waiters share a single call's outcome.
+
+    """
+    def __init__(self):
+        """Instance constructor.
+
+        """
+        self._flights: typing.Dict[typing.Hashable, asyncio.Future] = dict()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently in flight."""
+        return len(self._flights)
+
+    async def do(
+        self,
+        key: typing.Hashable,
+        func: typing.Callable[[], typing.Awaitable]
+    ) -> object:
+        """Returns outcome of a call - joining an identical in-flight call if one exists.
+
+        :param key: Key identifying a call.
+        :param func: Function dispatching the call.
+        :returns: Shared outcome of call.
+
+        """
+        try:
+            future = self._flights[key]
+        except KeyError:
+            future = self._flights[key] = asyncio.ensure_future(func())
+            future.add_done_callback(lambda _: self._flights.pop(key, None))
+
+        # Shielded so that a waiter being cancelled does not cancel call for other waiters.
+        return await asyncio.shield(future)
+
+
+def get_call_key(endpoint: str, params: dict = None, field: str = None) -> typing.Hashable:
+    """Returns key identifying a JSON-RPC call by endpoint & canonicalised parameters.
+
+    :param endpoint: Endpoint to invoke.
+    :param params: Endpoint Parameters.
+    :param field: Inner response field.
+    :returns: Call key.
+
+    """
+    return endpoint, json_codec.dumps(params, sort_keys=True), field
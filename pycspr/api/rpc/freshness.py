@@ -0,0 +1,170 @@
+import asyncio
+import contextlib
+import contextvars
+import dataclasses
+import time
+import typing
+
+
+# Minimum tip height of a node serving calls dispatched within current context.
+CURRENT_MIN_HEIGHT: contextvars.ContextVar[int] = \
+    contextvars.ContextVar("CURRENT_MIN_HEIGHT", default=None)
+
+
+@contextlib.contextmanager
+def min_height(height: int):
+    """Routes calls dispatched within scope to nodes whose tip is at or above a height.
+
+    Scopes nest: an inner scope may raise but never lower an outer scope's height.
+
+    :param height: Height of a block that serving nodes must have added.
+
+    """
+    current = CURRENT_MIN_HEIGHT.get()
+    token = CURRENT_MIN_HEIGHT.set(height if current is None else max(current, height))
+    try:
+        yield
+    finally:
+        CURRENT_MIN_HEIGHT.reset(token)
+
+
+@dataclasses.dataclass
+class FreshnessPolicy:
+    """Encapsulates parameters controlling tracking of pool nodes' tip heights.
+
+    """
+    # Period (seconds) between polls of each node's status.
+    poll_interval: float = 5.0
+
+    # Period (seconds) within which a poll must complete.
+    poll_timeout: float = 2.0
+
+    # Minimum period (seconds) between on demand polls, i.e. polls triggered by
+    # calls requiring a height that no node is known to have reached.
+    min_refresh_interval: float = 0.5
+
+
+class HeightTracker():
+    """Tracks tip height of each node within a pool.
+
+    Heights are polled periodically & on demand. Heights may also be fed from other
+    sources, e.g. a node's SSE BlockAdded events, via NodePool.observe_height.
+
+    """
+    def __init__(
+        self,
+        pool: object,
+        policy: FreshnessPolicy,
+        poll: typing.Callable[[object], typing.Awaitable[typing.Optional[int]]]
+    ):
+        """Instance constructor.
+
+        :param pool: Pool of nodes whose heights are tracked.
+        :param policy: Freshness policy.
+        :param poll: Function returning a node's tip height.
+
+        """
+        self.policy = policy
+        self.pool = pool
+        self.poll = poll
+        self.refreshed_at: float = None
+        self._refresh: asyncio.Task = None
+        self._task: asyncio.Task = None
+
+    def start(self):
+        """Starts periodic polling of node heights.
+
+        """
+        # Polling outlives the call starting it, hence runs within a clean context,
+        # i.e. one free of the caller's scopes such as a batch or a minimum height.
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(), context=contextvars.Context()
+            )
+
+    async def stop(self):
+        """Stops periodic polling of node heights.
+
+        """
+        for task in (self._task, self._refresh):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = self._refresh = None
+
+    async def ensure_current(self):
+        """Starts periodic polling & refreshes node heights if no node is known to have
+        reached minimum height required by calls within current context.
+
+        """
+        self.start()
+        if CURRENT_MIN_HEIGHT.get() is not None:
+            await self.ensure(CURRENT_MIN_HEIGHT.get())
+
+    async def ensure(self, height: int):
+        """Refreshes node heights if no node is known to have reached a height.
+
+        :param height: Height of a block required by a call.
+
+        """
+        if any(i.height is not None and i.height >= height for i in self.pool.nodes):
+            return
+        if self.refreshed_at is not None and \
+           time.monotonic() - self.refreshed_at < self.policy.min_refresh_interval:
+            return
+
+        await self.refresh()
+
+    async def refresh(self):
+        """Polls each node's height - concurrent refreshes share a single poll.
+
+        """
+        if self._refresh is None:
+            self._refresh = asyncio.get_running_loop().create_task(
+                self._poll_nodes(), context=contextvars.Context()
+            )
+        try:
+            await asyncio.shield(self._refresh)
+        finally:
+            if self._refresh is not None and self._refresh.done():
+                self._refresh = None
+
+    async def _poll_node(self, node: object):
+        try:
+            height = await asyncio.wait_for(self.poll(node), self.policy.poll_timeout)
+        except Exception:
+            # Unreachable nodes are handled by pool ejection.
+            return
+        if height is not None:
+            self.pool.observe_height(node.address, height)
+
+    async def _poll_nodes(self):
+        await asyncio.gather(*[self._poll_node(i) for i in self.pool.nodes])
+        self.refreshed_at = time.monotonic()
+
+    async def _run(self):
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.policy.poll_interval)
+
+
+def get_required_height(params: typing.Optional[dict]) -> typing.Optional[int]:
+    """Returns height of a block that a node must have added in order to serve a call.
+
+    :param params: Endpoint parameters.
+    :returns: A block height - None if call is not scoped by block height.
+
+    """
+    if not params:
+        return None
+    for name, field in (("block_identifier", "Height"), ("state_identifier", "BlockHeight")):
+        identifier = params.get(name)
+        if isinstance(identifier, dict) and isinstance(identifier.get(field), int):
+            return identifier[field]
+    if isinstance(params.get("BlockHeight"), int):
+        return params["BlockHeight"]
+
+    return None
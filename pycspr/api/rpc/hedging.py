@@ -0,0 +1,157 @@
+import asyncio
+import collections
+import dataclasses
+import time
+import typing
+
+from pycspr.api import constants
+from pycspr.api.rpc.pool import NodePool
+from pycspr.api.rpc.pool import PoolNode
+
+
+@dataclasses.dataclass
+class HedgingPolicy:
+    """Encapsulates parameters controlling hedging of idempotent JSON-RPC calls.
+
+    """
+    # Percentile of an endpoint's observed latency after which a call is hedged.
+    percentile: float = 0.95
+
+    # Lower bound of delay (seconds) before a call is hedged.
+    min_delay: float = 0.01
+
+    # Upper bound of delay (seconds) before a call is hedged.
+    max_delay: float = 1.0
+
+    # Maximum ratio of hedged calls to calls - applies per endpoint.
+    budget: float = 0.1
+
+    # Per endpoint overrides of maximum ratio of hedged calls to calls.
+    budgets: typing.Dict[str, float] = dataclasses.field(default_factory=dict)
+
+    # Number of latency observations retained per endpoint.
+    window: int = 1000
+
+
+@dataclasses.dataclass
+class HedgingStats:
+    """Encapsulates counters of hedging activity over an endpoint.
+
+    """
+    # Number of calls.
+    calls: int = 0
+
+    # Number of calls for which a hedged call was dispatched.
+    hedged: int = 0
+
+    # Number of calls whose result was returned by a hedged call.
+    hedge_wins: int = 0
+
+    # Number of calls not hedged due to exhaustion of hedging budget.
+    throttled: int = 0
+
+
+class Hedger():
+    """Hedges slow idempotent calls by re-issuing them to a second node.
+
+    If a call has not completed within a percentile of its endpoint's observed
+    latency then it is re-issued to another pool node - the first successful
+    result is returned and the outstanding call is cancelled.
+
+    Observed latencies are those of primary calls only, a primary call cancelled upon
+    losing to its hedge being observed at its elapsed time, i.e. a lower bound of its
+    latency. Were only winning calls observed, the hedging delay would drift downward
+    & so consume the hedging budget faster than configured.
+
+    """
+    def __init__(self, policy: HedgingPolicy):
+        """Instance constructor.
+
+        :param policy: Hedging policy.
+
+        """
+        self.policy = policy
+        self.stats: typing.Dict[str, HedgingStats] = collections.defaultdict(HedgingStats)
+        self._latencies: typing.Dict[str, collections.deque] = collections.defaultdict(
+            lambda: collections.deque(maxlen=policy.window)
+        )
+
+    def get_delay(self, endpoint: str) -> float:
+        """Returns delay after which a call over an endpoint is hedged.
+
+        :param endpoint: Endpoint being invoked.
+        :returns: Delay in seconds.
+
+        """
+        latencies = self._latencies[endpoint]
+        if len(latencies) < constants.HEDGING_MIN_OBSERVATIONS:
+            return self.policy.max_delay
+
+        latencies = sorted(latencies)
+        delay = latencies[min(int(len(latencies) * self.policy.percentile), len(latencies) - 1)]
+
+        return min(max(delay, self.policy.min_delay), self.policy.max_delay)
+
+    async def invoke(
+        self,
+        endpoint: str,
+        pool: NodePool,
+        func: typing.Callable[[PoolNode], typing.Awaitable]
+    ) -> object:
+        """Invokes a call - hedging it if it is slow to complete.
+
+        :param endpoint: Endpoint being invoked.
+        :param pool: Pool of nodes over which call may be dispatched.
+        :param func: Function dispatching call to a node.
+        :returns: Result of first successful call.
+
+        """
+        stats = self.stats[endpoint]
+        stats.calls += 1
+
+        primary_node = pool.select()
+        primary = asyncio.create_task(self._invoke_primary(endpoint, func, primary_node))
+        started = time.monotonic()
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.get_delay(endpoint))
+            if done:
+                return primary.result()
+
+            budget = self.policy.budgets.get(endpoint, self.policy.budget)
+            if stats.hedged >= budget * stats.calls:
+                stats.throttled += 1
+                return await primary
+
+            stats.hedged += 1
+            hedge = asyncio.create_task(func(pool.select(exclude=[primary_node])))
+            tasks.add(hedge)
+
+            # First good answer wins - else the primary call's error is raised.
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            stats.hedge_wins += 1
+                        return task.result()
+
+            return primary.result()
+
+        finally:
+            if not primary.done():
+                self._latencies[endpoint].append(time.monotonic() - started)
+            for task in tasks:
+                task.cancel()
+
+    async def _invoke_primary(
+        self,
+        endpoint: str,
+        func: typing.Callable[[PoolNode], typing.Awaitable],
+        node: PoolNode
+    ) -> object:
+        started = time.monotonic()
+        result = await func(node)
+        self._latencies[endpoint].append(time.monotonic() - started)
+
+        return result
@@ -0,0 +1,153 @@
+import asyncio
+import collections
+import contextlib
+import dataclasses
+import time
+import typing
+
+from pycspr.api import constants
+from pycspr.api.resilience import is_node_failure
+from pycspr.api.rpc.scheduling import CURRENT_PRIORITY
+from pycspr.api.rpc.scheduling import Priority
+
+
+@dataclasses.dataclass
+class LimiterPolicy:
+    """Encapsulates parameters controlling adaptive (AIMD) limiting of in-flight calls.
+
+    """
+    # Initial number of in-flight calls permitted per node.
+    initial_limit: int = constants.DEFAULT_LIMITER_INITIAL_LIMIT
+
+    # Lower bound of in-flight calls permitted per node.
+    min_limit: int = 1
+
+    # Upper bound of in-flight calls permitted per node.
+    max_limit: int = constants.DEFAULT_POOL_SIZE
+
+    # Factor by which limit is reduced upon a failed or overly slow call.
+    backoff: float = 0.9
+
+    # Ratio of call latency to baseline latency above which a call is deemed overly slow.
+    tolerance: float = 2.0
+
+
+class AdaptiveLimiter():
+    """Limits in-flight calls to a node - excess calls are queued by priority class.
+
+    The limit is adjusted by additive increase / multiplicative decrease (AIMD): it
+    grows by one per limit's worth of successful calls and shrinks multiplicatively
+    upon failed calls or calls whose latency exceeds a multiple of baseline latency.
+
+    """
+    def __init__(
+        self,
+        policy: LimiterPolicy,
+        clock: typing.Callable[[], float] = time.monotonic
+    ):
+        """Instance constructor.
+
+        :param policy: Limiter policy.
+        :param clock: Clock by which call latencies are measured.
+
+        """
+        self.clock = clock
+        self.policy = policy
+        self.in_flight: int = 0
+        self._baseline: float = None
+        self._limit: float = float(policy.initial_limit)
+        self._waiters: typing.Dict[Priority, typing.Deque[asyncio.Future]] = \
+            collections.defaultdict(collections.deque)
+
+    @property
+    def limit(self) -> int:
+        """Current number of in-flight calls permitted."""
+        return int(self._limit)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls awaiting dispatch."""
+        return sum(len(i) for i in self._waiters.values())
+
+    @property
+    def queue_depths(self) -> typing.Dict[Priority, int]:
+        """Number of calls awaiting dispatch per priority class."""
+        return {k: len(v) for k, v in self._waiters.items() if v}
+
+    async def acquire(self):
+        """Awaits until a call may be dispatched - calls of higher priority go first.
+
+        """
+        if self.in_flight < self.limit and self.queue_depth == 0:
+            self.in_flight += 1
+            return
+
+        waiters = self._waiters[CURRENT_PRIORITY.get()]
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # Pass on a slot released to a waiter that has since been cancelled.
+            if waiter.done() and not waiter.cancelled():
+                self.in_flight -= 1
+                self._release_waiters()
+            else:
+                waiters.remove(waiter)
+            raise
+
+    def release(self, latency: float = None, failed: bool = False):
+        """Releases a slot held by a completed call & adjusts limit.
+
+        :param latency: Latency of call in seconds.
+        :param failed: Flag indicating whether call failed.
+
+        """
+        self.in_flight -= 1
+        if failed:
+            self._decrease()
+        elif latency is not None:
+            if self._baseline is None or latency < self._baseline:
+                self._baseline = latency
+            else:
+                self._baseline += constants.LIMITER_BASELINE_DRIFT * (latency - self._baseline)
+            if latency > self._baseline * self.policy.tolerance:
+                self._decrease()
+            else:
+                self._limit = min(self._limit + 1.0 / self._limit, float(self.policy.max_limit))
+        self._release_waiters()
+
+    @contextlib.asynccontextmanager
+    async def track(self):
+        """Holds a slot for the duration of a call.
+
+        """
+        await self.acquire()
+        started = self.clock()
+        try:
+            yield
+        except asyncio.CancelledError:
+            self.release()
+            raise
+        except Exception as err:
+            if is_node_failure(err):
+                self.release(failed=True)
+            else:
+                # Node responded, e.g. with a client or JSON-RPC error, so latency
+                # remains informative.
+                self.release(self.clock() - started)
+            raise
+        else:
+            self.release(self.clock() - started)
+
+    def _decrease(self):
+        self._limit = max(self._limit * self.policy.backoff, float(self.policy.min_limit))
+
+    def _release_waiters(self):
+        for key in sorted(self._waiters):
+            waiters = self._waiters[key]
+            while waiters and self.in_flight < self.limit:
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    self.in_flight += 1
+                    waiter.set_result(None)
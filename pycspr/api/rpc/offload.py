@@ -0,0 +1,176 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import contextvars
+import dataclasses
+import multiprocessing
+import typing
+
+import jsonrpcclient
+
+from pycspr import serializer
+from pycspr.api import constants
+from pycspr.utils import json_codec
+
+
+# Type into which the result of the call dispatched within current context is decoded.
+CURRENT_TYPEDEF: contextvars.ContextVar[type] = \
+    contextvars.ContextVar("CURRENT_TYPEDEF", default=None)
+
+
+@dataclasses.dataclass
+class OffloadPolicy:
+    """Encapsulates parameters controlling offloading of response decoding to worker
+    processes.
+
+    """
+    # Endpoints whose responses are decoded within a worker process irrespective of size.
+    endpoints: typing.Set[str] = dataclasses.field(default_factory=set)
+
+    # Size (bytes) of a response body from which it is decoded within a worker process.
+    min_size: typing.Optional[int] = constants.DEFAULT_OFFLOAD_MIN_SIZE
+
+    # Maximum number of worker processes - defaults to number of processors.
+    max_workers: typing.Optional[int] = None
+
+
+class Offloader():
+    """Decodes JSON-RPC responses - offloading heavy decodes to a pool of worker processes.
+
+    Both parsing of a response body & decoding of its result into a domain type occur
+    within a worker, thus the event loop only unpickles the decoded object.
+
+    """
+    def __init__(self, policy: OffloadPolicy):
+        """Instance constructor.
+
+        :param policy: Offload policy.
+
+        """
+        self.policy = policy
+
+        # Number of responses decoded within a worker process.
+        self.offloaded: int = 0
+
+        self._executor: concurrent.futures.ProcessPoolExecutor = None
+
+    def close(self):
+        """Shuts down worker processes.
+
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def decode(
+        self,
+        endpoint: str,
+        body: bytes,
+        field: str,
+        typedef: type
+    ) -> typing.Union[object, jsonrpcclient.responses.Error]:
+        """Decodes a JSON-RPC response body.
+
+        :param endpoint: Endpoint invoked.
+        :param body: JSON-RPC response body.
+        :param field: Inner response field.
+        :param typedef: Type into which result is decoded.
+        :returns: Decoded result, or a JSON-RPC error.
+
+        """
+        if not self.is_offloaded(endpoint, len(body)):
+            return decode(body, field, typedef)
+
+        if self._executor is None:
+            self._executor = get_executor(self.policy.max_workers)
+        self.offloaded += 1
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, decode, body, field, typedef
+        )
+
+    def is_offloaded(self, endpoint: str, size: int) -> bool:
+        """Returns flag indicating whether a response is decoded within a worker process.
+
+        :param endpoint: Endpoint invoked.
+        :param size: Size (bytes) of response body.
+        :returns: True if response is to be decoded within a worker process.
+
+        """
+        return \
+            endpoint in self.policy.endpoints or \
+            (self.policy.min_size is not None and size >= self.policy.min_size)
+
+
+def get_executor(max_workers: int = None) -> concurrent.futures.ProcessPoolExecutor:
+    """Returns a pool of worker processes within which responses are decoded.
+
+    Workers are spawned rather than forked as forking a process whose event loop, and
+    possibly other threads, are running may deadlock a worker. Spawned workers do not
+    inherit module state & so are initialised with the JSON codec in use.
+
+    :param max_workers: Maximum number of worker processes - defaults to number of
+                        processors.
+    :returns: A process pool executor.
+
+    """
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=json_codec.set_codec,
+        initargs=(json_codec.get_codec(), )
+    )
+
+
+@contextlib.contextmanager
+def decoding(typedef: type, decode: bool = True):
+    """Declares type into which result of a call dispatched within scope is decoded, thus
+    permitting its decoding to be offloaded.
+
+    :param typedef: Type into which result is decoded.
+    :param decode: Flag indicating whether result is to be decoded.
+
+    """
+    if not decode:
+        yield
+        return
+
+    token = CURRENT_TYPEDEF.set(typedef)
+    try:
+        yield
+    finally:
+        CURRENT_TYPEDEF.reset(token)
+
+
+def decode(
+    body: bytes,
+    field: str,
+    typedef: type
+) -> typing.Union[object, jsonrpcclient.responses.Error]:
+    """Parses a JSON-RPC response body & decodes its result - invoked within a worker.
+
+    :param body: JSON-RPC response body.
+    :param field: Inner response field.
+    :param typedef: Type into which result is decoded.
+    :returns: Decoded result, or a JSON-RPC error.
+
+    """
+    response = jsonrpcclient.parse(json_codec.loads(body))
+    if isinstance(response, jsonrpcclient.responses.Error):
+        return response
+
+    return serializer.from_json(
+        typedef,
+        response.result if field is None else response.result[field]
+    )
+
+
+def from_json(typedef: type, encoded: typing.Union[dict, object]) -> object:
+    """Decodes a JSON-RPC result - unless already decoded by an offloader.
+
+    :param typedef: Type into which result is decoded.
+    :param encoded: JSON-RPC result, or decoded result.
+    :returns: Decoded result.
+
+    """
+    return encoded if isinstance(encoded, typedef) else serializer.from_json(typedef, encoded)
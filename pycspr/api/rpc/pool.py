@@ -0,0 +1,380 @@
+import asyncio
+import contextlib
+import enum
+import itertools
+import random
+import time
+import typing
+
+from pycspr.api import constants
+from pycspr.api.connection import get_address
+from pycspr.api.resilience import CircuitBreaker
+from pycspr.api.resilience import CircuitBreakerPolicy
+from pycspr.api.resilience import is_node_failure
+from pycspr.api.rpc.affinity import CURRENT_AFFINITY_KEY
+from pycspr.api.rpc.affinity import HashRing
+from pycspr.api.rpc.cassettes import Cassette
+from pycspr.api.rpc.cassettes import RecordingTransport
+from pycspr.api.rpc.connection import ConnectionInfo
+from pycspr.api.rpc.freshness import CURRENT_MIN_HEIGHT
+from pycspr.api.rpc.limiter import AdaptiveLimiter
+from pycspr.api.rpc.limiter import LimiterPolicy
+from pycspr.api.transport import get_transport
+from pycspr.api.transport import Transport
+from pycspr.api.transport import TRANSPORT_ERRORS
+
+
+class SelectionStrategy(enum.Enum):
+    """Enumeration over strategies by which a pool node is selected to serve a call.
+
+    """
+    # Nodes take turns.
+    ROUND_ROBIN = enum.auto()
+
+    # Node with fewest in-flight calls.
+    LEAST_OUTSTANDING = enum.auto()
+
+    # Random node weighted by inverse of observed latency.
+    LATENCY_WEIGHTED = enum.auto()
+
+    # Node owning queried key upon a consistent hash ring, so that repeat queries of a
+    # key are served by a node whose caches are warm - calls without a key take turns.
+    CONSISTENT_HASH = enum.auto()
+
+
+class PoolNode():
+    """A node within a pool together with its observed load & health.
+
+    """
+    def __init__(
+        self,
+        connection_info: ConnectionInfo,
+        limiter: LimiterPolicy = None,
+        circuit_breaker: CircuitBreakerPolicy = None,
+        transport: Transport = None,
+        cassette: Cassette = None,
+    ):
+        """Instance constructor.
+
+        :param connection_info: Information required to connect to a node.
+        :param limiter: Policy to apply when limiting in-flight calls (optional).
+        :param circuit_breaker: Policy to apply when failing calls fast (optional).
+        :param transport: A shared transport over which calls are dispatched (optional).
+        :param cassette: Cassette to which calls are recorded (optional).
+
+        """
+        self.connection_info = connection_info
+        self.address = get_address(connection_info, "/rpc")
+        self.breaker = \
+            None if circuit_breaker is None else CircuitBreaker(self.address, circuit_breaker)
+        self.limiter = None if limiter is None else AdaptiveLimiter(limiter)
+        self.transport = transport or get_transport(connection_info)
+        if cassette is not None:
+            self.transport = RecordingTransport(self.transport, cassette)
+
+        # Flag indicating whether transport is owned, and thus closed, by node.
+        self.owns_transport: bool = transport is None
+
+        # Number of consecutive failed calls.
+        self.failures: int = 0
+
+        # Number of times node has been ejected from pool.
+        self.ejections: int = 0
+
+        # Monotonic time until which node is ejected from pool.
+        self.ejected_until: float = 0.0
+
+        # Height of node's most recently added block - None if unknown.
+        self.height: int = None
+
+        # Exponentially weighted moving average of call latency (seconds).
+        self.latency: float = None
+
+        # Number of in-flight calls.
+        self.outstanding: int = 0
+
+    def __str__(self):
+        """Instance string representation."""
+        return self.address
+
+    @property
+    def is_available(self) -> bool:
+        """Flag indicating whether node is neither ejected nor refusing calls."""
+        return not self.is_ejected and (self.breaker is None or not self.breaker.is_open)
+
+    @property
+    def is_ejected(self) -> bool:
+        """Flag indicating whether node has been ejected from pool."""
+        return self.ejected_until > 0.0
+
+
+class NodePool():
+    """A pool of nodes across which calls are distributed.
+
+    Nodes failing consecutive calls are ejected for a period after which they are
+    re-probed - nodes passing a probe are readmitted, otherwise ejection is extended.
+
+    """
+    def __init__(
+        self,
+        connection_infos: typing.Sequence[ConnectionInfo],
+        strategy: SelectionStrategy = SelectionStrategy.ROUND_ROBIN,
+        probe: typing.Callable[[PoolNode], typing.Awaitable] = None,
+        limiter: LimiterPolicy = None,
+        circuit_breaker: CircuitBreakerPolicy = None,
+        max_failures: int = constants.DEFAULT_POOL_MAX_FAILURES,
+        ejection_period: float = constants.DEFAULT_POOL_EJECTION_PERIOD,
+        transport: Transport = None,
+        cassette: Cassette = None,
+    ):
+        """Instance constructor.
+
+        :param connection_infos: Information required to connect to each node.
+        :param strategy: Strategy by which a node is selected to serve a call.
+        :param probe: Function invoked to verify that an ejected node is healthy.
+        :param limiter: Policy to apply when limiting in-flight calls per node (optional).
+        :param circuit_breaker: Policy to apply when failing calls fast per node (optional).
+        :param max_failures: Number of consecutive failures after which a node is ejected.
+        :param ejection_period: Initial period (seconds) for which a node is ejected.
+        :param transport: A shared transport over which calls are dispatched (optional).
+        :param cassette: Cassette to which calls are recorded (optional).
+
+        """
+        if not connection_infos:
+            raise ValueError("A node pool requires at least one node.")
+
+        self.cassette = cassette
+        self.circuit_breaker = circuit_breaker
+        self.ejection_period = ejection_period
+        self.limiter = limiter
+        self.max_failures = max_failures
+        self.nodes = [
+            PoolNode(i, limiter, circuit_breaker, transport, cassette)
+            for i in connection_infos
+        ]
+        self.probe = probe
+        self.ring = HashRing()
+        self.strategy = strategy
+        self.transport = transport
+        for node in self.nodes:
+            self.ring.add(node.address)
+        self._closing: typing.Set[asyncio.Task] = set()
+        self._probes: typing.Dict[PoolNode, asyncio.Task] = dict()
+        self._retired: typing.Dict[str, PoolNode] = dict()
+        self._turns = itertools.count()
+
+    @property
+    def healthy_nodes(self) -> typing.List[PoolNode]:
+        """Set of nodes currently admitted to pool."""
+        return [i for i in self.nodes if i.is_available]
+
+    async def close(self):
+        """Closes pooled connections to each node.
+
+        """
+        for node in self.nodes + list(self._retired.values()):
+            if node.owns_transport:
+                await node.transport.close()
+        self._retired = dict()
+        if self._closing:
+            await asyncio.gather(*self._closing)
+
+    def observe_height(self, address: str, height: int):
+        """Records that a node has added a block - heights never regress.
+
+        :param address: Address of node, e.g. as per PoolNode.address.
+        :param height: Height of a block added by node.
+
+        """
+        for node in self.nodes:
+            if node.address == address and (node.height is None or node.height < height):
+                node.height = height
+
+    def update(self, connection_infos: typing.Sequence[ConnectionInfo]):
+        """Updates set of pooled nodes - nodes remaining in pool retain their state.
+
+        Departed nodes are closed once their in-flight calls complete - until then a
+        departed node rejoining the pool is reinstated.
+
+        :param connection_infos: Information required to connect to each node.
+
+        """
+        if not connection_infos:
+            raise ValueError("A node pool requires at least one node.")
+
+        existing = {i.address: i for i in self.nodes}
+        nodes = []
+        for connection_info in connection_infos:
+            address = get_address(connection_info, "/rpc")
+            node = existing.pop(address, None)
+            if node is None:
+                node = self._retired.pop(address, None) or PoolNode(
+                    connection_info,
+                    self.limiter,
+                    self.circuit_breaker,
+                    self.transport,
+                    self.cassette
+                )
+                self.ring.add(node.address)
+            nodes.append(node)
+
+        for node in existing.values():
+            self.ring.remove(node.address)
+            self._retired[node.address] = node
+        self.nodes = nodes
+        for node in existing.values():
+            self._close_if_drained(node)
+
+    def select(self, exclude: typing.Sequence[PoolNode] = ()) -> PoolNode:
+        """Returns a node selected to serve a call.
+
+        If calls within current context require a minimum tip height then nodes known
+        to be at or above that height are preferred.
+
+        :param exclude: Nodes not to be selected, e.g. those already serving the call.
+        :returns: A pool node.
+
+        """
+        self._probe_ejected_nodes()
+
+        candidates = [i for i in self.healthy_nodes if i not in exclude]
+        if not candidates:
+            # Fail open: prefer a node closest to readmission over failing outright.
+            candidates = sorted(
+                [i for i in self.nodes if i not in exclude] or self.nodes,
+                key=lambda i: i.ejected_until
+            )[:1]
+
+        required = CURRENT_MIN_HEIGHT.get()
+        if required is not None:
+            # Fail open: nodes of unknown or lagging height may yet serve call.
+            candidates = [
+                i for i in candidates if i.height is not None and i.height >= required
+            ] or candidates
+
+        if self.strategy == SelectionStrategy.LEAST_OUTSTANDING:
+            fewest = min(i.outstanding for i in candidates)
+            candidates = [i for i in candidates if i.outstanding == fewest]
+        elif self.strategy == SelectionStrategy.LATENCY_WEIGHTED:
+            return _select_by_latency(candidates)
+        elif self.strategy == SelectionStrategy.CONSISTENT_HASH and \
+                CURRENT_AFFINITY_KEY.get() is not None:
+            return _select_by_key(self.ring, candidates, CURRENT_AFFINITY_KEY.get())
+
+        return candidates[next(self._turns) % len(candidates)]
+
+    @contextlib.asynccontextmanager
+    async def track(self, node: PoolNode):
+        """Tracks a call served by a node so as to maintain node's load & health.
+
+        If the node's in-flight calls are limited then the call is queued until a
+        slot is available. If the node's circuit is open then the call fails fast.
+
+        :param node: Node serving a call.
+
+        """
+        if node.breaker is not None:
+            node.breaker.check()
+
+        node.outstanding += 1
+        try:
+            async with node.limiter.track() if node.limiter else contextlib.nullcontext():
+                started = time.monotonic()
+                try:
+                    yield node
+                except TRANSPORT_ERRORS as err:
+                    # Client errors, e.g. 4xx responses, do not imply that a node is down.
+                    if is_node_failure(err):
+                        self._on_failure(node)
+                    raise
+                except Exception:
+                    # Node responded, e.g. with a JSON-RPC error, and so is up.
+                    if node.breaker is not None:
+                        node.breaker.on_success()
+                    raise
+                else:
+                    self._on_success(node, time.monotonic() - started)
+        finally:
+            node.outstanding -= 1
+            self._close_if_drained(node)
+
+    def _close_if_drained(self, node: PoolNode):
+        # Departed nodes are closed once no longer serving in-flight calls.
+        if node.outstanding > 0 or self._retired.get(node.address) is not node:
+            return
+        if node.owns_transport:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # Closed together with pool.
+                return
+            task = loop.create_task(node.transport.close())
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        del self._retired[node.address]
+
+    def _eject(self, node: PoolNode):
+        node.ejections += 1
+        period = min(
+            self.ejection_period * 2 ** (node.ejections - 1),
+            constants.POOL_EJECTION_PERIOD_MAX
+            )
+        node.ejected_until = time.monotonic() + period
+
+    def _on_failure(self, node: PoolNode):
+        node.failures += 1
+        if node.failures >= self.max_failures and not node.is_ejected:
+            self._eject(node)
+        if node.breaker is not None:
+            node.breaker.on_failure()
+
+    def _on_success(self, node: PoolNode, latency: float):
+        if node.breaker is not None:
+            node.breaker.on_success()
+        node.failures = 0
+        node.latency = \
+            latency if node.latency is None else \
+            node.latency + constants.POOL_LATENCY_SMOOTHING * (latency - node.latency)
+
+    def _probe_ejected_nodes(self):
+        if self.probe is None:
+            return
+        now = time.monotonic()
+        for node in self.nodes:
+            if node.is_ejected and node.ejected_until <= now and node not in self._probes:
+                self._probes[node] = \
+                    asyncio.get_running_loop().create_task(self._probe_node(node))
+
+    async def _probe_node(self, node: PoolNode):
+        try:
+            await self.probe(node)
+        except Exception:
+            self._eject(node)
+        else:
+            node.ejections = 0
+            node.ejected_until = 0.0
+            node.failures = 0
+        finally:
+            del self._probes[node]
+
+
+def _select_by_latency(candidates: typing.List[PoolNode]) -> PoolNode:
+    # Nodes without observed latency are assumed to be as fast as the fastest node.
+    observed = [i.latency for i in candidates if i.latency is not None]
+    fastest = min(observed) if observed else 1.0
+    weights = [
+        1.0 / max(fastest if i.latency is None else i.latency, 1e-6)
+        for i in candidates
+    ]
+
+    return random.choices(candidates, weights)[0]
+
+
+def _select_by_key(ring: HashRing, candidates: typing.List[PoolNode], key: str) -> PoolNode:
+    # Unavailable owners are skipped in favour of their ring successors.
+    by_address = {i.address: i for i in candidates}
+    for address in ring.walk(key):
+        if address in by_address:
+            return by_address[address]
+
+    return candidates[0]
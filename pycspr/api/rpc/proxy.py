@@ -1,12 +1,51 @@
+import asyncio
+import contextlib
 import typing
 
 import jsonrpcclient
-import requests
 
 from pycspr import serializer
 from pycspr.api import constants
+from pycspr.api.connection import get_address
+from pycspr.api.resilience import CircuitBreakerPolicy
+from pycspr.api.resilience import Retrier
+from pycspr.api.resilience import RetryPolicy
 from pycspr.api.rpc import params as param_utils
+from pycspr.api.rpc.affinity import affinity
+from pycspr.api.rpc.affinity import get_affinity_key
+from pycspr.api.rpc.batch import AutoBatcher
+from pycspr.api.rpc.batch import AutoBatchPolicy
+from pycspr.api.rpc.batch import CURRENT_BATCH
+from pycspr.api.rpc.caching import get_cache_key
+from pycspr.api.rpc.caching import get_state_cache_key
+from pycspr.api.rpc.caching import GlobalStateCache
+from pycspr.api.rpc.caching import is_cacheable
+from pycspr.api.rpc.caching import ResponseCache
+from pycspr.api.rpc.cassettes import Cassette
 from pycspr.api.rpc.connection import ConnectionInfo
+from pycspr.api.rpc.flights import get_call_key
+from pycspr.api.rpc.flights import SingleFlight
+from pycspr.api.rpc.freshness import FreshnessPolicy
+from pycspr.api.rpc.freshness import get_required_height
+from pycspr.api.rpc.freshness import HeightTracker
+from pycspr.api.rpc.freshness import min_height
+from pycspr.api.rpc.hedging import Hedger
+from pycspr.api.rpc.hedging import HedgingPolicy
+from pycspr.api.rpc.limiter import LimiterPolicy
+from pycspr.api.rpc.offload import CURRENT_TYPEDEF
+from pycspr.api.rpc.offload import decoding
+from pycspr.api.rpc.offload import Offloader
+from pycspr.api.rpc.offload import OffloadPolicy
+from pycspr.api.rpc.pool import NodePool
+from pycspr.api.rpc.pool import PoolNode
+from pycspr.api.rpc.pool import SelectionStrategy
+from pycspr.api.rpc.scheduling import PriorityPolicy
+from pycspr.api.rpc.scheduling import Scheduler
+from pycspr.api.rpc.streaming import ANY_KEY
+from pycspr.api.rpc.streaming import ArrayStream
+from pycspr.api.transport import get_aggregate_stats
+from pycspr.api.transport import Transport
+from pycspr.api.transport import TransportStats
 from pycspr.types.crypto import DigestBytes
 from pycspr.types.node import Deploy
 from pycspr.types.node import Address
@@ -17,29 +56,101 @@ from pycspr.types.node import GlobalStateID
 from pycspr.types.node import GlobalStateIDType
 from pycspr.types.node import PurseID
 from pycspr.types.node import StateRootHash
+from pycspr.utils import json_codec
 
 
 class Proxy:
     """Node JSON-RPC server proxy.
 
     """
-    def __init__(self, connection_info: ConnectionInfo):
+    def __init__(
+        self,
+        connection_info: typing.Union[ConnectionInfo, typing.Sequence[ConnectionInfo]],
+        auto_batch: AutoBatchPolicy = None,
+        strategy: SelectionStrategy = SelectionStrategy.ROUND_ROBIN,
+        hedging: HedgingPolicy = None,
+        single_flight: bool = False,
+        limiter: LimiterPolicy = None,
+        retry: RetryPolicy = None,
+        circuit_breaker: CircuitBreakerPolicy = None,
+        priorities: PriorityPolicy = None,
+        freshness: FreshnessPolicy = None,
+        transport: Transport = None,
+        cassette: Cassette = None,
+        offload: OffloadPolicy = None,
+        cache: ResponseCache = None,
+        state_cache: GlobalStateCache = None,
+    ):
         """Instance constructor.
 
-        :param connection_info: Information required to connect to a node.
+        :param connection_info: Information required to connect to a node, or to each
+                                node within a pool of nodes.
+        :param auto_batch: Policy to apply when automatically batching calls (optional).
+        :param strategy: Strategy by which a pool node is selected to serve a call.
+        :param hedging: Policy to apply when hedging idempotent calls (optional).
+        :param single_flight: Flag indicating whether identical in-flight calls are shared.
+        :param limiter: Policy to apply when limiting in-flight calls per node (optional).
+        :param retry: Policy to apply when retrying failed idempotent calls (optional).
+        :param circuit_breaker: Policy to apply when failing calls fast per node (optional).
+        :param priorities: Policy to apply when scheduling calls by priority (optional).
+        :param freshness: Policy to apply when tracking nodes' tip heights (optional).
+        :param transport: A shared transport over which calls are dispatched (optional).
+        :param cassette: Cassette to which calls are recorded (optional).
+        :param offload: Policy to apply when offloading decoding of responses (optional).
+        :param cache: Cache of responses to calls querying immutable data (optional).
+        :param state_cache: Cache of results of global state queries (optional).
 
         """
-        self.connection_info = connection_info
+        if isinstance(connection_info, ConnectionInfo):
+            connection_info = [connection_info]
+
+        # Calls are ordered by priority whilst queued, hence a queue must exist.
+        if priorities is not None and limiter is None:
+            size = connection_info[0].pool_size
+            limiter = LimiterPolicy(initial_limit=size, min_limit=size, max_limit=size)
+
+        self.connection_info = connection_info[0]
+        self.pool = NodePool(
+            connection_info, strategy, self._probe, limiter, circuit_breaker,
+            transport=transport, cassette=cassette
+        )
+        self.retrier = None if retry is None else Retrier(retry)
+        self.auto_batcher = None if auto_batch is None else AutoBatcher(self, auto_batch)
+        self.cache = cache
+        self.state_cache = state_cache
+        self.hedger = None if hedging is None else Hedger(hedging)
+        self.offloader = None if offload is None else Offloader(offload)
+        self.flights = SingleFlight() if single_flight else None
+        self.scheduler = None if priorities is None else Scheduler(priorities)
+        self.tracker = \
+            None if freshness is None else HeightTracker(self.pool, freshness, self._get_height)
 
     @property
     def address(self) -> str:
         """A node's RPC server base address."""
-        return f"http://{self.connection_info.host}:{self.connection_info.port}/rpc"
+        return get_address(self.connection_info, "/rpc")
+
+    @property
+    def stats(self) -> TransportStats:
+        """Counters of bytes exchanged with pooled nodes."""
+        return get_aggregate_stats([i.transport for i in self.pool.nodes])
 
     def __str__(self):
         """Instance string representation."""
         return self.address
 
+    async def close(self):
+        """Closes pooled connections to remote server(s).
+
+        """
+        if self.auto_batcher is not None:
+            await self.auto_batcher.close()
+        if self.tracker is not None:
+            await self.tracker.stop()
+        if self.offloader is not None:
+            self.offloader.close()
+        await self.pool.close()
+
     async def account_put_deploy(self, deploy: Deploy) -> DeployHash:
         """Dispatches a deploy to a node for processing.
 
@@ -51,8 +162,7 @@ class Proxy:
             "deploy": serializer.to_json(deploy),
         }
 
-        return await get_response(
-            self.address,
+        return await self._get_response(
             constants.RPC_ACCOUNT_PUT_DEPLOY,
             params,
             "deploy_hash"
@@ -67,7 +177,7 @@ class Proxy:
         """
         params: dict = param_utils.block_id(block_id, False)
 
-        return await get_response(self.address, constants.RPC_CHAIN_GET_BLOCK, params, "block")
+        return await self._get_response(constants.RPC_CHAIN_GET_BLOCK, params, "block")
 
     async def chain_get_block_transfers(self, block_id: BlockID = None) -> dict:
         """Returns on-chain block transfers information.
@@ -79,7 +189,7 @@ class Proxy:
         """
         params: dict = param_utils.block_id(block_id, False)
 
-        return await get_response(self.address, constants.RPC_CHAIN_GET_BLOCK_TRANSFERS, params)
+        return await self._get_response(constants.RPC_CHAIN_GET_BLOCK_TRANSFERS, params)
 
     async def chain_get_era_info_by_switch_block(self, block_id: BlockID = None) -> dict:
         """Returns consensus era information scoped by block id.
@@ -90,8 +200,7 @@ class Proxy:
         """
         params: dict = param_utils.block_id(block_id, False)
 
-        return await get_response(
-            self.address,
+        return await self._get_response(
             constants.RPC_CHAIN_GET_ERA_INFO_BY_SWITCH_BLOCK,
             params,
             "era_summary"
@@ -106,8 +215,7 @@ class Proxy:
         """
         params: dict = param_utils.block_id(block_id, False)
 
-        return await get_response(
-            self.address,
+        return await self._get_response(
             constants.RPC_CHAIN_GET_ERA_SUMMARY,
             params,
             "era_summary"
@@ -122,8 +230,7 @@ class Proxy:
         """
         params: dict = param_utils.block_id(block_id, False)
         response: str = \
-            await get_response(
-                self.address,
+            await self._get_response(
                 constants.RPC_CHAIN_GET_STATE_ROOT_HASH,
                 params,
                 "state_root_hash"
@@ -137,7 +244,7 @@ class Proxy:
         :returns: Node JSON-RPC API schema.
 
         """
-        return await get_response(self.address, constants.RPC_DISCOVER, field="schema")
+        return await self._get_response(constants.RPC_DISCOVER, field="schema")
 
     async def info_get_chainspec(self) -> dict:
         """Returns canonical network state information.
@@ -145,8 +252,7 @@ class Proxy:
         :returns: Chain spec, genesis accounts and global state information.
 
         """
-        return await get_response(
-            self.address,
+        return await self._get_response(
             constants.RPC_INFO_GET_CHAINSPEC,
             field="chainspec_bytes"
             )
@@ -166,7 +272,28 @@ class Proxy:
             "finalized_approvals": finalized_approvals
         }
 
-        return await get_response(self.address, constants.RPC_INFO_GET_DEPLOY, params)
+        return await self._get_response(constants.RPC_INFO_GET_DEPLOY, params)
+
+    async def info_iter_deploy_transforms(
+        self,
+        deploy_hash: DeployHash
+    ) -> typing.AsyncIterator[dict]:
+        """Yields transforms effected by a processed deploy as each arrives.
+
+        :param deploy_hash: Hash of a deploy processed by network.
+        :returns: An async iterator over deploy execution transforms.
+
+        """
+        params: dict = param_utils.deploy_hash(deploy_hash) | {
+            "finalized_approvals": False
+        }
+
+        async for transform in self._iter_response(
+            constants.RPC_INFO_GET_DEPLOY,
+            params,
+            ("execution_results", 0, "result", ANY_KEY, "effect", "transforms")
+        ):
+            yield transform
 
     async def info_get_peers(self) -> typing.List[dict]:
         """Returns node peer information.
@@ -174,7 +301,7 @@ class Proxy:
         :returns: Node peer information.
 
         """
-        return await get_response(self.address, constants.RPC_INFO_GET_PEERS, field="peers")
+        return await self._get_response(constants.RPC_INFO_GET_PEERS, field="peers")
 
     async def info_get_status(self) -> dict:
         """Returns node status information.
@@ -182,7 +309,7 @@ class Proxy:
         :returns: Node status information.
 
         """
-        return await get_response(self.address, constants.RPC_INFO_GET_STATUS)
+        return await self._get_response(constants.RPC_INFO_GET_STATUS)
 
     async def info_get_validator_changes(self) -> typing.List[dict]:
         """Returns validator change set.
@@ -190,8 +317,7 @@ class Proxy:
         :returns: Validator change set.
 
         """
-        return await get_response(
-            self.address,
+        return await self._get_response(
             constants.RPC_INFO_GET_VALIDATOR_CHANGES,
             field="changes"
             )
@@ -220,7 +346,7 @@ class Proxy:
             param_utils.purse_id(purse_id)
 
         return int(
-            await get_response(self.address, constants.RPC_QUERY_BALANCE, params, "balance")
+            await self._get_response(constants.RPC_QUERY_BALANCE, params, "balance")
         )
 
     async def query_global_state(
@@ -245,7 +371,7 @@ class Proxy:
 
         params: dict = param_utils.for_query_global_state(key, path, state_id)
 
-        return await get_response(self.address, constants.RPC_QUERY_GLOBAL_STATE, params)
+        return await self._get_response(constants.RPC_QUERY_GLOBAL_STATE, params)
 
     async def state_get_account_info(
         self,
@@ -263,8 +389,7 @@ class Proxy:
             param_utils.account_key(account_id) | \
             param_utils.block_id(block_id)
 
-        return await get_response(
-            self.address,
+        return await self._get_response(
             constants.RPC_STATE_GET_ACCOUNT_INFO,
             params,
             "account"
@@ -279,13 +404,31 @@ class Proxy:
         """
         params: dict = param_utils.block_id(block_id, False)
 
-        return await get_response(
-            self.address,
+        return await self._get_response(
             constants.RPC_STATE_GET_AUCTION_INFO,
             params,
             "auction_state"
             )
 
+    async def state_iter_auction_bids(
+        self,
+        block_id: BlockID = None
+    ) -> typing.AsyncIterator[dict]:
+        """Yields bids held by auction system contract as each arrives.
+
+        :param block_id: Identifier of a finalised block.
+        :returns: An async iterator over auction bids.
+
+        """
+        params: dict = param_utils.block_id(block_id, False)
+
+        async for bid in self._iter_response(
+            constants.RPC_STATE_GET_AUCTION_INFO,
+            params,
+            ("auction_state", "bids")
+        ):
+            yield bid
+
     async def state_get_dictionary_item(
         self,
         identifier: DictionaryID,
@@ -304,7 +447,7 @@ class Proxy:
         params: dict = \
             param_utils.for_state_get_dictionary_item(identifier, state_root_hash)
 
-        return await get_response(self.address, constants.RPC_STATE_GET_DICTIONARY_ITEM, params)
+        return await self._get_response(constants.RPC_STATE_GET_DICTIONARY_ITEM, params)
 
     async def state_get_item(
         self,
@@ -326,8 +469,7 @@ class Proxy:
 
         params: dict = param_utils.for_state_get_item(key, path, state_root_hash)
 
-        return await get_response(
-            self.address,
+        return await self._get_response(
             constants.RPC_STATE_GET_ITEM,
             params,
             "stored_value"
@@ -344,47 +486,383 @@ class Proxy:
             "trie_key": trie_key.hex()
         }
 
-        return await get_response(
-            self.address,
+        return await self._get_response(
             constants.RPC_STATE_GET_TRIE, params,
             "maybe_trie_bytes"
             )
 
+    async def _get_response(
+        self,
+        endpoint: str,
+        params: dict = None,
+        field: str = None
+    ) -> dict:
+        """Invokes remote JSON-RPC API & returns parsed response - calls querying immutable
+        data, or global state at a specific root, are served from cache if one is configured.
+
+        :endpoint: Endpoint to invoke.
+        :params: Endpoint Parameters.
+        :field: Inner response field.
+        :returns: Parsed JSON-RPC response.
+
+        """
+        if self.cache is not None:
+            key = get_cache_key(endpoint, params, field)
+            if key is not None:
+                return await self._get_cached_response(self.cache, key, endpoint, params, field)
+        if self.state_cache is not None:
+            key = get_state_cache_key(endpoint, params, field)
+            if key is not None:
+                return await self._get_cached_response(
+                    self.state_cache, key, endpoint, params, field
+                )
+
+        return await self._get_uncached_response(endpoint, params, field)
+
+    async def _get_cached_response(
+        self,
+        cache: typing.Union[ResponseCache, GlobalStateCache],
+        key: bytes,
+        endpoint: str,
+        params: dict = None,
+        field: str = None
+    ) -> dict:
+        """Returns cached response to a call querying immutable data - invoking remote
+        JSON-RPC API upon a cache miss.
+
+        :cache: Cache by which call is served.
+        :key: Cache key.
+        :endpoint: Endpoint to invoke.
+        :params: Endpoint Parameters.
+        :field: Inner response field.
+        :returns: Parsed JSON-RPC response.
+
+        """
+        encoded = await _invoke_cache(cache, cache.get, key)
+        if encoded is not None:
+            return json_codec.loads(encoded)
+
+        # Responses are cached as JSON, hence are not decoded by an offloader.
+        with decoding(None):
+            result = await self._get_uncached_response(endpoint, params, field)
+        if is_cacheable(endpoint, result):
+            await _invoke_cache(cache, cache.put, key, json_codec.dumps(result))
+
+        return result
+
+    async def _get_uncached_response(
+        self,
+        endpoint: str,
+        params: dict = None,
+        field: str = None
+    ) -> dict:
+        """Invokes remote JSON-RPC API & returns parsed response.
+
+        :endpoint: Endpoint to invoke.
+        :params: Endpoint Parameters.
+        :field: Inner response field.
+        :returns: Parsed JSON-RPC response.
+
+        """
+        # Batched calls bypass single flight as each must enqueue its own call, else the
+        # batch would await a call that is never enqueued.
+        batch = CURRENT_BATCH.get()
+        if batch is not None:
+            return await batch.enqueue(endpoint, params, field)
+        if self.flights is not None and endpoint not in constants.RPC_WRITE_ENDPOINTS:
+            # Calls decoded by an offloader are distinct from calls returning JSON.
+            return await self.flights.do(
+                (get_call_key(endpoint, params, field), CURRENT_TYPEDEF.get()),
+                lambda: self._retry(endpoint, params, field)
+            )
+
+        return await self._retry(endpoint, params, field)
+
+    async def _retry(
+        self,
+        endpoint: str,
+        params: dict = None,
+        field: str = None
+    ) -> dict:
+        """Dispatches a call to remote JSON-RPC API - retrying if idempotent & failing.
+
+        :endpoint: Endpoint to invoke.
+        :params: Endpoint Parameters.
+        :field: Inner response field.
+        :returns: Parsed JSON-RPC response.
+
+        """
+        if self.retrier is None or endpoint in constants.RPC_WRITE_ENDPOINTS:
+            return await self._dispatch(endpoint, params, field)
+
+        return await self.retrier.invoke(lambda: self._dispatch(endpoint, params, field))
+
+    async def _dispatch(
+        self,
+        endpoint: str,
+        params: dict = None,
+        field: str = None
+    ) -> dict:
+        """Dispatches a call to remote JSON-RPC API & returns parsed response.
+
+        :endpoint: Endpoint to invoke.
+        :params: Endpoint Parameters.
+        :field: Inner response field.
+        :returns: Parsed JSON-RPC response.
+
+        """
+        if self.scheduler is not None:
+            await self.scheduler.admit()
+        if self.auto_batcher is not None:
+            return await self.auto_batcher.submit(endpoint, params, field)
+
+        # Calls scoped by block height are routed to nodes that have added the block,
+        # whilst calls querying a keyed item may be routed to the node owning the key.
+        height = get_required_height(params)
+        key = get_affinity_key(params)
+        with contextlib.nullcontext() if height is None else min_height(height), \
+             contextlib.nullcontext() if key is None else affinity(key):
+            if self.tracker is not None:
+                await self.tracker.ensure_current()
+
+            async def invoke(node: PoolNode):
+                async with self.pool.track(node):
+                    result = await get_response(
+                        node.transport, node.address, endpoint, params, field, self.offloader
+                    )
+                if height is not None:
+                    self.pool.observe_height(node.address, height)
+                return result
+
+            if self.hedger is not None and \
+               len(self.pool.nodes) > 1 and \
+               endpoint not in constants.RPC_WRITE_ENDPOINTS:
+                return await self.hedger.invoke(endpoint, self.pool, invoke)
+
+            return await invoke(self.pool.select())
+
+    async def _get_batch_response(
+        self,
+        calls: typing.List[typing.Tuple[str, dict, str]],
+        height: int = None,
+        node: PoolNode = None
+    ) -> typing.List[typing.Union[object, "ProxyError"]]:
+        """Invokes remote JSON-RPC API with a batch request & returns parsed responses.
+
+        :calls: Sequence of (endpoint, params, field) triples.
+        :height: Minimum tip height of node serving batch (optional).
+        :node: Node serving batch, e.g. owner of calls' affinity key - selected if None.
+        :returns: Parsed JSON-RPC responses - one per call.
+
+        """
+        with contextlib.nullcontext() if height is None else min_height(height):
+            if self.tracker is not None:
+                await self.tracker.ensure_current()
+            node = node or self.pool.select()
+            async with self.pool.track(node):
+                results = await get_batch_response(node.transport, node.address, calls)
+        if height is not None and not any(isinstance(i, Exception) for i in results):
+            self.pool.observe_height(node.address, height)
+
+        return results
+
+    async def _iter_response(
+        self,
+        endpoint: str,
+        params: dict = None,
+        path: typing.Sequence[typing.Union[str, int]] = ()
+    ) -> typing.AsyncIterator[object]:
+        """Invokes remote JSON-RPC API & yields items of an array within result as each
+        arrives.
+
+        Streamed calls are neither batched, hedged nor retried as items may already
+        have been yielded by the time a call fails.
+
+        :endpoint: Endpoint to invoke.
+        :params: Endpoint Parameters.
+        :path: Location of streamed array within result.
+        :returns: An async iterator over array items.
+
+        """
+        if self.scheduler is not None:
+            await self.scheduler.admit()
+
+        node = self.pool.select()
+        async with self.pool.track(node):
+            async for item in iter_response(
+                node.transport, node.address, endpoint, params, path
+            ):
+                yield item
+
+    async def _get_height(self, node: PoolNode) -> typing.Optional[int]:
+        """Returns height of a pool node's most recently added block.
+
+        :node: Pool node to be polled.
+        :returns: Block height - None if node has yet to add a block.
+
+        """
+        status = await get_response(node.transport, node.address, constants.RPC_INFO_GET_STATUS)
+        block_info = status.get("last_added_block_info")
+
+        return None if block_info is None else block_info["height"]
+
+    async def _probe(self, node: PoolNode):
+        """Verifies that a pool node is able to serve calls.
+
+        :node: Pool node to be probed.
+
+        """
+        await get_response(node.transport, node.address, constants.RPC_CHAIN_GET_STATE_ROOT_HASH)
+
 
 class ProxyError(Exception):
     """Node API error wrapper.
 
     """
-    def __init__(self, msg):
+    def __init__(self, msg, code: int = None):
         """Instance constructor.
 
+        :param msg: Error message.
+        :param code: Node error code (if any).
+
         """
         super(ProxyError, self).__init__(msg)
+        self.code = code
 
 
 async def get_response(
+    transport: Transport,
     address: str,
     endpoint: str,
     params: dict = None,
     field: str = None,
+    offloader: Offloader = None,
 ) -> dict:
     """Invokes JSON-RPC API & returns parsed response.
 
+    :transport: Pooled HTTP transport over which to dispatch request.
     :address: Host address.
     :endpoint: Endpoint to invoke.
     :params: Endpoint Parameters.
     :field: Inner response field.
-    :returns: Parsed JSON-RPC response.
+    :offloader: Decodes responses to calls declaring a result type (optional).
+    :returns: Parsed JSON-RPC response - or decoded result if a result type is declared.
 
     """
     request = jsonrpcclient.request(endpoint, params)
-    response_raw = requests.post(address, json=request)
+    typedef = CURRENT_TYPEDEF.get()
+    if offloader is not None and typedef is not None:
+        decoded = await offloader.decode(
+            endpoint, await transport.post(address, request), field, typedef
+        )
+        if isinstance(decoded, jsonrpcclient.responses.Error):
+            _get_result(decoded)
+
+        return decoded
+
+    response_raw = await transport.post_json(address, request)
 
-    response_parsed = jsonrpcclient.parse(response_raw.json())
+    return _get_result(jsonrpcclient.parse(response_raw), field)
+
+
+async def get_batch_response(
+    transport: Transport,
+    address: str,
+    calls: typing.List[typing.Tuple[str, dict, str]]
+) -> typing.List[typing.Union[object, ProxyError]]:
+    """Invokes JSON-RPC API with a batch request & returns parsed responses.
+
+    :transport: Pooled HTTP transport over which to dispatch request.
+    :address: Host address.
+    :calls: Sequence of (endpoint, params, field) triples.
+    :returns: Parsed JSON-RPC responses - errors are returned rather than raised.
+
+    """
+    requests = [jsonrpcclient.request(endpoint, params) for endpoint, params, _ in calls]
+    responses_raw = await transport.post_json(address, requests)
+    if not isinstance(responses_raw, list):
+        response_parsed = jsonrpcclient.parse(responses_raw)
+        raise ProxyError(response_parsed, getattr(response_parsed, "code", None))
+
+    responses = {i.id: i for i in jsonrpcclient.parse(responses_raw)}
+    results = []
+    for request, (_, _, field) in zip(requests, calls):
+        try:
+            response_parsed = responses[request["id"]]
+        except KeyError:
+            results.append(ProxyError(f"Batch response is missing request: {request['id']}"))
+            continue
+        try:
+            results.append(_get_result(response_parsed, field))
+        except ProxyError as err:
+            results.append(err)
+
+    return results
+
+
+async def iter_response(
+    transport: Transport,
+    address: str,
+    endpoint: str,
+    params: dict = None,
+    path: typing.Sequence[typing.Union[str, int]] = ()
+) -> typing.AsyncIterator[object]:
+    """Invokes JSON-RPC API & yields items of an array within result as each arrives.
+
+    :transport: Pooled HTTP transport over which to dispatch request.
+    :address: Host address.
+    :endpoint: Endpoint to invoke.
+    :params: Endpoint Parameters.
+    :path: Location of streamed array within result - yields nothing if absent.
+    :returns: An async iterator over array items.
+
+    """
+    request = jsonrpcclient.request(endpoint, params)
+    stream = ArrayStream(("result",) + tuple(path))
+    async with contextlib.aclosing(transport.post_stream(address, request)) as chunks:
+        async for chunk in chunks:
+            for item in stream.feed(chunk):
+                yield item
+            if stream.is_finished:
+                return
+
+    if stream.is_started:
+        raise ProxyError("Response ended before streamed array was complete")
+
+    # Array not encountered, e.g. an error response, thus parse response in full.
+    value = _get_result(jsonrpcclient.parse(json_codec.loads(stream.prefix)))
+    for component in path:
+        if isinstance(value, dict) and component == ANY_KEY:
+            value = next(iter(value.values()), None)
+        elif isinstance(value, dict) or isinstance(value, list) and isinstance(component, int):
+            try:
+                value = value[component]
+            except (IndexError, KeyError):
+                return
+        else:
+            return
+    if isinstance(value, list):
+        for item in value:
+            yield item
+
+
+def _get_result(response_parsed: jsonrpcclient.responses.Response, field: str = None) -> object:
     if isinstance(response_parsed, jsonrpcclient.responses.Error):
-        raise ProxyError(response_parsed)
+        raise ProxyError(response_parsed, response_parsed.code)
 
     if field is None:
         return response_parsed.result
     else:
         return response_parsed.result[field]
+
+
+async def _invoke_cache(
+    cache: typing.Union[ResponseCache, GlobalStateCache],
+    func: typing.Callable,
+    *args
+) -> object:
+    # Disk & database I/O blocks & so is run within a worker thread rather than the loop.
+    if cache.is_blocking:
+        return await asyncio.to_thread(func, *args)
+
+    return func(*args)
@@ -0,0 +1,107 @@
+import asyncio
+import contextlib
+import contextvars
+import dataclasses
+import enum
+import typing
+
+
+class Priority(enum.IntEnum):
+    """Enumeration over classes of call priority - lower values are dispatched first.
+
+    """
+    # User facing calls sensitive to latency.
+    INTERACTIVE = 0
+
+    # Bulk calls, e.g. historical backfills, sensitive to throughput only.
+    BACKFILL = 1
+
+
+# Priority class of calls dispatched within current context.
+CURRENT_PRIORITY: contextvars.ContextVar[Priority] = \
+    contextvars.ContextVar("CURRENT_PRIORITY", default=Priority.INTERACTIVE)
+
+
+@contextlib.contextmanager
+def priority(value: Priority):
+    """Assigns a priority class to calls dispatched within scope.
+
+    :param value: Priority class.
+
+    """
+    token = CURRENT_PRIORITY.set(value)
+    try:
+        yield
+    finally:
+        CURRENT_PRIORITY.reset(token)
+
+
+@dataclasses.dataclass
+class PriorityPolicy:
+    """Encapsulates parameters controlling scheduling of calls by priority class.
+
+    """
+    # Per priority class caps upon rate of calls (calls per second).
+    rate_caps: typing.Dict[Priority, float] = dataclasses.field(default_factory=dict)
+
+    # Number of calls per priority class that may be dispatched in a burst above cap.
+    burst: int = 1
+
+
+class RateCap():
+    """Caps rate of calls - excess calls are delayed in order of arrival.
+
+    """
+    def __init__(self, rate: float, burst: int = 1):
+        """Instance constructor.
+
+        :param rate: Maximum number of calls per second.
+        :param burst: Number of calls that may be dispatched in a burst.
+
+        """
+        self.interval = 1.0 / rate
+        self.tolerance = (max(burst, 1) - 1) * self.interval
+        self._tat: float = 0.0
+
+    async def acquire(self):
+        """Awaits until a call may be dispatched.
+
+        """
+        # Generic cell rate algorithm: each call reserves a slot upon arrival.
+        now = asyncio.get_running_loop().time()
+        tat = max(self._tat, now)
+        self._tat = tat + self.interval
+        delay = tat - self.tolerance - now
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                # Slot is returned so that abandoned calls do not reduce effective rate.
+                self._tat -= self.interval
+                raise
+
+
+class Scheduler():
+    """Applies per priority class rate caps to calls.
+
+    Ordering of calls by priority class is applied by each node's concurrency limiter.
+
+    """
+    def __init__(self, policy: PriorityPolicy):
+        """Instance constructor.
+
+        :param policy: Priority policy.
+
+        """
+        self.policy = policy
+        self.caps: typing.Dict[Priority, RateCap] = {
+            k: RateCap(v, policy.burst) for k, v in policy.rate_caps.items()
+        }
+
+    async def admit(self):
+        """Awaits until a call may be dispatched under its priority class's rate cap.
+
+        """
+        cap = self.caps.get(CURRENT_PRIORITY.get())
+        if cap is not None:
+            await cap.acquire()
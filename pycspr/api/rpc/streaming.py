@@ -0,0 +1,195 @@
+import re
+import typing
+
+from pycspr.utils import json_codec
+
+
+# Characters delimiting JSON structure - scalars between them are skipped over.
+_STRUCTURAL = re.compile(rb'[{}\[\],:"]')
+
+# Path component matching any object key.
+ANY_KEY = "*"
+
+
+class _Frame():
+    """A JSON container being scanned.
+
+    """
+    def __init__(self, kind: int, on_path: bool):
+        # Opening character of container, i.e. { | [.
+        self.kind = kind
+
+        # Flag indicating whether container lies upon path to streamed array.
+        self.on_path = on_path
+
+        # Key (object) or index (array) of value currently being scanned.
+        self.current: typing.Union[str, int] = None if kind == ord("{") else 0
+
+        # Flag indicating whether next string within an object is a key.
+        self.expect_key: bool = kind == ord("{")
+
+
+class ArrayStream():
+    """Incrementally parses a JSON document, yielding items of an array nested within it
+    as each arrives.
+
+    Only bytes of the item currently being parsed are buffered, thus peak memory is
+    bounded by size of largest item rather than by size of document.
+
+    """
+    def __init__(self, path: typing.Sequence[typing.Union[str, int]]):
+        """Instance constructor.
+
+        :param path: Keys (objects) | indexes (arrays) locating streamed array within
+                     document - ANY_KEY matches any object key.
+
+        """
+        self.path = tuple(path)
+
+        # Flag indicating whether streamed array has been encountered.
+        self.is_started: bool = False
+
+        # Flag indicating whether streamed array has been fully parsed.
+        self.is_finished: bool = False
+
+        self._awaiting_item = False
+        self._buffer = bytearray()
+        self._item_start: int = None
+        self._pos = 0
+        self._stack: typing.List[_Frame] = []
+        self._string_start: int = None
+        self._target: _Frame = None
+
+    @property
+    def prefix(self) -> bytes:
+        """Document bytes parsed prior to encountering streamed array."""
+        return b"" if self.is_started else bytes(self._buffer)
+
+    def feed(self, chunk: bytes) -> typing.List[object]:
+        """Parses a chunk of document.
+
+        :param chunk: Next chunk of document.
+        :returns: Items of streamed array completed by chunk.
+
+        """
+        if self.is_finished:
+            return []
+
+        self._buffer += chunk
+        items = []
+        self._scan(items)
+
+        # Bytes preceding streamed array are retained so that a document not containing
+        # it, e.g. a JSON-RPC error, may be parsed in full.
+        if self.is_started:
+            self._discard(min(
+                i for i in (self._pos, self._string_start, self._item_start) if i is not None
+            ))
+
+        return items
+
+    def _discard(self, count: int):
+        del self._buffer[:count]
+        self._pos -= count
+        if self._string_start is not None:
+            self._string_start -= count
+        if self._item_start is not None:
+            self._item_start -= count
+
+    def _scan(self, items: list):
+        buf = self._buffer
+        depth = len(self.path)
+        while not self.is_finished:
+            if self._string_start is not None:
+                end = self._find_string_end()
+                if end is None:
+                    return
+                self._on_string(end, items)
+                continue
+
+            match = _STRUCTURAL.search(buf, self._pos)
+            if match is None:
+                return
+            pos, char = match.start(), buf[match.start()]
+
+            if self._awaiting_item:
+                self._awaiting_item = False
+                scalar = buf[self._pos:pos]
+                if scalar.strip():
+                    start = self._pos + len(scalar) - len(scalar.lstrip())
+                    items.append(json_codec.loads(buf[start:pos]))
+                elif char in b'{["':
+                    self._item_start = pos
+
+            self._pos = pos + 1
+            if char == ord('"'):
+                self._string_start = pos
+            elif char in b"{[":
+                self._push(char)
+            elif char in b"}]":
+                frame = self._stack.pop()
+                if frame is self._target:
+                    self.is_finished = True
+                elif len(self._stack) == depth + 1 and self._item_start is not None:
+                    items.append(json_codec.loads(buf[self._item_start:pos + 1]))
+                    self._item_start = None
+            elif char == ord(","):
+                frame = self._stack[-1]
+                if frame.kind == ord("{"):
+                    frame.expect_key = True
+                else:
+                    frame.current += 1
+                    self._awaiting_item = frame is self._target
+
+    def _find_string_end(self) -> typing.Optional[int]:
+        buf = self._buffer
+        pos = max(self._pos, self._string_start + 1)
+        while True:
+            pos = buf.find(b'"', pos)
+            if pos == -1:
+                self._pos = len(buf)
+                return None
+            # Quote is escaped if preceded by an odd number of backslashes.
+            escapes = 0
+            while pos - escapes - 1 > self._string_start and buf[pos - escapes - 1] == ord("\\"):
+                escapes += 1
+            if escapes % 2 == 0:
+                return pos
+            pos += 1
+
+    def _on_string(self, end: int, items: list):
+        buf = self._buffer
+        frame = self._stack[-1] if self._stack else None
+        if frame is not None and frame.kind == ord("{") and frame.expect_key:
+            frame.current = json_codec.loads(buf[self._string_start:end + 1])
+            frame.expect_key = False
+        elif frame is not None and frame is self._target and self._item_start is not None:
+            items.append(json_codec.loads(buf[self._item_start:end + 1]))
+            self._item_start = None
+        self._pos = end + 1
+        self._string_start = None
+
+    def _push(self, char: int):
+        depth = len(self._stack)
+        if depth == 0:
+            on_path = True
+        else:
+            parent = self._stack[-1]
+            on_path = \
+                parent.on_path and \
+                depth <= len(self.path) and \
+                _is_match(self.path[depth - 1], parent.current)
+
+        frame = _Frame(char, on_path)
+        self._stack.append(frame)
+        if on_path and depth == len(self.path) and char == ord("["):
+            self._target = frame
+            self._awaiting_item = True
+            self.is_started = True
+
+
+def _is_match(component: typing.Union[str, int], current: typing.Union[str, int]) -> bool:
+    if component == ANY_KEY:
+        return isinstance(current, str)
+
+    return component == current
@@ -1,5 +1,9 @@
+from pycspr.api.deadlines import apply_timeout
+from pycspr.api.resilience import CircuitBreakerPolicy
+from pycspr.api.resilience import RetryPolicy
 from pycspr.api.rpc_speculative.connection import ConnectionInfo
 from pycspr.api.rpc_speculative.proxy import Proxy
+from pycspr.api.transport import Transport
 from pycspr.types.node import Deploy
 from pycspr.types.node import BlockID
 
@@ -8,13 +12,32 @@ class Client():
     """Node speculative RPC server client.
 
     """
-    def __init__(self, connection_info: ConnectionInfo) -> dict:
+    def __init__(
+        self,
+        connection_info: ConnectionInfo,
+        retry: RetryPolicy = None,
+        circuit_breaker: CircuitBreakerPolicy = None,
+        timeout: float = None,
+        transport: Transport = None,
+    ) -> dict:
         """Instance constructor.
 
         :param connection_info: Information required to connect to a node.
+        :param retry: Policy to apply when retrying failed calls (optional).
+        :param circuit_breaker: Policy to apply when failing calls fast (optional).
+        :param timeout: Time budget (seconds) within which each call must complete (optional).
+        :param transport: A shared transport over which calls are dispatched (optional).
 
         """
-        self.proxy = Proxy(connection_info)
+        self.proxy = Proxy(connection_info, retry, circuit_breaker, transport)
+        if timeout is not None:
+            apply_timeout(self, timeout)
+
+    async def close(self):
+        """Closes pooled connections to remote server.
+
+        """
+        await self.proxy.close()
 
     async def speculative_exec(self, deploy: Deploy, block_id: BlockID = None) -> dict:
         """Dispatches a deploy to a node for speculative execution.
@@ -1,8 +1,15 @@
 from pycspr import serializer
 from pycspr.api import constants
+from pycspr.api.connection import get_address
+from pycspr.api.resilience import CircuitBreaker
+from pycspr.api.resilience import CircuitBreakerPolicy
+from pycspr.api.resilience import Retrier
+from pycspr.api.resilience import RetryPolicy
 from pycspr.api.rpc import params as param_utils
 from pycspr.api.rpc.proxy import get_response
 from pycspr.api.rpc_speculative.connection import ConnectionInfo
+from pycspr.api.transport import get_transport
+from pycspr.api.transport import Transport
 from pycspr.types.node import Deploy
 from pycspr.types.node import BlockID
 
@@ -11,23 +18,44 @@ class Proxy:
     """Node speculative JSON-RPC server proxy.
 
     """
-    def __init__(self, connection_info: ConnectionInfo):
+    def __init__(
+        self,
+        connection_info: ConnectionInfo,
+        retry: RetryPolicy = None,
+        circuit_breaker: CircuitBreakerPolicy = None,
+        transport: Transport = None,
+    ):
         """Instance constructor.
 
         :param connection_info: Information required to connect to a node.
+        :param retry: Policy to apply when retrying failed calls (optional).
+        :param circuit_breaker: Policy to apply when failing calls fast (optional).
+        :param transport: A shared transport over which calls are dispatched (optional).
 
         """
         self.connection_info = connection_info
+        self.breaker = \
+            None if circuit_breaker is None else CircuitBreaker(self.address, circuit_breaker)
+        self.retrier = None if retry is None else Retrier(retry)
+        self.transport = transport or get_transport(connection_info)
+        self.owns_transport = transport is None
 
     @property
     def address(self) -> str:
         """A node's speculative RPC server base address."""
-        return f"http://{self.connection_info.host}:{self.connection_info.port}/rpc"
+        return get_address(self.connection_info, "/rpc")
 
     def __str__(self):
         """Instance string representation."""
         return self.address
 
+    async def close(self):
+        """Closes pooled connections to remote server.
+
+        """
+        if self.owns_transport:
+            await self.transport.close()
+
     async def speculative_exec(self, deploy: Deploy, block_id: BlockID = None) -> dict:
         """Dispatches a deploy to a node for speculative execution.
 
@@ -40,9 +68,30 @@ class Proxy:
             "deploy": serializer.to_json(deploy)
         }
 
-        return await get_response(
-            self.address,
+        return await self._get_response(
             constants.SPECULATIVE_RPC_EXEC_DEPLOY,
             params,
             "execution_result"
             )
+
+    async def _get_response(
+        self,
+        endpoint: str,
+        params: dict = None,
+        field: str = None
+    ) -> dict:
+        """Invokes remote JSON-RPC API & returns parsed response.
+
+        :endpoint: Endpoint to invoke.
+        :params: Endpoint Parameters.
+        :field: Inner response field.
+        :returns: Parsed JSON-RPC response.
+
+        """
+        def get():
+            return get_response(self.transport, self.address, endpoint, params, field)
+
+        def invoke():
+            return get() if self.breaker is None else self.breaker.invoke(get)
+
+        return await (invoke() if self.retrier is None else self.retrier.invoke(invoke))
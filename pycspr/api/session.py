@@ -0,0 +1,220 @@
+import dataclasses
+import typing
+
+from pycspr.api import constants
+from pycspr.api.resilience import CircuitBreakerPolicy
+from pycspr.api.resilience import RetryPolicy
+from pycspr.api.rest import Client as RestClient
+from pycspr.api.rest import ConnectionInfo as RestConnectionInfo
+from pycspr.api.rpc import Client as RpcClient
+from pycspr.api.rpc import ConnectionInfo as RpcConnectionInfo
+from pycspr.api.rpc_speculative import Client as SpeculativeRpcClient
+from pycspr.api.rpc_speculative import ConnectionInfo as SpeculativeRpcConnectionInfo
+from pycspr.api.sse import Client as SseClient
+from pycspr.api.sse import ConnectionInfo as SseConnectionInfo
+from pycspr.api.transport import get_session
+from pycspr.api.transport import get_transport
+
+
+@dataclasses.dataclass
+class ConnectionInfo:
+    """Encapsulates information required to connect to each of a node's APIs.
+
+    """
+    # Host address.
+    host: str = constants.DEFAULT_HOST
+
+    # Number of exposed JSON-RPC port.
+    port_rpc: int = constants.DEFAULT_PORT_RPC
+
+    # Number of exposed REST port.
+    port_rest: int = constants.DEFAULT_PORT_REST
+
+    # Number of exposed SSE port.
+    port_sse: int = constants.DEFAULT_PORT_SSE
+
+    # Number of exposed speculative JSON-RPC port.
+    port_speculative_rpc: int = constants.DEFAULT_PORT_SPECULATIVE_RPC
+
+    # Maximum number of pooled keep-alive connections per API.
+    pool_size: int = constants.DEFAULT_POOL_SIZE
+
+    # Flag indicating whether compressed (gzip | deflate) responses are accepted.
+    accept_compression: bool = True
+
+    # Flag indicating whether large request bodies, e.g. wasm deploys, are gzip compressed.
+    compress_requests: bool = False
+
+    # URL scheme, i.e. http | https.
+    scheme: str = "http"
+
+    # Path prefix beneath which APIs are exposed, e.g. by a hosted gateway.
+    base_path: str = ""
+
+    # Headers dispatched with each request, e.g. API keys.
+    headers: typing.Dict[str, str] = dataclasses.field(default_factory=dict)
+
+    # TLS certificate verification: True | False | path to a CA bundle.
+    verify: typing.Union[bool, str] = True
+
+    # Period (seconds) for which idle pooled connections, and thus TLS sessions, are kept alive.
+    keepalive_timeout: float = constants.DEFAULT_KEEPALIVE_TIMEOUT
+
+
+class Session():
+    """A session with a node owning connection pools shared by each of its API clients.
+
+    JSON-RPC, speculative JSON-RPC & REST calls share a single non-blocking transport,
+    whilst SSE streams, which are consumed synchronously, use a blocking HTTP session.
+
+    """
+    def __init__(
+        self,
+        connection_info: ConnectionInfo,
+        retry: RetryPolicy = None,
+        circuit_breaker: CircuitBreakerPolicy = None,
+        timeout: float = None,
+    ):
+        """Instance constructor.
+
+        :param connection_info: Information required to connect to each of a node's APIs.
+        :param retry: Policy to apply when retrying failed calls (optional).
+        :param circuit_breaker: Policy to apply when failing calls fast (optional).
+        :param timeout: Time budget (seconds) within which each call must complete (optional).
+
+        """
+        self.connection_info = connection_info
+        self.http_session = get_session(connection_info, connection_info.pool_size)
+        self.transport = get_transport(connection_info)
+
+        self.rpc = RpcClient(
+            get_rpc_connection_info(connection_info),
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            timeout=timeout,
+            transport=self.transport
+        )
+        self.rest = RestClient(
+            get_rest_connection_info(connection_info),
+            retry,
+            circuit_breaker,
+            timeout,
+            self.transport
+        )
+        self.speculative_rpc = SpeculativeRpcClient(
+            get_speculative_rpc_connection_info(connection_info),
+            retry,
+            circuit_breaker,
+            timeout,
+            self.transport
+        )
+        self.sse = SseClient(
+            get_sse_connection_info(connection_info),
+            self.rpc,
+            self.http_session
+        )
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def open(self):
+        """Opens connection pools bound to running event loop.
+
+        """
+        await self.transport.open()
+
+    async def close(self):
+        """Closes connection pools shared by each API client.
+
+        """
+        await self.rpc.close()
+        await self.rest.close()
+        await self.speculative_rpc.close()
+        await self.transport.close()
+        self.http_session.close()
+
+
+def get_rest_connection_info(connection_info: ConnectionInfo) -> RestConnectionInfo:
+    """Returns information required to connect to a node's REST API.
+
+    :param connection_info: Information required to connect to each of a node's APIs.
+    :returns: REST API connection information.
+
+    """
+    return RestConnectionInfo(
+        host=connection_info.host,
+        port=connection_info.port_rest,
+        accept_compression=connection_info.accept_compression,
+        scheme=connection_info.scheme,
+        base_path=connection_info.base_path,
+        headers=connection_info.headers,
+        verify=connection_info.verify,
+        pool_size=connection_info.pool_size,
+        keepalive_timeout=connection_info.keepalive_timeout
+    )
+
+
+def get_rpc_connection_info(connection_info: ConnectionInfo) -> RpcConnectionInfo:
+    """Returns information required to connect to a node's JSON-RPC API.
+
+    :param connection_info: Information required to connect to each of a node's APIs.
+    :returns: JSON-RPC API connection information.
+
+    """
+    return RpcConnectionInfo(
+        host=connection_info.host,
+        port=connection_info.port_rpc,
+        pool_size=connection_info.pool_size,
+        accept_compression=connection_info.accept_compression,
+        compress_requests=connection_info.compress_requests,
+        scheme=connection_info.scheme,
+        base_path=connection_info.base_path,
+        headers=connection_info.headers,
+        verify=connection_info.verify,
+        keepalive_timeout=connection_info.keepalive_timeout
+    )
+
+
+def get_speculative_rpc_connection_info(
+    connection_info: ConnectionInfo
+) -> SpeculativeRpcConnectionInfo:
+    """Returns information required to connect to a node's speculative JSON-RPC API.
+
+    :param connection_info: Information required to connect to each of a node's APIs.
+    :returns: Speculative JSON-RPC API connection information.
+
+    """
+    return SpeculativeRpcConnectionInfo(
+        host=connection_info.host,
+        port=connection_info.port_speculative_rpc,
+        pool_size=connection_info.pool_size,
+        accept_compression=connection_info.accept_compression,
+        compress_requests=connection_info.compress_requests,
+        scheme=connection_info.scheme,
+        base_path=connection_info.base_path,
+        headers=connection_info.headers,
+        verify=connection_info.verify,
+        keepalive_timeout=connection_info.keepalive_timeout
+    )
+
+
+def get_sse_connection_info(connection_info: ConnectionInfo) -> SseConnectionInfo:
+    """Returns information required to connect to a node's SSE API.
+
+    :param connection_info: Information required to connect to each of a node's APIs.
+    :returns: SSE API connection information.
+
+    """
+    return SseConnectionInfo(
+        host=connection_info.host,
+        port=connection_info.port_sse,
+        port_rpc=connection_info.port_rpc,
+        scheme=connection_info.scheme,
+        base_path=connection_info.base_path,
+        headers=connection_info.headers,
+        verify=connection_info.verify
+    )
@@ -1,5 +1,7 @@
 import typing
 
+import requests
+
 from pycspr.api.rpc import Client as RpcClient
 from pycspr.api.rpc import ConnectionInfo as RpcClientConnectionInfo
 from pycspr.api.sse.connection import ConnectionInfo
@@ -14,16 +16,32 @@ class Client():
     """Node SSE server client.
 
     """
-    def __init__(self, connection_info: ConnectionInfo, rpc_client: RpcClient = None):
+    def __init__(
+        self,
+        connection_info: ConnectionInfo,
+        rpc_client: RpcClient = None,
+        session: requests.Session = None,
+    ):
         """Instance constructor.
 
         :param connection_info: Information required to connect to a node.
         :param rpc_client: Node RPC client.
+        :param session: A shared HTTP session over which streams are opened (optional).
 
         """
-        self.proxy = Proxy(connection_info)
+        self.proxy = Proxy(connection_info, session)
+
+        # Flag indicating whether RPC client is owned, and thus closed, by this client.
+        self.owns_rpc: bool = rpc_client is None
         self.rpc = rpc_client or RpcClient(
-            RpcClientConnectionInfo(connection_info.host, connection_info.port_rpc)
+            RpcClientConnectionInfo(
+                connection_info.host,
+                connection_info.port_rpc,
+                scheme=connection_info.scheme,
+                base_path=connection_info.base_path,
+                headers=connection_info.headers,
+                verify=connection_info.verify
+            )
         )
 
         # Extension methods -> 2nd order functions.
@@ -35,6 +53,13 @@ class Client():
         self.await_until_era_n = ext.await_until_era_n
         self.get_events = ext.get_events
 
+    async def close(self):
+        """Closes pooled connections of owned RPC client.
+
+        """
+        if self.owns_rpc:
+            await self.rpc.close()
+
     def yield_events(
         self,
         echannel: NodeEventChannel,
@@ -1,4 +1,5 @@
 import dataclasses
+import typing
 
 from pycspr.api import constants
 
@@ -16,3 +17,15 @@ class ConnectionInfo:
 
     # Number of exposed JSON-RPC port.
     port_rpc: int = constants.DEFAULT_PORT_RPC
+
+    # URL scheme, i.e. http | https.
+    scheme: str = "http"
+
+    # Path prefix beneath which API is exposed, e.g. by a hosted gateway.
+    base_path: str = ""
+
+    # Headers dispatched with each request, e.g. API keys.
+    headers: typing.Dict[str, str] = dataclasses.field(default_factory=dict)
+
+    # TLS certificate verification: True | False | path to a CA bundle.
+    verify: typing.Union[bool, str] = True
@@ -1,31 +1,34 @@
-import json
 import typing
 
 import requests
 import sseclient
 
+from pycspr.api.connection import get_address
 from pycspr.api.sse.connection import ConnectionInfo
 from pycspr.types.node import NodeEventChannel
 from pycspr.types.node import NodeEventInfo
 from pycspr.types.node import NodeEventType
+from pycspr.utils import json_codec
 
 
 class Proxy:
     """Node SSE server proxy.
 
     """
-    def __init__(self, connection_info: ConnectionInfo):
+    def __init__(self, connection_info: ConnectionInfo, session: requests.Session = None):
         """Instance constructor.
 
         :param connection_info: Information required to connect to a node.
+        :param session: A shared HTTP session over which streams are opened (optional).
 
         """
         self.connection_info = connection_info
+        self.session = session
 
     @property
     def address(self) -> str:
-        """A node's REST server base address."""
-        return f"http://{self.connection_info.host}:{self.connection_info.port}/events"
+        """A node's SSE server base address."""
+        return get_address(self.connection_info, "/events")
 
     def __str__(self):
         """Instance string representation."""
@@ -48,15 +51,20 @@ class Proxy:
         url = f"{self.address}/{echannel.name.lower()}"
         if eid:
             url = f"{url}?start_from={eid}"
-        sse_client = sseclient.SSEClient(requests.get(url, stream=True))
+        sse_client = sseclient.SSEClient((self.session or requests).get(
+            url,
+            headers=self.connection_info.headers,
+            stream=True,
+            verify=self.connection_info.verify
+        ))
 
         # Open connection & iterate event stream.
         try:
             for event in sse_client.events():
                 # Set event data.
                 try:
-                    edata = json.loads(event.data)
-                except json.JSONDecodeError:
+                    edata = json_codec.loads(event.data)
+                except ValueError:
                     edata = event.data
 
                 # Set event type.
@@ -0,0 +1,305 @@
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import os
+import threading
+import typing
+
+from pycspr.api import constants
+from pycspr.api.rest import Client as RestClient
+from pycspr.api.rpc import Client as RpcClient
+from pycspr.api.rpc_speculative import Client as SpeculativeRpcClient
+
+
+# Guards instantiation of process wide event loop thread.
+_LOCK = threading.Lock()
+
+# Process wide event loop thread shared by synchronous clients.
+_LOOP_THREAD: "EventLoopThread" = None
+
+
+class EventLoopThread():
+    """A daemon thread running an event loop upon which coroutines are invoked.
+
+    Coroutines may be submitted from any thread - each blocks its calling thread
+    until complete, whilst all share the loop's pooled connections.
+
+    """
+    def __init__(self):
+        """Instance constructor.
+
+        """
+        self.loop = asyncio.new_event_loop()
+        self.pid = os.getpid()
+        self.thread = threading.Thread(
+            target=self.loop.run_forever,
+            name="pycspr-event-loop",
+            daemon=True
+        )
+        self.thread.start()
+
+    @property
+    def is_running(self) -> bool:
+        """Flag indicating whether loop is serving coroutines."""
+        return self.thread.is_alive() and not self.loop.is_closed()
+
+    def invoke(self, coro: typing.Awaitable, timeout: float = None) -> object:
+        """Invokes a coroutine upon loop & blocks until its result is available.
+
+        :param coro: Coroutine to be invoked.
+        :param timeout: Period (seconds) for which to block (optional).
+        :returns: Result of coroutine.
+
+        """
+        if threading.current_thread() is self.thread:
+            coro.close()
+            raise RuntimeError("Blocking calls cannot be made from within event loop thread.")
+
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def stop(self):
+        """Stops loop & joins thread.
+
+        """
+        if self.is_running:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+            self.loop.close()
+
+    def wrap(self, func: typing.Callable[..., typing.Awaitable]) -> typing.Callable:
+        """Returns a blocking function invoking a coroutine function upon loop.
+
+        :param func: Coroutine function to be wrapped.
+        :returns: Wrapped function.
+
+        """
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return self.invoke(func(*args, **kwargs))
+
+        return wrapper
+
+    def wrap_iterator(self, func: typing.Callable[..., typing.AsyncIterator]) -> typing.Callable:
+        """Returns a function returning a blocking iterator over items yielded by an
+        async generator function upon loop - each item is fetched as it is consumed.
+
+        :param func: Async generator function to be wrapped.
+        :returns: Wrapped function.
+
+        """
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            iterator = func(*args, **kwargs)
+
+            async def get_next():
+                return await iterator.__anext__()
+
+            async def close():
+                await iterator.aclose()
+
+            try:
+                while True:
+                    try:
+                        item = self.invoke(get_next())
+                    except StopAsyncIteration:
+                        return
+                    yield item
+            finally:
+                self.invoke(close())
+
+        return wrapper
+
+
+def get_event_loop_thread() -> EventLoopThread:
+    """Returns process wide event loop thread - instantiated upon first use.
+
+    :returns: Event loop thread shared by synchronous clients.
+
+    """
+    global _LOOP_THREAD
+
+    with _LOCK:
+        # A forked child inherits a copy of the loop but not its thread.
+        if _LOOP_THREAD is None or \
+           _LOOP_THREAD.pid != os.getpid() or \
+           not _LOOP_THREAD.is_running:
+            _LOOP_THREAD = EventLoopThread()
+
+        return _LOOP_THREAD
+
+
+class SyncBatch():
+    """Blocking facade over a batch of node JSON-RPC client calls.
+
+    Client methods accessed via a batch return a future whose result becomes available
+    once the batch has been dispatched, i.e. upon exiting the batch's scope.
+
+    """
+    def __init__(
+        self,
+        client: RpcClient,
+        loop_thread: EventLoopThread,
+        max_size: int = constants.DEFAULT_BATCH_SIZE
+    ):
+        """Instance constructor.
+
+        :param client: Node RPC client.
+        :param loop_thread: Event loop thread upon which batch is dispatched.
+        :param max_size: Maximum number of calls per JSON-RPC batch request.
+
+        """
+        self.client = client
+        self.loop_thread = loop_thread
+        self.max_size = max_size
+        self._calls: typing.List[tuple] = []
+
+    def __getattr__(self, name: str) -> typing.Callable[..., concurrent.futures.Future]:
+        """Returns a function scheduling a client call within the scope of this batch.
+
+        """
+        if not asyncio.iscoroutinefunction(getattr(self.client, name)):
+            raise AttributeError(f"Client function cannot be batched: {name}")
+
+        def schedule(*args, **kwargs) -> concurrent.futures.Future:
+            future = concurrent.futures.Future()
+            self._calls.append((name, args, kwargs, future))
+
+            return future
+
+        return schedule
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.dispatch()
+        else:
+            for _, _, _, future in self._calls:
+                future.cancel()
+
+    def dispatch(self):
+        """Dispatches scheduled calls & blocks until all have completed.
+
+        """
+        calls, self._calls = self._calls, []
+
+        async def dispatch() -> list:
+            async with self.client.batch(self.max_size) as batch:
+                return [getattr(batch, name)(*args, **kwargs) for name, args, kwargs, _ in calls]
+
+        try:
+            tasks = self.loop_thread.invoke(dispatch())
+        except Exception as err:
+            for _, _, _, future in calls:
+                future.set_exception(err)
+            raise
+
+        for (_, _, _, future), task in zip(calls, tasks):
+            if task.exception() is None:
+                future.set_result(task.result())
+            else:
+                future.set_exception(task.exception())
+
+
+class SyncClient():
+    """Blocking facade over an asynchronous node client.
+
+    Each public coroutine method of the wrapped client is exposed as a blocking
+    method invoked upon a shared event loop thread, thus facades are thread-safe &
+    share pooled connections across calling threads. Each public async generator
+    method, e.g. iter_auction_bids, is exposed as a blocking iterator.
+
+    """
+    def __init__(self, client: object, loop_thread: EventLoopThread = None):
+        """Instance constructor.
+
+        :param client: An asynchronous node client.
+        :param loop_thread: Event loop thread upon which calls are invoked - defaults
+                            to process wide event loop thread.
+
+        """
+        self.client = client
+        self.loop_thread = loop_thread or get_event_loop_thread()
+        for name, func in inspect.getmembers(client, asyncio.iscoroutinefunction):
+            if not name.startswith("_") and name != "close":
+                setattr(self, name, self.loop_thread.wrap(func))
+        for name, func in inspect.getmembers(client, inspect.isasyncgenfunction):
+            if not name.startswith("_"):
+                setattr(self, name, self.loop_thread.wrap_iterator(func))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Closes pooled connections of wrapped client.
+
+        """
+        if asyncio.iscoroutinefunction(getattr(self.client, "close", None)):
+            self.loop_thread.invoke(self.client.close())
+
+
+class SyncRestClient(SyncClient):
+    """Blocking node REST server client.
+
+    """
+    def __init__(self, *args, loop_thread: EventLoopThread = None, **kwargs):
+        """Instance constructor.
+
+        :param args: Positional arguments passed to asynchronous client.
+        :param loop_thread: Event loop thread upon which calls are invoked (optional).
+        :param kwargs: Keyword arguments passed to asynchronous client.
+
+        """
+        super(SyncRestClient, self).__init__(RestClient(*args, **kwargs), loop_thread)
+
+
+class SyncRpcClient(SyncClient):
+    """Blocking node RPC server client.
+
+    """
+    def __init__(self, *args, loop_thread: EventLoopThread = None, **kwargs):
+        """Instance constructor.
+
+        :param args: Positional arguments passed to asynchronous client.
+        :param loop_thread: Event loop thread upon which calls are invoked (optional).
+        :param kwargs: Keyword arguments passed to asynchronous client.
+
+        """
+        super(SyncRpcClient, self).__init__(RpcClient(*args, **kwargs), loop_thread)
+
+    def batch(self, max_size: int = constants.DEFAULT_BATCH_SIZE) -> SyncBatch:
+        """Returns a batch within which calls are dispatched as JSON-RPC batch requests.
+
+        :param max_size: Maximum number of calls per JSON-RPC batch request.
+        :returns: A batch, typically used as a context manager.
+
+        """
+        return SyncBatch(self.client, self.loop_thread, max_size)
+
+
+class SyncSpeculativeRpcClient(SyncClient):
+    """Blocking node speculative RPC server client.
+
+    """
+    def __init__(self, *args, loop_thread: EventLoopThread = None, **kwargs):
+        """Instance constructor.
+
+        :param args: Positional arguments passed to asynchronous client.
+        :param loop_thread: Event loop thread upon which calls are invoked (optional).
+        :param kwargs: Keyword arguments passed to asynchronous client.
+
+        """
+        super(SyncSpeculativeRpcClient, self).__init__(
+            SpeculativeRpcClient(*args, **kwargs),
+            loop_thread
+        )
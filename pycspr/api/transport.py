@@ -0,0 +1,371 @@
+import asyncio
+import dataclasses
+import functools
+import gzip
+import ssl
+import typing
+import zlib
+
+import aiohttp
+import requests
+import requests.adapters
+
+from pycspr.api import constants
+from pycspr.utils import json_codec
+
+
+# Errors indicating that a node is unreachable or otherwise unable to serve requests.
+TRANSPORT_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, OSError)
+
+
+@dataclasses.dataclass
+class TransportStats:
+    """Encapsulates counters of bytes exchanged with a node.
+
+    """
+    # Number of requests dispatched.
+    requests: int = 0
+
+    # Number of request body bytes prior to compression.
+    request_bytes: int = 0
+
+    # Number of request body bytes sent over the wire.
+    request_wire_bytes: int = 0
+
+    # Number of responses received compressed.
+    compressed_responses: int = 0
+
+    # Number of response body bytes received over the wire.
+    response_wire_bytes: int = 0
+
+    # Number of response body bytes after decompression.
+    response_bytes: int = 0
+
+
+class StreamDecoder():
+    """Incrementally decodes a response body as per its content encoding.
+
+    """
+    def __init__(self, encoding: str = None):
+        """Instance constructor.
+
+        :param encoding: Content encoding of body, i.e. gzip | deflate | identity.
+
+        """
+        self.encoding = (encoding or "identity").strip().lower()
+        if self.encoding == "gzip":
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif self.encoding == "deflate":
+            self._decompressor = zlib.decompressobj()
+        elif self.encoding == "identity":
+            self._decompressor = None
+        else:
+            raise ValueError(f"Unsupported content encoding: {encoding}")
+        self._started = False
+
+    @property
+    def is_compressed(self) -> bool:
+        """Flag indicating whether body is compressed."""
+        return self._decompressor is not None
+
+    def feed(self, chunk: bytes) -> bytes:
+        """Decodes a chunk of body.
+
+        :param chunk: Chunk of body as received over the wire.
+        :returns: Decoded bytes.
+
+        """
+        if self._decompressor is None:
+            return chunk
+        if not self._started and self.encoding == "deflate":
+            # Some servers emit raw deflate streams rather than zlib wrapped streams.
+            self._started = True
+            try:
+                return self._decompressor.decompress(chunk)
+            except zlib.error:
+                self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+
+        return self._decompressor.decompress(chunk)
+
+    def flush(self) -> bytes:
+        """Returns bytes buffered by decoder.
+
+        :returns: Decoded bytes.
+
+        """
+        return b"" if self._decompressor is None else self._decompressor.flush()
+
+
+class Transport:
+    """Non-blocking HTTP transport maintaining a pool of keep-alive connections.
+
+    Responses are requested compressed & decompressed as they stream in. Request
+    bodies are optionally compressed. Pooled connections, and thus their TLS sessions,
+    are kept alive so that handshakes are amortised across calls.
+
+    """
+    def __init__(
+        self,
+        pool_size: int = constants.DEFAULT_POOL_SIZE,
+        accept_compression: bool = True,
+        compress_requests: bool = False,
+        headers: typing.Dict[str, str] = None,
+        verify: typing.Union[bool, str] = True,
+        keepalive_timeout: float = constants.DEFAULT_KEEPALIVE_TIMEOUT,
+    ):
+        """Instance constructor.
+
+        :param pool_size: Maximum number of pooled connections per node endpoint.
+        :param accept_compression: Flag indicating whether compressed responses are accepted.
+        :param compress_requests: Flag indicating whether large request bodies are compressed.
+        :param headers: Headers dispatched with each request, e.g. API keys.
+        :param verify: TLS certificate verification: True | False | path to a CA bundle.
+        :param keepalive_timeout: Period (seconds) for which idle connections are kept alive.
+
+        """
+        self.accept_compression = accept_compression
+        self.compress_requests = compress_requests
+        self.headers = headers or dict()
+        self.keepalive_timeout = keepalive_timeout
+        self.pool_size = pool_size
+        self.ssl = get_ssl_context(verify)
+        self.stats = TransportStats()
+        self._loop: asyncio.AbstractEventLoop = None
+        self._session: aiohttp.ClientSession = None
+
+        # Sessions bound to other, still open, event loops - closed upon close.
+        self._sessions: typing.Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+    async def open(self):
+        """Opens a connection pool bound to running event loop.
+
+        """
+        self._get_session()
+
+    async def close(self):
+        """Closes pooled connections.
+
+        """
+        if self._session is not None:
+            self._sessions[self._loop] = self._session
+        loop = asyncio.get_running_loop()
+        for session_loop, session in self._sessions.items():
+            if session_loop is loop:
+                await session.close()
+            elif not session.closed:
+                # Sessions bound to a loop other than the running one cannot be awaited.
+                session.detach()
+        self._sessions.clear()
+        self._session = None
+        self._loop = None
+
+    async def post_json(
+        self,
+        url: str,
+        payload: typing.Union[dict, list]
+    ) -> typing.Union[dict, list]:
+        """Posts a JSON payload & returns parsed JSON response.
+
+        :param url: Target endpoint URL.
+        :param payload: JSON payload to be dispatched.
+        :returns: Parsed JSON response.
+
+        """
+        return json_codec.loads(await self.post(url, payload))
+
+    async def post(self, url: str, payload: typing.Union[dict, list]) -> bytes:
+        """Posts a JSON payload & returns decompressed response body, i.e. unparsed.
+
+        :param url: Target endpoint URL.
+        :param payload: JSON payload to be dispatched.
+        :returns: Response body.
+
+        """
+        body, headers = self._get_request(payload)
+        async with self._get_session().post(url, data=body, headers=headers) as response:
+            return await self._read_body(response)
+
+    async def post_stream(
+        self,
+        url: str,
+        payload: typing.Union[dict, list]
+    ) -> typing.AsyncIterator[bytes]:
+        """Posts a JSON payload & yields decompressed chunks of response body as each
+        arrives.
+
+        :param url: Target endpoint URL.
+        :param payload: JSON payload to be dispatched.
+        :returns: An async iterator over chunks of response body.
+
+        """
+        body, headers = self._get_request(payload)
+        async with self._get_session().post(url, data=body, headers=headers) as response:
+            async for chunk in self._iter_body(response):
+                yield chunk
+
+    async def get(self, url: str) -> bytes:
+        """Fetches a resource & returns its decompressed body.
+
+        :param url: Target resource URL.
+        :returns: Response body.
+
+        """
+        headers = self.headers | {
+            "Accept-Encoding": get_accept_encoding(self.accept_compression),
+        }
+        self.stats.requests += 1
+
+        async with self._get_session().get(url, headers=headers) as response:
+            return await self._read_body(response)
+
+    def _get_request(
+        self,
+        payload: typing.Union[dict, list]
+    ) -> typing.Tuple[bytes, typing.Dict[str, str]]:
+        body = json_codec.dumps(payload)
+        headers = self.headers | {
+            "Accept-Encoding": get_accept_encoding(self.accept_compression),
+            "Content-Type": "application/json",
+        }
+        self.stats.requests += 1
+        self.stats.request_bytes += len(body)
+        if self.compress_requests and len(body) >= constants.TRANSPORT_COMPRESSION_MIN_SIZE:
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+        self.stats.request_wire_bytes += len(body)
+
+        return body, headers
+
+    async def _iter_body(self, response: aiohttp.ClientResponse) -> typing.AsyncIterator[bytes]:
+        # Body is decompressed as it streams in so that wire bytes may be counted.
+        response.raise_for_status()
+        decoder = StreamDecoder(response.headers.get(aiohttp.hdrs.CONTENT_ENCODING))
+        async for chunk in response.content.iter_chunked(constants.TRANSPORT_CHUNK_SIZE):
+            self.stats.response_wire_bytes += len(chunk)
+            chunk = decoder.feed(chunk)
+            self.stats.response_bytes += len(chunk)
+            yield chunk
+        chunk = decoder.flush()
+        self.stats.response_bytes += len(chunk)
+        self.stats.compressed_responses += int(decoder.is_compressed)
+        yield chunk
+
+    async def _read_body(self, response: aiohttp.ClientResponse) -> bytes:
+        return b"".join([i async for i in self._iter_body(response)])
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # A session is bound to the event loop within which it was instantiated.
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            if self._session is not None:
+                self._sessions[self._loop] = self._session
+
+            # Connections bound to a closed loop are unusable and so are simply discarded,
+            # whilst sessions bound to other open loops are retained until closed.
+            for session_loop in [i for i in self._sessions if i.is_closed()]:
+                self._sessions.pop(session_loop).detach()
+
+            session = self._sessions.pop(loop, None)
+            if session is None or session.closed:
+                # Bodies are decompressed by transport so as to count wire bytes.
+                session = aiohttp.ClientSession(
+                    auto_decompress=False,
+                    connector=aiohttp.TCPConnector(
+                        keepalive_timeout=self.keepalive_timeout,
+                        limit=0,
+                        limit_per_host=self.pool_size,
+                        ssl=self.ssl
+                    )
+                )
+            self._session, self._loop = session, loop
+
+        return self._session
+
+
+def get_accept_encoding(accept_compression: bool) -> str:
+    """Returns value of an Accept-Encoding header.
+
+    :param accept_compression: Flag indicating whether compressed responses are accepted.
+    :returns: Header value.
+
+    """
+    return "gzip, deflate" if accept_compression else "identity"
+
+
+@functools.lru_cache(maxsize=None)
+def get_ssl_context(
+    verify: typing.Union[bool, str] = True
+) -> typing.Union[bool, ssl.SSLContext]:
+    """Returns TLS settings of a transport.
+
+    Contexts are memoized as loading a CA bundle is costly & blocks the event loop,
+    e.g. when a transport is instantiated per node.
+
+    :param verify: TLS certificate verification: True | False | path to a CA bundle.
+    :returns: A TLS context shared by transports' connections, or False if unverified.
+
+    """
+    if verify is False:
+        return False
+
+    return ssl.create_default_context(cafile=None if verify is True else verify)
+
+
+def get_session(
+    connection_info: object,
+    pool_size: int = constants.DEFAULT_POOL_SIZE
+) -> requests.Session:
+    """Returns a blocking HTTP session configured as per information required to connect
+    to a node.
+
+    :param connection_info: Information required to connect to a node's REST or SSE API.
+    :param pool_size: Maximum number of pooled connections per node endpoint.
+    :returns: A pooled HTTP session.
+
+    """
+    session = requests.Session()
+    session.headers.update(connection_info.headers)
+    session.verify = connection_info.verify
+    for prefix in ("http://", "https://"):
+        session.mount(prefix, requests.adapters.HTTPAdapter(pool_maxsize=pool_size))
+
+    return session
+
+
+def get_transport(connection_info: object) -> Transport:
+    """Returns a transport configured as per information required to connect to a node.
+
+    :param connection_info: Information required to connect to a node's JSON-RPC or
+                            REST API.
+    :returns: A pooled HTTP transport.
+
+    """
+    return Transport(
+        connection_info.pool_size,
+        connection_info.accept_compression,
+        # REST calls carry no request bodies & thus their connection info omits the flag.
+        getattr(connection_info, "compress_requests", False),
+        connection_info.headers,
+        connection_info.verify,
+        connection_info.keepalive_timeout
+    )
+
+
+def get_aggregate_stats(transports: typing.Iterable[Transport]) -> TransportStats:
+    """Returns counters of bytes exchanged over a set of transports.
+
+    :param transports: Transports, e.g. one per pool node - shared transports are
+                       counted once.
+    :returns: Sum of each transport's counters.
+
+    """
+    aggregate = TransportStats()
+    for stats in {id(i.stats): i.stats for i in transports}.values():
+        for field in dataclasses.fields(TransportStats):
+            setattr(
+                aggregate,
+                field.name,
+                getattr(aggregate, field.name) + getattr(stats, field.name)
+            )
+
+    return aggregate
@@ -1,4 +1,3 @@
-import json
 import pathlib
 import typing
 
@@ -6,6 +5,7 @@ from pycspr import serializer
 from pycspr import factory
 from pycspr.types.node import Block
 from pycspr.types.node import Deploy
+from pycspr.utils import json_codec
 
 # Domain types that can be written to file system. 
 _ENTITY_TYPEDEFS = typing.Union[Block, Deploy]
@@ -93,7 +93,7 @@ def _read_entity(
     typedef: _ENTITY_TYPEDEFS,
     fpath: typing.Union[pathlib.Path, str]
 ):
-    return serializer.from_json(typedef, json.loads(_read_file(fpath)))
+    return serializer.from_json(typedef, json_codec.loads(_read_file(fpath)))
 
 
 def _read_file(fpath: typing.Union[pathlib.Path, str]) -> bytes:
@@ -114,7 +114,7 @@ def _write_entity(
     if not force and fpath.exists():
         raise IOError("Entity has already been written to file system")
 
-    with open(str(fpath), "w") as fstream:
-        fstream.writelines(json.dumps(serializer.to_json(entity), indent=4))
+    with open(str(fpath), "wb") as fstream:
+        fstream.write(json_codec.dumps(serializer.to_json(entity), indent=True))
 
     return fpath
@@ -0,0 +1,123 @@
+import json
+import typing
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonCodec():
+    """Encodes & decodes JSON directly to & from bytes - using the standard library.
+
+    """
+    # Codec name.
+    name: str = "json"
+
+    def dumps(self, obj: object, sort_keys: bool = False, indent: bool = False) -> bytes:
+        """Encodes an object as JSON.
+
+        :param obj: Object to be encoded.
+        :param sort_keys: Flag indicating whether object keys are sorted, i.e. canonical.
+        :param indent: Flag indicating whether output is indented for human readability.
+        :returns: UTF-8 encoded JSON.
+
+        """
+        if indent:
+            return json.dumps(obj, sort_keys=sort_keys, indent=4).encode("utf-8")
+
+        return json.dumps(
+            obj,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            sort_keys=sort_keys
+        ).encode("utf-8")
+
+    def loads(self, data: typing.Union[bytes, bytearray, memoryview, str]) -> object:
+        """Decodes JSON.
+
+        :param data: UTF-8 encoded JSON.
+        :returns: Decoded object.
+
+        """
+        return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+class OrjsonCodec(JsonCodec):
+    """Encodes & decodes JSON directly to & from bytes - using orjson.
+
+    Indented output & objects that orjson cannot encode, e.g. integers beyond 64 bits,
+    are delegated to the standard library. Note that orjson decodes integers beyond
+    64 bits as floats, hence it is used only if opted into via set_codec - node APIs
+    encode such values, e.g. U512, as strings.
+
+    """
+    # Codec name.
+    name: str = "orjson"
+
+    def dumps(self, obj: object, sort_keys: bool = False, indent: bool = False) -> bytes:
+        if indent:
+            return super().dumps(obj, sort_keys, indent)
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+        except TypeError:
+            return super().dumps(obj, sort_keys)
+
+    def loads(self, data: typing.Union[bytes, bytearray, memoryview, str]) -> object:
+        return orjson.loads(data)
+
+
+# Map: codec name -> codec.
+CODECS: typing.Dict[str, JsonCodec] = {
+    JsonCodec.name: JsonCodec(),
+} | ({} if orjson is None else {OrjsonCodec.name: OrjsonCodec()})
+
+# Codec in use - the standard library by default as it decodes any integer losslessly.
+_CODEC: JsonCodec = CODECS[JsonCodec.name]
+
+
+def get_codec() -> JsonCodec:
+    """Returns JSON codec in use.
+
+    :returns: JSON codec.
+
+    """
+    return _CODEC
+
+
+def set_codec(codec: typing.Union[str, JsonCodec]):
+    """Sets JSON codec used by node APIs & file system utilities.
+
+    :param codec: Name of an available codec, e.g. json | orjson, or a codec instance.
+
+    """
+    global _CODEC
+
+    if isinstance(codec, str):
+        try:
+            codec = CODECS[codec]
+        except KeyError:
+            raise ValueError(f"Unavailable JSON codec: {codec}")
+    _CODEC = codec
+
+
+def dumps(obj: object, sort_keys: bool = False, indent: bool = False) -> bytes:
+    """Encodes an object as JSON using codec in use.
+
+    :param obj: Object to be encoded.
+    :param sort_keys: Flag indicating whether object keys are sorted, i.e. canonical.
+    :param indent: Flag indicating whether output is indented for human readability.
+    :returns: UTF-8 encoded JSON.
+
+    """
+    return _CODEC.dumps(obj, sort_keys, indent)
+
+
+def loads(data: typing.Union[bytes, bytearray, memoryview, str]) -> object:
+    """Decodes JSON using codec in use.
+
+    :param data: UTF-8 encoded JSON.
+    :returns: Decoded object.
+
+    """
+    return _CODEC.loads(data)
@@ -32,6 +32,7 @@ from tests.fixtures.node import RPC_CLIENT
 from tests.fixtures.node import REST_CLIENT
 from tests.fixtures.node import SSE_CLIENT
 from tests.fixtures.node import SPECULATIVE_RPC_CLIENT
+from tests.fixtures.node import STAND_IN_NODE
 from tests.fixtures.node import NODE_HOST
 from tests.fixtures.node import PORT_REST
 from tests.fixtures.node import PORT_RPC
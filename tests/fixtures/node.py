@@ -3,30 +3,39 @@ import os
 import pytest
 
 import pycspr
+from tests.utils.stand_in import StandInNode
 
 
 @pytest.fixture(scope="session")
-def RPC_CLIENT(CONNECTION_RPC: pycspr.NodeRpcConnectionInfo) -> pycspr.NodeRpcClient:
-    return pycspr.NodeRpcClient(CONNECTION_RPC)
+async def RPC_CLIENT(CONNECTION_RPC: pycspr.NodeRpcConnectionInfo) -> pycspr.NodeRpcClient:
+    client = pycspr.NodeRpcClient(CONNECTION_RPC)
+    yield client
+    await client.close()
 
 
 @pytest.fixture(scope="session")
-def SPECULATIVE_RPC_CLIENT(
+async def SPECULATIVE_RPC_CLIENT(
     CONNECTION_RPC_SPECULATIVE: pycspr.NodeSpeculativeRpcConnectionInfo
 ) -> pycspr.NodeSpeculativeRpcClient:
-    return pycspr.NodeSpeculativeRpcClient(CONNECTION_RPC_SPECULATIVE)
+    client = pycspr.NodeSpeculativeRpcClient(CONNECTION_RPC_SPECULATIVE)
+    yield client
+    await client.close()
 
 
 @pytest.fixture(scope="session")
-def REST_CLIENT(
+async def REST_CLIENT(
     CONNECTION_REST: pycspr.NodeRestConnectionInfo
 ) -> pycspr.NodeRestClient:
-    return pycspr.NodeRestClient(CONNECTION_REST)
+    client = pycspr.NodeRestClient(CONNECTION_REST)
+    yield client
+    await client.close()
 
 
 @pytest.fixture(scope="session")
-def SSE_CLIENT(CONNECTION_SSE: pycspr.NodeSseConnectionInfo) -> pycspr.NodeSseClient:
-    return pycspr.NodeSseClient(CONNECTION_SSE)
+async def SSE_CLIENT(CONNECTION_SSE: pycspr.NodeSseConnectionInfo) -> pycspr.NodeSseClient:
+    client = pycspr.NodeSseClient(CONNECTION_SSE)
+    yield client
+    await client.close()
 
 
 @pytest.fixture(scope="session")
@@ -75,3 +84,11 @@ def CONNECTION_RPC_SPECULATIVE(
 @pytest.fixture(scope="session")
 def CONNECTION_SSE(NODE_HOST: str, PORT_SSE: int, PORT_RPC: int) -> pycspr.NodeSseConnectionInfo:
     return pycspr.NodeSseConnectionInfo(NODE_HOST, PORT_SSE, PORT_RPC)
+
+
+@pytest.fixture()
+async def STAND_IN_NODE() -> StandInNode:
+    node = StandInNode()
+    await node.start()
+    yield node
+    await node.stop()
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr import NodeRpcProxyError
+from pycspr.types.node import GlobalStateID
+from pycspr.types.node import GlobalStateIDType
+from pycspr.types.node import PurseID
+from pycspr.types.node import PurseIDType
+from tests.utils.stand_in import StandInError
+from tests.utils.stand_in import StandInNode
+
+
+async def test_that_batched_calls_are_dispatched_together(STAND_IN_NODE: StandInNode):
+    client = NodeRpcClient(NodeRpcConnectionInfo("127.0.0.1", STAND_IN_NODE.port))
+    state_id = GlobalStateID(bytes(32), GlobalStateIDType.STATE_ROOT_HASH)
+
+    async with client.batch(max_size=100) as batch:
+        balances = [
+            batch.get_account_balance(
+                PurseID(bytes([i]) * 32, PurseIDType.ACCOUNT_HASH), state_id
+            )
+            for i in range(250)
+        ]
+    assert STAND_IN_NODE.posts == 3
+    assert [i.result() for i in balances] == [1000000] * 250
+
+    await client.close()
+
+
+async def test_that_composite_calls_are_dispatched_over_successive_batches(
+    STAND_IN_NODE: StandInNode
+):
+    client = NodeRpcClient(NodeRpcConnectionInfo("127.0.0.1", STAND_IN_NODE.port))
+
+    async with client.batch() as batch:
+        items = [batch.get_state_item(f"hash-{i:064x}") for i in range(10)]
+    assert STAND_IN_NODE.posts == 2
+    assert [i.result()["key"] for i in items] == [f"hash-{i:064x}" for i in range(10)]
+
+    await client.close()
+
+
+async def test_that_batched_errors_are_resolved_per_call(STAND_IN_NODE: StandInNode):
+    def query_balance(params: dict) -> dict:
+        if params["purse_identifier"]["main_purse_under_account_hash"].endswith("00"):
+            raise StandInError(-32006, "Failed to get balance")
+        return {"balance": "1"}
+
+    STAND_IN_NODE.handlers["query_balance"] = query_balance
+    client = NodeRpcClient(NodeRpcConnectionInfo("127.0.0.1", STAND_IN_NODE.port))
+    state_id = GlobalStateID(bytes(32), GlobalStateIDType.STATE_ROOT_HASH)
+
+    async with client.batch() as batch:
+        failed = batch.get_account_balance(
+            PurseID(bytes(32), PurseIDType.ACCOUNT_HASH), state_id
+        )
+        passed = batch.get_account_balance(
+            PurseID(bytes([1]) * 32, PurseIDType.ACCOUNT_HASH), state_id
+        )
+    assert STAND_IN_NODE.posts == 1
+    assert passed.result() == 1
+    with pytest.raises(NodeRpcProxyError):
+        failed.result()
+
+    await client.close()
+
+
+async def test_that_calls_blocked_elsewhere_do_not_hold_up_batch(STAND_IN_NODE: StandInNode):
+    client = NodeRpcClient(NodeRpcConnectionInfo("127.0.0.1", STAND_IN_NODE.port))
+    release = asyncio.Event()
+
+    async def get_state_root_hash_once_released():
+        await release.wait()
+        return await client.get_state_root_hash()
+
+    client.get_state_root_hash_once_released = get_state_root_hash_once_released
+    async with client.batch() as batch:
+        blocked = batch.get_state_root_hash_once_released()
+        passed = batch.get_state_root_hash()
+        passed.add_done_callback(lambda _: release.set())
+    assert blocked.result() == passed.result()
+    assert STAND_IN_NODE.posts == 2
+
+    await client.close()
+
+
+async def test_that_scheduled_calls_are_cancelled_upon_error(STAND_IN_NODE: StandInNode):
+    client = NodeRpcClient(NodeRpcConnectionInfo("127.0.0.1", STAND_IN_NODE.port))
+    with pytest.raises(RuntimeError):
+        async with client.batch() as batch:
+            scheduled = [batch.get_state_root_hash() for _ in range(3)]
+            raise RuntimeError()
+    assert all(i.cancelled() for i in scheduled)
+    assert STAND_IN_NODE.posts == 0
+
+    await client.close()
@@ -0,0 +1,57 @@
+import asyncio
+
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr.api.rpc import AutoBatchPolicy
+from tests.utils.stand_in import StandInNode
+
+
+async def test_that_calls_are_not_batched_by_default(STAND_IN_NODE: StandInNode):
+    client = NodeRpcClient(NodeRpcConnectionInfo("127.0.0.1", STAND_IN_NODE.port))
+    await asyncio.gather(*[client.get_state_root_hash() for _ in range(10)])
+    assert STAND_IN_NODE.posts == 10
+
+    await client.close()
+
+
+async def test_that_concurrent_calls_are_batched_within_window(STAND_IN_NODE: StandInNode):
+    client = NodeRpcClient(
+        NodeRpcConnectionInfo("127.0.0.1", STAND_IN_NODE.port),
+        auto_batch=AutoBatchPolicy(window=0.01)
+    )
+    data = await asyncio.gather(*[client.get_state_root_hash() for _ in range(50)])
+    assert STAND_IN_NODE.posts == 1
+    assert data == [bytes.fromhex("ab" * 32)] * 50
+
+    await client.close()
+
+
+async def test_that_full_batches_are_dispatched_immediately(STAND_IN_NODE: StandInNode):
+    client = NodeRpcClient(
+        NodeRpcConnectionInfo("127.0.0.1", STAND_IN_NODE.port),
+        auto_batch=AutoBatchPolicy(window=60.0, max_size=10)
+    )
+    await asyncio.wait_for(
+        asyncio.gather(*[client.get_state_root_hash() for _ in range(30)]),
+        timeout=5.0
+    )
+    assert STAND_IN_NODE.posts == 3
+
+    await client.close()
+
+
+async def test_that_pending_batches_are_cancelled_upon_close(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.delay = 0.5
+    client = NodeRpcClient(
+        NodeRpcConnectionInfo("127.0.0.1", STAND_IN_NODE.port),
+        auto_batch=AutoBatchPolicy(window=0.01, max_size=2)
+    )
+    in_flight = [asyncio.ensure_future(client.get_state_root_hash()) for _ in range(2)]
+    while STAND_IN_NODE.posts == 0:
+        await asyncio.sleep(0.01)
+    enqueued = asyncio.ensure_future(client.get_state_root_hash())
+    await asyncio.sleep(0)
+
+    await asyncio.wait_for(client.close(), timeout=0.25)
+    results = await asyncio.gather(*in_flight, enqueued, return_exceptions=True)
+    assert all(isinstance(i, asyncio.CancelledError) for i in results)
@@ -0,0 +1,99 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr import NodeRpcSelectionStrategy
+from tests.utils.stand_in import StandInNode
+
+
+@pytest.fixture()
+async def STAND_IN_NODES() -> list:
+    nodes = [StandInNode() for _ in range(3)]
+    for node in nodes:
+        await node.start()
+    yield nodes
+    for node in nodes:
+        await node.stop()
+
+
+def _get_client(nodes: list, strategy: NodeRpcSelectionStrategy) -> NodeRpcClient:
+    return NodeRpcClient(
+        [NodeRpcConnectionInfo("127.0.0.1", i.port) for i in nodes],
+        strategy=strategy
+    )
+
+
+async def test_round_robin_selection(STAND_IN_NODES: list):
+    client = _get_client(STAND_IN_NODES, NodeRpcSelectionStrategy.ROUND_ROBIN)
+    for _ in range(9):
+        await client.get_state_root_hash()
+    assert [i.posts for i in STAND_IN_NODES] == [3, 3, 3]
+
+    await client.close()
+
+
+async def test_least_outstanding_selection(STAND_IN_NODES: list):
+    STAND_IN_NODES[0].delay = 0.5
+    client = _get_client(STAND_IN_NODES, NodeRpcSelectionStrategy.LEAST_OUTSTANDING)
+    slow = asyncio.create_task(client.get_state_root_hash())
+    await asyncio.sleep(0.05)
+    for _ in range(10):
+        await client.get_state_root_hash()
+    await slow
+    assert STAND_IN_NODES[0].posts == 1
+
+    await client.close()
+
+
+async def test_latency_weighted_selection(STAND_IN_NODES: list):
+    STAND_IN_NODES[0].delay = 0.1
+    client = _get_client(STAND_IN_NODES, NodeRpcSelectionStrategy.LATENCY_WEIGHTED)
+    for _ in range(30):
+        await client.get_state_root_hash()
+    assert STAND_IN_NODES[0].posts < 10
+
+    await client.close()
+
+
+async def test_that_unhealthy_nodes_are_ejected_and_reprobed(STAND_IN_NODES: list):
+    client = _get_client(STAND_IN_NODES, NodeRpcSelectionStrategy.ROUND_ROBIN)
+    client.proxy.pool.ejection_period = 0.1
+    await STAND_IN_NODES[0].stop()
+    for _ in range(9):
+        try:
+            await client.get_state_root_hash()
+        except aiohttp.ClientError:
+            pass
+    ejected = client.proxy.pool.nodes[0]
+    assert ejected.is_ejected
+    assert len(client.proxy.pool.healthy_nodes) == 2
+
+    # Ejected node is readmitted once a probe succeeds.
+    await STAND_IN_NODES[0].start()
+    ejected.connection_info.port = STAND_IN_NODES[0].port
+    ejected.address = f"http://127.0.0.1:{STAND_IN_NODES[0].port}/rpc"
+    await asyncio.sleep(0.2)
+    await client.get_state_root_hash()
+    await asyncio.sleep(0.05)
+    assert not ejected.is_ejected
+
+    await client.close()
+
+
+async def test_that_client_errors_do_not_eject_nodes(STAND_IN_NODES: list):
+    def throttle(_):
+        raise web.HTTPTooManyRequests()
+
+    STAND_IN_NODES[0].handlers["chain_get_state_root_hash"] = throttle
+    client = _get_client(STAND_IN_NODES[:1], NodeRpcSelectionStrategy.ROUND_ROBIN)
+    for _ in range(5):
+        with pytest.raises(aiohttp.ClientResponseError):
+            await client.get_state_root_hash()
+    assert not client.proxy.pool.nodes[0].is_ejected
+    assert client.proxy.pool.nodes[0].failures == 0
+
+    await client.close()
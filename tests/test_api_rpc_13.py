@@ -0,0 +1,91 @@
+import asyncio
+import time
+
+import pytest
+
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr.api import constants
+from pycspr.api.rpc import HedgingPolicy
+from pycspr.api.rpc.hedging import Hedger
+from tests.utils.stand_in import StandInNode
+
+
+@pytest.fixture()
+async def STAND_IN_NODES() -> list:
+    nodes = [StandInNode(delay=0.5), StandInNode()]
+    for node in nodes:
+        await node.start()
+    yield nodes
+    for node in nodes:
+        await node.stop()
+
+
+def _get_client(nodes: list, policy: HedgingPolicy) -> NodeRpcClient:
+    return NodeRpcClient(
+        [NodeRpcConnectionInfo("127.0.0.1", i.port) for i in nodes],
+        hedging=policy
+    )
+
+
+async def test_that_slow_reads_are_hedged(STAND_IN_NODES: list):
+    client = _get_client(STAND_IN_NODES, HedgingPolicy(max_delay=0.05, budget=1.0))
+
+    started = time.monotonic()
+    for _ in range(4):
+        assert await client.get_state_root_hash() == bytes.fromhex("ab" * 32)
+    assert time.monotonic() - started < 0.5
+
+    stats = client.proxy.hedger.stats[constants.RPC_CHAIN_GET_STATE_ROOT_HASH]
+    assert stats.calls == 4
+    assert stats.hedged >= 2
+    assert stats.hedge_wins == stats.hedged
+
+    await client.close()
+
+
+async def test_that_hedging_is_bounded_by_budget(STAND_IN_NODES: list):
+    # Hedging delay lies well between nodes' latencies, thus only calls to slow node,
+    # i.e. every other call, are throttled - regardless of connection setup time.
+    client = _get_client(STAND_IN_NODES, HedgingPolicy(max_delay=0.25, budget=0.0))
+    await asyncio.gather(*[client.get_state_root_hash() for _ in range(4)])
+
+    stats = client.proxy.hedger.stats[constants.RPC_CHAIN_GET_STATE_ROOT_HASH]
+    assert stats.hedged == 0
+    assert stats.throttled == 2
+
+    await client.close()
+
+
+async def test_that_writes_are_not_hedged(STAND_IN_NODES: list):
+    for node in STAND_IN_NODES:
+        node.handlers[constants.RPC_ACCOUNT_PUT_DEPLOY] = lambda _: {"deploy_hash": "00"}
+    client = _get_client(STAND_IN_NODES, HedgingPolicy(max_delay=0.05, budget=1.0))
+    for _ in range(2):
+        await client.proxy._get_response(
+            constants.RPC_ACCOUNT_PUT_DEPLOY, {"deploy": {}}, "deploy_hash"
+        )
+    assert [i.posts for i in STAND_IN_NODES] == [1, 1]
+    assert constants.RPC_ACCOUNT_PUT_DEPLOY not in client.proxy.hedger.stats
+
+    await client.close()
+
+
+async def test_that_latencies_of_losing_primary_calls_are_observed():
+    class Pool():
+        def select(self, exclude: list = []) -> str:
+            return "fast" if exclude else "slow"
+
+    async def invoke(node: str) -> str:
+        await asyncio.sleep(0.2 if node == "slow" else 0.0)
+        return node
+
+    hedger = Hedger(HedgingPolicy(max_delay=0.05, budget=1.0))
+    for _ in range(3):
+        assert await hedger.invoke("an_endpoint", Pool(), invoke) == "fast"
+    assert hedger.stats["an_endpoint"].hedge_wins == 3
+
+    # Cancelled primary calls are observed at their elapsed time, hedges are not observed.
+    latencies = hedger._latencies["an_endpoint"]
+    assert len(latencies) == 3
+    assert all(i >= 0.05 for i in latencies)
@@ -0,0 +1,73 @@
+import asyncio
+
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr.types.node import NodePeer
+from tests.utils.stand_in import StandInNode
+
+
+_PEERS = [{"address": "127.0.0.1:35000", "node_id": "tls:00"}]
+
+
+def _get_client(node: StandInNode, single_flight: bool) -> NodeRpcClient:
+    return NodeRpcClient(
+        NodeRpcConnectionInfo("127.0.0.1", node.port),
+        single_flight=single_flight
+    )
+
+
+async def test_that_identical_calls_are_not_shared_by_default(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.delay = 0.05
+    client = _get_client(STAND_IN_NODE, False)
+    await asyncio.gather(*[client.get_state_root_hash() for _ in range(10)])
+    assert STAND_IN_NODE.posts == 10
+
+    await client.close()
+
+
+async def test_that_identical_in_flight_calls_are_shared(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.delay = 0.05
+    STAND_IN_NODE.handlers["info_get_peers"] = lambda _: {"peers": _PEERS}
+    client = _get_client(STAND_IN_NODE, True)
+
+    data = await asyncio.gather(*[client.get_node_peers() for _ in range(10)])
+    assert STAND_IN_NODE.posts == 1
+    assert isinstance(data[0][0], NodePeer)
+    assert all(i == data[0] for i in data)
+
+    # Completed calls are not shared.
+    await client.get_node_peers()
+    assert STAND_IN_NODE.posts == 2
+
+    await client.close()
+
+
+async def test_that_distinct_calls_are_not_shared(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.delay = 0.05
+    client = _get_client(STAND_IN_NODE, True)
+    await asyncio.gather(*[client.get_state_root_hash(i) for i in range(5)])
+    assert STAND_IN_NODE.posts == 5
+
+    await client.close()
+
+
+async def test_that_composite_calls_share_inner_calls(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.delay = 0.05
+    client = _get_client(STAND_IN_NODE, True)
+    await asyncio.gather(*[client.get_state_item(f"hash-{i:064x}") for i in range(5)])
+    assert STAND_IN_NODE.posts == 6
+
+    await client.close()
+
+
+async def test_that_identical_batched_calls_are_each_dispatched(STAND_IN_NODE: StandInNode):
+    client = _get_client(STAND_IN_NODE, True)
+    async with client.batch() as batch:
+        calls = [batch.get_state_root_hash() for _ in range(2)]
+    done, _ = await asyncio.wait(calls, timeout=1.0)
+    assert len(done) == 2
+    assert calls[0].result() == calls[1].result()
+    assert STAND_IN_NODE.posts == 1
+    assert len(STAND_IN_NODE.requests) == 2
+
+    await client.close()
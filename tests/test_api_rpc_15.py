@@ -0,0 +1,109 @@
+import asyncio
+import itertools
+
+import aiohttp
+import pytest
+
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr.api.rpc import LimiterPolicy
+from pycspr.api.rpc.limiter import AdaptiveLimiter
+from tests.utils.stand_in import StandInNode
+
+
+def _get_client(node: StandInNode, limiter: LimiterPolicy) -> NodeRpcClient:
+    return NodeRpcClient(NodeRpcConnectionInfo("127.0.0.1", node.port), limiter=limiter)
+
+
+async def test_that_in_flight_calls_are_capped_at_limit(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.delay = 0.05
+    client = _get_client(STAND_IN_NODE, LimiterPolicy(initial_limit=2, max_limit=2))
+    limiter = client.proxy.pool.nodes[0].limiter
+
+    calls = asyncio.gather(*[client.get_state_root_hash() for _ in range(8)])
+    await asyncio.sleep(0.02)
+    assert limiter.in_flight == 2
+    assert limiter.queue_depth == 6
+
+    await calls
+    assert STAND_IN_NODE.posts == 8
+    assert STAND_IN_NODE.max_in_flight == 2
+    assert limiter.in_flight == 0
+    assert limiter.queue_depth == 0
+
+    await client.close()
+
+
+async def test_that_limit_increases_upon_successful_calls(STAND_IN_NODE: StandInNode):
+    client = _get_client(STAND_IN_NODE, LimiterPolicy(initial_limit=2, max_limit=4))
+    limiter = client.proxy.pool.nodes[0].limiter
+
+    # Clock ticks once per reading, i.e. each call's latency is constant.
+    limiter.clock = itertools.count().__next__
+    for _ in range(20):
+        await client.get_state_root_hash()
+    assert limiter.limit == 4
+
+    await client.close()
+
+
+async def test_that_limit_decreases_upon_failed_calls():
+    limiter = AdaptiveLimiter(LimiterPolicy(initial_limit=10, backoff=0.5))
+    for limit in (5, 2, 1, 1):
+        await limiter.acquire()
+        limiter.release(failed=True)
+        assert limiter.limit == limit
+
+
+async def test_that_limit_decreases_upon_slow_calls():
+    limiter = AdaptiveLimiter(LimiterPolicy(initial_limit=10, backoff=0.5, tolerance=2.0))
+    await limiter.acquire()
+    limiter.release(0.01)
+    await limiter.acquire()
+    limiter.release(0.1)
+    assert limiter.limit == 5
+
+
+async def test_that_cancelled_calls_leave_queue():
+    limiter = AdaptiveLimiter(LimiterPolicy(initial_limit=1))
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+
+    waiter.cancel()
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 0
+    limiter.release()
+    assert limiter.in_flight == 0
+
+
+async def test_that_limit_decreases_upon_slow_tracked_calls():
+    limiter = AdaptiveLimiter(LimiterPolicy(initial_limit=10, backoff=0.5, tolerance=2.0))
+    limiter.clock = iter([0.0, 1.0, 1.0, 2.0, 2.0, 7.0]).__next__
+    for _ in range(2):
+        async with limiter.track():
+            pass
+    assert limiter.limit == 10
+    async with limiter.track():
+        pass
+    assert limiter.limit == 5
+
+
+async def test_that_limit_is_retained_upon_client_errors():
+    limiter = AdaptiveLimiter(LimiterPolicy(initial_limit=10, backoff=0.5))
+    limiter.clock = itertools.repeat(0.0).__next__
+    for err in (_get_response_error(400), _get_response_error(429)):
+        with pytest.raises(aiohttp.ClientResponseError):
+            async with limiter.track():
+                raise err
+    assert limiter.limit == 10
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        async with limiter.track():
+            raise _get_response_error(503)
+    assert limiter.limit == 5
+
+
+def _get_response_error(status: int) -> aiohttp.ClientResponseError:
+    return aiohttp.ClientResponseError(None, (), status=status)
@@ -0,0 +1,132 @@
+import socket
+import types
+
+import aiohttp
+import pytest
+
+from pycspr import NodeCircuitBreakerPolicy
+from pycspr import NodeCircuitOpenError
+from pycspr import NodeRetryPolicy
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr import NodeRpcProxyError
+from pycspr.api.resilience import Retrier
+from tests.utils.stand_in import StandInError
+from tests.utils.stand_in import StandInNode
+
+
+@pytest.fixture()
+def DEAD_NODE() -> types.SimpleNamespace:
+    # A port to which nothing is listening.
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return types.SimpleNamespace(port=sock.getsockname()[1])
+
+
+class _FailingHandler():
+    def __init__(self, code: int, failures: int):
+        self.code = code
+        self.failures = failures
+
+    def __call__(self, _):
+        if self.failures > 0:
+            self.failures -= 1
+            raise StandInError(self.code, "Failed")
+        return {"state_root_hash": "cd" * 32}
+
+
+def _get_client(nodes: list, **kwargs) -> NodeRpcClient:
+    return NodeRpcClient([NodeRpcConnectionInfo("127.0.0.1", i.port) for i in nodes], **kwargs)
+
+
+async def test_that_retryable_errors_are_retried(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.handlers["chain_get_state_root_hash"] = _FailingHandler(-32603, 2)
+    client = _get_client([STAND_IN_NODE], retry=NodeRetryPolicy(base_delay=0.01))
+    assert await client.get_state_root_hash() == bytes.fromhex("cd" * 32)
+    assert STAND_IN_NODE.posts == 3
+    assert client.proxy.retrier.retries == 2
+
+    await client.close()
+
+
+async def test_that_retries_are_bounded(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.handlers["chain_get_state_root_hash"] = _FailingHandler(-32603, 5)
+    client = _get_client([STAND_IN_NODE], retry=NodeRetryPolicy(base_delay=0.01))
+    with pytest.raises(NodeRpcProxyError) as err:
+        await client.get_state_root_hash()
+    assert err.value.code == -32603
+    assert STAND_IN_NODE.posts == 3
+
+    await client.close()
+
+
+async def test_that_fatal_errors_are_not_retried(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.handlers["chain_get_state_root_hash"] = _FailingHandler(-32001, 1)
+    client = _get_client([STAND_IN_NODE], retry=NodeRetryPolicy(base_delay=0.01))
+    with pytest.raises(NodeRpcProxyError) as err:
+        await client.get_state_root_hash()
+    assert err.value.code == -32001
+    assert STAND_IN_NODE.posts == 1
+
+    await client.close()
+
+
+async def test_that_transport_errors_are_retried_upon_another_node(
+    STAND_IN_NODE: StandInNode,
+    DEAD_NODE: types.SimpleNamespace
+):
+    client = _get_client([DEAD_NODE, STAND_IN_NODE], retry=NodeRetryPolicy(base_delay=0.01))
+    for _ in range(4):
+        await client.get_state_root_hash()
+    assert STAND_IN_NODE.posts == 4
+
+    await client.close()
+
+
+async def test_that_open_circuit_fails_fast(DEAD_NODE: types.SimpleNamespace):
+    policy = NodeCircuitBreakerPolicy(failure_threshold=2, reset_timeout=60.0)
+    client = _get_client([DEAD_NODE], circuit_breaker=policy)
+    for _ in range(2):
+        with pytest.raises(aiohttp.ClientError):
+            await client.get_state_root_hash()
+    with pytest.raises(NodeCircuitOpenError):
+        await client.get_state_root_hash()
+
+    await client.close()
+
+
+async def test_that_half_open_circuit_admits_calls(STAND_IN_NODE: StandInNode):
+    policy = NodeCircuitBreakerPolicy(failure_threshold=1, reset_timeout=0.0)
+    client = _get_client([STAND_IN_NODE], circuit_breaker=policy)
+    breaker = client.proxy.pool.nodes[0].breaker
+    breaker.on_failure()
+    assert breaker.opened_until > 0.0
+
+    await client.get_state_root_hash()
+    assert breaker.opened_until == 0.0
+    assert breaker.failures == 0
+
+    await client.close()
+
+
+async def test_that_calls_avoid_nodes_with_open_circuit(
+    STAND_IN_NODE: StandInNode,
+    DEAD_NODE: types.SimpleNamespace
+):
+    policy = NodeCircuitBreakerPolicy(failure_threshold=1)
+    client = _get_client([DEAD_NODE, STAND_IN_NODE], circuit_breaker=policy)
+    with pytest.raises(aiohttp.ClientError):
+        await client.get_state_root_hash()
+    for _ in range(4):
+        await client.get_state_root_hash()
+    assert STAND_IN_NODE.posts == 4
+
+    await client.close()
+
+
+def test_that_retry_delays_are_jittered_and_bounded():
+    retrier = Retrier(NodeRetryPolicy(base_delay=0.1, max_delay=0.3))
+    for attempt, ceiling in ((1, 0.1), (2, 0.2), (3, 0.3), (8, 0.3)):
+        delays = [retrier.get_delay(attempt) for _ in range(100)]
+        assert all(0 <= i <= ceiling for i in delays)
+        assert len(set(delays)) > 1
@@ -0,0 +1,98 @@
+import time
+
+import pytest
+
+from pycspr import NodeDeadlineExceededError
+from pycspr import NodeRetryPolicy
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr import NodeRpcProxyError
+from pycspr.api import deadline
+from tests.utils.stand_in import StandInError
+from tests.utils.stand_in import StandInNode
+
+
+def _get_client(node: StandInNode, **kwargs) -> NodeRpcClient:
+    return NodeRpcClient(NodeRpcConnectionInfo("127.0.0.1", node.port), **kwargs)
+
+
+async def test_that_calls_are_unbounded_by_default(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.delay = 0.1
+    client = _get_client(STAND_IN_NODE)
+    await client.get_state_root_hash()
+
+    await client.close()
+
+
+async def test_that_client_timeout_bounds_calls(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.delay = 1.0
+    client = _get_client(STAND_IN_NODE, timeout=0.1)
+    started = time.monotonic()
+    with pytest.raises(NodeDeadlineExceededError) as err:
+        await client.get_state_root_hash()
+    assert time.monotonic() - started < 0.5
+    assert isinstance(err.value, TimeoutError)
+
+    await client.close()
+
+
+async def test_that_composite_calls_share_client_timeout(STAND_IN_NODE: StandInNode):
+    # Each inner call completes within budget - but together they do not.
+    STAND_IN_NODE.delay = 0.06
+    client = _get_client(STAND_IN_NODE, timeout=0.1)
+    with pytest.raises(NodeDeadlineExceededError):
+        await client.get_state_item(f"hash-{0:064x}")
+    assert STAND_IN_NODE.posts == 2
+
+    await client.close()
+
+
+async def test_that_extension_calls_share_client_timeout(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.delay = 0.2
+    STAND_IN_NODE.handlers["rpc.discover"] = lambda _: {"schema": {"methods": []}}
+    client = _get_client(STAND_IN_NODE, timeout=0.1)
+    with pytest.raises(NodeDeadlineExceededError):
+        await client.get_rpc_endpoints()
+
+    await client.close()
+
+
+async def test_that_deadline_scope_bounds_calls(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.delay = 0.06
+    client = _get_client(STAND_IN_NODE)
+    async with deadline(1.0):
+        await client.get_state_root_hash()
+    with pytest.raises(NodeDeadlineExceededError):
+        async with deadline(0.1):
+            await client.get_state_root_hash()
+            await client.get_state_root_hash()
+
+    await client.close()
+
+
+async def test_that_nested_deadline_scope_cannot_extend_budget(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.delay = 0.2
+    client = _get_client(STAND_IN_NODE, timeout=10.0)
+    with pytest.raises(NodeDeadlineExceededError) as err:
+        async with deadline(0.1):
+            await client.get_state_root_hash()
+    assert err.value.timeout == 0.1
+
+    await client.close()
+
+
+async def test_that_retries_are_abandoned_when_beyond_deadline(STAND_IN_NODE: StandInNode):
+    def handler(_):
+        raise StandInError(-32603, "Internal error")
+
+    STAND_IN_NODE.handlers["chain_get_state_root_hash"] = handler
+    client = _get_client(
+        STAND_IN_NODE,
+        retry=NodeRetryPolicy(base_delay=100.0, max_delay=100.0),
+        timeout=0.2
+    )
+    with pytest.raises(NodeRpcProxyError):
+        await client.get_state_root_hash()
+    assert STAND_IN_NODE.posts == 1
+
+    await client.close()
@@ -0,0 +1,99 @@
+import asyncio
+import time
+
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr import NodeRpcPriority
+from pycspr.api.rpc import LimiterPolicy
+from pycspr.api.rpc import PriorityPolicy
+from pycspr.api.rpc import priority
+from pycspr.api.rpc.scheduling import RateCap
+from tests.utils.stand_in import StandInNode
+
+
+def _get_client(node: StandInNode, **kwargs) -> NodeRpcClient:
+    return NodeRpcClient(NodeRpcConnectionInfo("127.0.0.1", node.port), **kwargs)
+
+
+def _get_backfill(client: NodeRpcClient, count: int) -> list:
+    with priority(NodeRpcPriority.BACKFILL):
+        return [asyncio.create_task(client.get_state_root_hash()) for _ in range(count)]
+
+
+async def test_that_calls_are_interactive_by_default(STAND_IN_NODE: StandInNode):
+    client = _get_client(STAND_IN_NODE, priorities=PriorityPolicy())
+    limiter = client.proxy.pool.nodes[0].limiter
+    assert limiter.limit == client.proxy.connection_info.pool_size
+
+    await client.get_state_root_hash()
+
+    await client.close()
+
+
+async def test_that_interactive_calls_overtake_backfill(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.delay = 0.02
+    client = _get_client(
+        STAND_IN_NODE,
+        limiter=LimiterPolicy(initial_limit=1, min_limit=1, max_limit=1),
+        priorities=PriorityPolicy()
+    )
+    limiter = client.proxy.pool.nodes[0].limiter
+
+    backfill = _get_backfill(client, 5)
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(client.get_node_peers())
+    await asyncio.sleep(0.01)
+    assert limiter.queue_depths == {
+        NodeRpcPriority.INTERACTIVE: 1,
+        NodeRpcPriority.BACKFILL: 4,
+    }
+
+    await asyncio.gather(interactive, *backfill)
+    methods = [i for i, _ in STAND_IN_NODE.requests]
+    assert methods.index("info_get_peers") == 1
+
+    await client.close()
+
+
+async def test_that_rate_caps_apply_per_priority_class(STAND_IN_NODE: StandInNode):
+    client = _get_client(
+        STAND_IN_NODE,
+        priorities=PriorityPolicy(rate_caps={NodeRpcPriority.BACKFILL: 20.0})
+    )
+
+    started = time.monotonic()
+    backfill = _get_backfill(client, 5)
+    await client.get_node_peers()
+    assert time.monotonic() - started < 0.1
+
+    await asyncio.gather(*backfill)
+    assert time.monotonic() - started >= 0.2
+
+    await client.close()
+
+
+async def test_that_rate_caps_admit_bursts(STAND_IN_NODE: StandInNode):
+    client = _get_client(
+        STAND_IN_NODE,
+        priorities=PriorityPolicy(rate_caps={NodeRpcPriority.BACKFILL: 1.0}, burst=5)
+    )
+
+    started = time.monotonic()
+    await asyncio.gather(*_get_backfill(client, 5))
+    assert time.monotonic() - started < 0.5
+
+    await client.close()
+
+
+async def test_that_cancelled_calls_return_rate_cap_slots():
+    cap = RateCap(rate=10)
+    await cap.acquire()
+    waiters = [asyncio.create_task(cap.acquire()) for _ in range(5)]
+    await asyncio.sleep(0)
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+
+    started = time.monotonic()
+    await cap.acquire()
+    assert time.monotonic() - started < 0.15
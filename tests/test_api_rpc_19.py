@@ -0,0 +1,101 @@
+import gzip
+import zlib
+
+import pytest
+
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr.api.transport import StreamDecoder
+from pycspr.types.node import NodePeer
+from tests.fixtures.deploys import create_deploy
+from tests.utils.stand_in import StandInNode
+
+
+_PEERS = [{"address": f"127.0.0.1:{i}", "node_id": f"tls:{i:064x}"} for i in range(500)]
+
+
+def _get_client(node: StandInNode, **kwargs) -> NodeRpcClient:
+    return NodeRpcClient(NodeRpcConnectionInfo("127.0.0.1", node.port, **kwargs))
+
+
+async def test_that_compressed_responses_are_negotiated(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.compress = True
+    STAND_IN_NODE.handlers["info_get_peers"] = lambda _: {"peers": _PEERS}
+    client = _get_client(STAND_IN_NODE)
+
+    data = await client.get_node_peers()
+    assert len(data) == len(_PEERS)
+    assert isinstance(data[0], NodePeer)
+    stats = client.stats
+    assert stats.compressed_responses == 1
+    assert stats.response_wire_bytes * 5 < stats.response_bytes
+
+    await client.close()
+
+
+async def test_that_compressed_responses_can_be_declined(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.compress = True
+    STAND_IN_NODE.handlers["info_get_peers"] = lambda _: {"peers": _PEERS}
+    client = _get_client(STAND_IN_NODE, accept_compression=False)
+
+    assert len(await client.get_node_peers()) == len(_PEERS)
+    stats = client.stats
+    assert stats.compressed_responses == 0
+    assert stats.response_wire_bytes == stats.response_bytes
+
+    await client.close()
+
+
+async def test_that_deploys_are_not_compressed_by_default(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.handlers["account_put_deploy"] = lambda _: {"deploy_hash": "ab" * 32}
+    client = _get_client(STAND_IN_NODE)
+    await client.account_put_deploy(create_deploy())
+    assert STAND_IN_NODE.compressed_posts == 0
+
+    await client.close()
+
+
+async def test_that_deploys_can_be_compressed(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.handlers["account_put_deploy"] = lambda _: {"deploy_hash": "ab" * 32}
+    client = _get_client(STAND_IN_NODE, compress_requests=True)
+
+    assert await client.account_put_deploy(create_deploy()) == "ab" * 32
+    assert STAND_IN_NODE.compressed_posts == 1
+    stats = client.stats
+    assert stats.request_wire_bytes < stats.request_bytes
+
+    # Small request bodies are not compressed.
+    await client.get_state_root_hash()
+    assert STAND_IN_NODE.compressed_posts == 1
+
+    await client.close()
+
+
+async def test_that_stats_are_aggregated_across_pool(STAND_IN_NODE: StandInNode):
+    client = NodeRpcClient([NodeRpcConnectionInfo("127.0.0.1", STAND_IN_NODE.port)] * 3)
+    for _ in range(6):
+        await client.get_state_root_hash()
+    assert client.stats.requests == 6
+    assert client.stats.response_bytes == \
+        sum(i.transport.stats.response_bytes for i in client.proxy.pool.nodes)
+
+    await client.close()
+
+
+@pytest.mark.parametrize("compress", [
+    gzip.compress,
+    zlib.compress,
+    lambda i: zlib.compress(i)[2:-4],
+])
+def test_that_stream_decoder_decodes_chunks(compress):
+    body = b"".join(f"{i:08d}".encode() for i in range(10000))
+    encoded = compress(body)
+    encoding = "gzip" if encoded[:2] == b"\x1f\x8b" else "deflate"
+    decoder = StreamDecoder(encoding)
+    chunks = [decoder.feed(encoded[i:i + 100]) for i in range(0, len(encoded), 100)]
+    assert b"".join(chunks) + decoder.flush() == body
+
+
+def test_that_stream_decoder_rejects_unsupported_encodings():
+    with pytest.raises(ValueError):
+        StreamDecoder("br")
@@ -0,0 +1,116 @@
+import datetime
+import ipaddress
+import pathlib
+import ssl
+
+import aiohttp
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from pycspr import NodeRestConnectionInfo
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr import NodeSseConnectionInfo
+from pycspr.api.connection import get_address
+from tests.utils.stand_in import StandInNode
+
+
+@pytest.fixture()
+def CERTIFICATE(tmp_path: pathlib.Path) -> pathlib.Path:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = x509.CertificateBuilder() \
+        .subject_name(name) \
+        .issuer_name(name) \
+        .public_key(key.public_key()) \
+        .serial_number(x509.random_serial_number()) \
+        .not_valid_before(now - datetime.timedelta(minutes=1)) \
+        .not_valid_after(now + datetime.timedelta(days=1)) \
+        .add_extension(
+            x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]),
+            critical=False
+        ) \
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True) \
+        .sign(key, hashes.SHA256())
+
+    (tmp_path / "cert.pem").write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    (tmp_path / "key.pem").write_bytes(key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()
+    ))
+
+    return tmp_path / "cert.pem"
+
+
+@pytest.fixture()
+async def TLS_STAND_IN_NODE(CERTIFICATE: pathlib.Path) -> StandInNode:
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(CERTIFICATE, CERTIFICATE.parent / "key.pem")
+    node = StandInNode(base_path="/casper/v1", ssl_context=context)
+    await node.start()
+    yield node
+    await node.stop()
+
+
+def _get_client(node: StandInNode, **kwargs) -> NodeRpcClient:
+    return NodeRpcClient(NodeRpcConnectionInfo(
+        "127.0.0.1",
+        node.port,
+        scheme="https",
+        base_path="/casper/v1/",
+        **kwargs
+    ))
+
+
+def test_that_addresses_default_to_plain_http():
+    assert get_address(NodeRpcConnectionInfo(), "/rpc") == "http://localhost:7777/rpc"
+    assert get_address(NodeRestConnectionInfo()) == "http://localhost:8888"
+    assert get_address(NodeSseConnectionInfo(), "/events") == "http://localhost:9999/events"
+
+
+def test_that_addresses_include_scheme_and_base_path():
+    info = NodeRpcConnectionInfo("rpc.example.com", 443, scheme="https", base_path="mainnet")
+    assert get_address(info, "/rpc") == "https://rpc.example.com:443/mainnet/rpc"
+
+
+async def test_that_calls_are_dispatched_over_tls(
+    TLS_STAND_IN_NODE: StandInNode,
+    CERTIFICATE: pathlib.Path
+):
+    client = _get_client(
+        TLS_STAND_IN_NODE,
+        headers={"Authorization": "an-api-key"},
+        verify=str(CERTIFICATE)
+    )
+    assert client.proxy.address.startswith("https://")
+
+    for _ in range(10):
+        assert await client.get_state_root_hash() == bytes.fromhex("ab" * 32)
+    assert all(i["Authorization"] == "an-api-key" for i in TLS_STAND_IN_NODE.headers)
+
+    # Connection, and thus TLS session, is kept alive across calls.
+    assert len(TLS_STAND_IN_NODE.connections) == 1
+
+    await client.close()
+
+
+async def test_that_untrusted_certificates_are_rejected(TLS_STAND_IN_NODE: StandInNode):
+    client = _get_client(TLS_STAND_IN_NODE)
+    with pytest.raises(aiohttp.ClientConnectorCertificateError):
+        await client.get_state_root_hash()
+    assert TLS_STAND_IN_NODE.posts == 0
+
+    await client.close()
+
+
+async def test_that_verification_can_be_disabled(TLS_STAND_IN_NODE: StandInNode):
+    client = _get_client(TLS_STAND_IN_NODE, verify=False)
+    await client.get_state_root_hash()
+
+    await client.close()
@@ -0,0 +1,143 @@
+import asyncio
+import socket
+
+import pytest
+
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr.api.rpc import Discovery
+from pycspr.api.rpc import DiscoveryPolicy
+from tests.utils.stand_in import StandInNode
+
+
+@pytest.fixture()
+async def STAND_IN_NODES() -> list:
+    nodes = [StandInNode() for _ in range(4)]
+    for node in nodes:
+        await node.start()
+    yield nodes
+    for node in nodes:
+        await node.stop()
+
+
+def _get_dead_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _set_peers(node: StandInNode, ports: list):
+    # Peer network addresses encode RPC ports so that policy can resolve them.
+    peers = [{"address": f"127.0.0.1:{i}", "node_id": f"tls:{i:064x}"} for i in ports]
+    node.handlers["info_get_peers"] = lambda _: {"peers": peers}
+
+
+def _resolve(peer_address: str, seed: NodeRpcConnectionInfo) -> NodeRpcConnectionInfo:
+    host, _, port = peer_address.rpartition(":")
+
+    return NodeRpcConnectionInfo(host, int(port))
+
+
+def _get_discovery(seed: StandInNode, **kwargs) -> Discovery:
+    return Discovery(
+        NodeRpcConnectionInfo("127.0.0.1", seed.port),
+        DiscoveryPolicy(resolve=_resolve, **kwargs)
+    )
+
+
+async def test_that_nodes_are_discovered_and_ranked_by_latency(STAND_IN_NODES: list):
+    seed, slow, fast, _ = STAND_IN_NODES
+    seed.delay, slow.delay, fast.delay = 0.02, 0.05, 0.0
+    dead_port = _get_dead_port()
+    _set_peers(seed, [slow.port, fast.port, dead_port])
+
+    discovery = _get_discovery(seed, probe_timeout=0.5)
+    live = await discovery.discover()
+    assert [i.port for i in live] == [fast.port, seed.port, slow.port]
+    assert [i.connection_info.port for i in discovery.probed if i.latency is None] == [dead_port]
+
+
+async def test_that_discovery_expands_peers_of_peers(STAND_IN_NODES: list):
+    seed, hop_1, hop_2, hop_3 = STAND_IN_NODES
+    _set_peers(seed, [hop_1.port, seed.port])
+    _set_peers(hop_1, [hop_2.port])
+    _set_peers(hop_2, [hop_3.port])
+
+    live = await _get_discovery(seed, max_depth=2).discover()
+    assert sorted(i.port for i in live) == sorted([seed.port, hop_1.port, hop_2.port])
+
+
+async def test_that_live_set_is_bounded(STAND_IN_NODES: list):
+    seed = STAND_IN_NODES[0]
+    _set_peers(seed, [i.port for i in STAND_IN_NODES[1:]])
+
+    live = await _get_discovery(seed, max_nodes=2).discover()
+    assert len(live) == 2
+
+
+async def test_that_peers_default_to_seed_port(STAND_IN_NODE: StandInNode):
+    _set_peers(STAND_IN_NODE, [35000])
+    discovery = Discovery(NodeRpcConnectionInfo("localhost", STAND_IN_NODE.port))
+    candidates = await discovery._expand()
+    assert [(i.host, i.port) for i in candidates] == [
+        ("localhost", STAND_IN_NODE.port),
+        ("127.0.0.1", STAND_IN_NODE.port),
+    ]
+
+
+async def test_that_reranking_updates_pool(STAND_IN_NODES: list):
+    seed, slow, fast, _ = STAND_IN_NODES
+    _set_peers(seed, [slow.port, fast.port])
+    discovery = _get_discovery(seed)
+    client = NodeRpcClient(await discovery.discover())
+    pool = client.proxy.pool
+    node = pool.nodes[0]
+    assert len(pool.nodes) == 3
+
+    # Node departs.
+    _set_peers(seed, [fast.port])
+    await discovery.rerank(pool)
+    assert sorted(i.connection_info.port for i in pool.nodes) == sorted([seed.port, fast.port])
+    if node.connection_info.port != slow.port:
+        assert node in pool.nodes
+
+    await client.close()
+
+
+async def test_that_reranking_is_periodic(STAND_IN_NODE: StandInNode):
+    discovery = _get_discovery(STAND_IN_NODE, rerank_interval=0.01)
+    reranked = asyncio.Event()
+
+    async def discover() -> list:
+        reranked.set()
+        return []
+
+    discovery.discover = discover
+    discovery.start()
+    await asyncio.wait_for(reranked.wait(), 5.0)
+    await discovery.stop()
+
+
+async def test_that_departed_nodes_are_closed_once_drained(STAND_IN_NODES: list):
+    STAND_IN_NODES[0].delay = 0.2
+    client = NodeRpcClient([NodeRpcConnectionInfo("127.0.0.1", i.port) for i in STAND_IN_NODES])
+    pool = client.proxy.pool
+    try:
+        call = asyncio.create_task(client.get_state_root_hash())
+        await asyncio.sleep(0.05)
+        departed = pool.nodes[0]
+        assert departed.outstanding == 1
+
+        # Departed node rejoining prior to draining is reinstated.
+        pool.update([i.connection_info for i in pool.nodes[1:]])
+        pool.update([departed.connection_info] + [i.connection_info for i in pool.nodes])
+        assert pool.nodes[0] is departed
+
+        pool.update([i.connection_info for i in pool.nodes[1:]])
+        assert departed.transport._session is not None
+        await call
+        await asyncio.gather(*pool._closing)
+        assert departed.transport._session is None
+        assert pool._retired == {}
+    finally:
+        await client.close()
@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr.api.rpc import AutoBatchPolicy
+from pycspr.api.rpc import FreshnessPolicy
+from pycspr.api.rpc import min_height
+from tests.utils.stand_in import StandInNode
+
+
+@pytest.fixture()
+async def STAND_IN_NODES() -> list:
+    nodes = [StandInNode() for _ in range(3)]
+    for node in nodes:
+        await node.start()
+    yield nodes
+    for node in nodes:
+        await node.stop()
+
+
+def _set_height(node: StandInNode, height: int):
+    node.handlers["info_get_status"] = \
+        lambda _: {"last_added_block_info": {"height": height}}
+
+
+def _get_client(nodes: list, **kwargs) -> NodeRpcClient:
+    return NodeRpcClient(
+        [NodeRpcConnectionInfo("127.0.0.1", i.port) for i in nodes],
+        freshness=FreshnessPolicy(**kwargs)
+    )
+
+
+def _count_reads(node: StandInNode) -> int:
+    return len([i for i, _ in node.requests if i == "chain_get_state_root_hash"])
+
+
+async def test_that_reads_at_height_are_routed_to_fresh_nodes(STAND_IN_NODES: list):
+    for node, height in zip(STAND_IN_NODES, (100, 90, 110)):
+        _set_height(node, height)
+    client = _get_client(STAND_IN_NODES)
+    try:
+        for _ in range(6):
+            await client.get_state_root_hash(95)
+        assert [_count_reads(i) for i in STAND_IN_NODES] == [3, 0, 3]
+        assert [i.height for i in client.proxy.pool.nodes] == [100, 90, 110]
+
+        for _ in range(3):
+            await client.get_state_root_hash(105)
+        assert [_count_reads(i) for i in STAND_IN_NODES] == [3, 0, 6]
+    finally:
+        await client.close()
+
+
+async def test_that_scoped_reads_are_routed_to_fresh_nodes(STAND_IN_NODES: list):
+    for node, height in zip(STAND_IN_NODES, (100, 120, 90)):
+        _set_height(node, height)
+    client = _get_client(STAND_IN_NODES)
+    try:
+        with min_height(110):
+            for _ in range(3):
+                await client.get_state_root_hash()
+            with min_height(50):
+                await client.get_state_root_hash()
+        assert [_count_reads(i) for i in STAND_IN_NODES] == [0, 4, 0]
+    finally:
+        await client.close()
+
+
+async def test_that_routing_fails_open_when_no_node_is_fresh(STAND_IN_NODES: list):
+    for node in STAND_IN_NODES:
+        _set_height(node, 10)
+    client = _get_client(STAND_IN_NODES, min_refresh_interval=60.0)
+    try:
+        for _ in range(3):
+            await client.get_state_root_hash(20)
+        # A node that served the read has evidently added the block.
+        assert [_count_reads(i) for i in STAND_IN_NODES] == [3, 0, 0]
+        assert [i.height for i in client.proxy.pool.nodes] == [20, 10, 10]
+    finally:
+        await client.close()
+
+
+async def test_that_heights_are_refreshed_on_demand(STAND_IN_NODES: list):
+    for node, height in zip(STAND_IN_NODES, (10, 10, 10)):
+        _set_height(node, height)
+    client = _get_client(STAND_IN_NODES, min_refresh_interval=0.0)
+    try:
+        await client.get_state_root_hash(10)
+        _set_height(STAND_IN_NODES[1], 11)
+        await client.get_state_root_hash(11)
+        assert [_count_reads(i) for i in STAND_IN_NODES][1] == 1
+        assert client.proxy.pool.nodes[1].height == 11
+    finally:
+        await client.close()
+
+
+async def test_that_observed_heights_never_regress(STAND_IN_NODES: list):
+    client = _get_client(STAND_IN_NODES)
+    pool = client.proxy.pool
+    try:
+        pool.observe_height(pool.nodes[0].address, 10)
+        pool.observe_height(pool.nodes[0].address, 5)
+        assert [i.height for i in pool.nodes] == [10, None, None]
+    finally:
+        await client.close()
+
+
+async def test_that_batched_reads_are_routed_to_fresh_nodes(STAND_IN_NODES: list):
+    for node, height in zip(STAND_IN_NODES, (100, 90, 110)):
+        _set_height(node, height)
+    client = NodeRpcClient(
+        [NodeRpcConnectionInfo("127.0.0.1", i.port) for i in STAND_IN_NODES],
+        auto_batch=AutoBatchPolicy(window=0.01),
+        freshness=FreshnessPolicy()
+    )
+    try:
+        await asyncio.gather(*[client.get_state_root_hash(105) for _ in range(3)])
+        assert [_count_reads(i) for i in STAND_IN_NODES] == [0, 0, 3]
+
+        async with client.batch() as batch:
+            for _ in range(4):
+                batch.get_state_root_hash(95)
+            with min_height(105):
+                batch.get_state_root_hash()
+        assert _count_reads(STAND_IN_NODES[1]) == 0
+        assert _count_reads(STAND_IN_NODES[2]) >= 4
+    finally:
+        await client.close()
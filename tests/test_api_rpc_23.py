@@ -0,0 +1,139 @@
+import pytest
+
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr import NodeRpcSelectionStrategy
+from pycspr.api.rpc import affinity
+from pycspr.api.rpc.affinity import get_affinity_key
+from pycspr.api.rpc.affinity import HashRing
+from tests.utils.stand_in import StandInNode
+
+
+_STATE_ROOT_HASH = bytes.fromhex("ab" * 32)
+
+
+@pytest.fixture()
+async def STAND_IN_NODES() -> list:
+    nodes = [StandInNode() for _ in range(4)]
+    for node in nodes:
+        await node.start()
+    yield nodes
+    for node in nodes:
+        await node.stop()
+
+
+def _get_client(nodes: list) -> NodeRpcClient:
+    return NodeRpcClient(
+        [NodeRpcConnectionInfo("127.0.0.1", i.port) for i in nodes],
+        strategy=NodeRpcSelectionStrategy.CONSISTENT_HASH
+    )
+
+
+def _get_keys_served(node: StandInNode) -> set:
+    return {params["key"] for method, params in node.requests if method == "state_get_item"}
+
+
+def _get_owners(ring: HashRing, keys: list) -> dict:
+    return {i: next(ring.walk(i)) for i in keys}
+
+
+def test_that_ring_rebalances_minimally():
+    keys = [f"account-hash-{i:064x}" for i in range(2000)]
+    ring = HashRing()
+    for member in ("a", "b", "c"):
+        ring.add(member)
+    before = _get_owners(ring, keys)
+    assert all(len([k for k, v in before.items() if v == m]) > 400 for m in ("a", "b", "c"))
+
+    # Joining member takes keys only from others.
+    ring.add("d")
+    after = _get_owners(ring, keys)
+    moved = [k for k in keys if before[k] != after[k]]
+    assert all(after[k] == "d" for k in moved)
+    assert 300 < len(moved) < 700
+
+    # Leaving member's keys move whilst all others stay put.
+    ring.remove("a")
+    after_leave = _get_owners(ring, keys)
+    assert all(after_leave[k] == after[k] for k in keys if after[k] != "a")
+    assert "a" not in after_leave.values()
+
+
+def test_that_ring_walk_yields_distinct_members():
+    ring = HashRing()
+    for member in ("a", "b", "c"):
+        ring.add(member)
+    assert sorted(ring.walk("key")) == ["a", "b", "c"]
+    assert list(HashRing().walk("key")) == []
+
+
+async def test_that_repeat_queries_hit_same_node(STAND_IN_NODES: list):
+    client = _get_client(STAND_IN_NODES)
+    keys = [f"account-hash-{i:064x}" for i in range(40)]
+    try:
+        for _ in range(3):
+            for key in keys:
+                await client.get_state_item(key, [], _STATE_ROOT_HASH)
+        served = [_get_keys_served(i) for i in STAND_IN_NODES]
+        assert sum(len(i) for i in served) == len(keys)
+        assert len([i for i in served if i]) > 1
+    finally:
+        await client.close()
+
+
+async def test_that_unavailable_owner_is_skipped(STAND_IN_NODES: list):
+    client = _get_client(STAND_IN_NODES)
+    key = "account-hash-" + "01" * 32
+    try:
+        await client.get_state_item(key, [], _STATE_ROOT_HASH)
+        owner = [i for i in STAND_IN_NODES if _get_keys_served(i)][0]
+        owner_node = next(
+            i for i in client.proxy.pool.nodes if i.connection_info.port == owner.port
+        )
+        owner_node.ejected_until = float("inf")
+        await client.get_state_item(key, [], _STATE_ROOT_HASH)
+        await client.get_state_item(key, [], _STATE_ROOT_HASH)
+        assert len([i for i in STAND_IN_NODES if _get_keys_served(i)]) == 2
+    finally:
+        await client.close()
+
+
+async def test_that_pool_updates_rebalance_minimally(STAND_IN_NODES: list):
+    client = _get_client(STAND_IN_NODES[:3])
+    keys = [f"account-hash-{i:064x}" for i in range(200)]
+    pool = client.proxy.pool
+    try:
+        keys = [get_affinity_key({"key": i}) for i in keys]
+        before = {k: next(pool.ring.walk(k)) for k in keys}
+        departed = pool.nodes[0].address
+        pool.update([i.connection_info for i in pool.nodes[1:]])
+        after = {k: next(pool.ring.walk(k)) for k in before}
+        assert all(after[k] == v for k, v in before.items() if v != departed)
+    finally:
+        await client.close()
+
+
+async def test_that_explicit_affinity_routes_composite_calls(STAND_IN_NODES: list):
+    client = _get_client(STAND_IN_NODES)
+    try:
+        with affinity("account-hash-" + "02" * 32):
+            for _ in range(4):
+                await client.get_state_root_hash()
+        assert sorted(len(i.requests) for i in STAND_IN_NODES) == [0, 0, 0, 4]
+    finally:
+        await client.close()
+
+
+async def test_that_batched_queries_are_routed_by_key(STAND_IN_NODES: list):
+    client = _get_client(STAND_IN_NODES)
+    keys = [f"account-hash-{i:064x}" for i in range(20)]
+    try:
+        for _ in range(2):
+            async with client.batch() as batch:
+                for key in keys:
+                    batch.get_state_item(key, [], _STATE_ROOT_HASH)
+        served = [_get_keys_served(i) for i in STAND_IN_NODES]
+        assert sum(len(i) for i in served) == len(keys)
+        assert sum(i.posts for i in STAND_IN_NODES) <= 2 * len(STAND_IN_NODES)
+    finally:
+        await client.close()
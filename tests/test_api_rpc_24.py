@@ -0,0 +1,112 @@
+import concurrent.futures
+
+import pytest
+
+from pycspr import NodeRpcConnectionInfo
+from pycspr import NodeRpcGlobalStateCache
+from pycspr import NodeRpcStateCachePolicy
+from pycspr import NodeRpcSyncClient
+from pycspr.api.sync import EventLoopThread
+from pycspr.api.sync import get_event_loop_thread
+from tests.test_api_rpc_29 import _get_auction_info
+from tests.test_api_rpc_29 import _get_bid
+from tests.utils.stand_in import StandInNode
+
+
+@pytest.fixture()
+def STAND_IN_NODE_THREADED() -> StandInNode:
+    # Stand-in is served upon its own loop so that tests may block.
+    loop_thread = EventLoopThread()
+    node = StandInNode()
+    loop_thread.invoke(node.start())
+    yield node
+    loop_thread.invoke(node.stop())
+    loop_thread.stop()
+
+
+def _get_client(node: StandInNode) -> NodeRpcSyncClient:
+    return NodeRpcSyncClient(NodeRpcConnectionInfo("127.0.0.1", node.port))
+
+
+def test_that_methods_block(STAND_IN_NODE_THREADED: StandInNode):
+    with _get_client(STAND_IN_NODE_THREADED) as client:
+        assert client.get_state_root_hash() == bytes.fromhex("ab" * 32)
+        assert client.get_account_balance.__doc__ == client.client.get_account_balance.__doc__
+
+
+def test_that_threads_share_pooled_connections(STAND_IN_NODE_THREADED: StandInNode):
+    STAND_IN_NODE_THREADED.delay = 0.01
+    with _get_client(STAND_IN_NODE_THREADED) as client:
+        with concurrent.futures.ThreadPoolExecutor(16) as executor:
+            results = list(executor.map(lambda _: client.get_state_root_hash(), range(64)))
+    assert results == [bytes.fromhex("ab" * 32)] * 64
+    assert STAND_IN_NODE_THREADED.posts == 64
+    assert STAND_IN_NODE_THREADED.max_in_flight > 1
+    assert len(STAND_IN_NODE_THREADED.connections) <= 16
+
+
+def test_that_clients_share_process_wide_loop(STAND_IN_NODE_THREADED: StandInNode):
+    with _get_client(STAND_IN_NODE_THREADED) as client_1, \
+         _get_client(STAND_IN_NODE_THREADED) as client_2:
+        assert client_1.loop_thread is client_2.loop_thread is get_event_loop_thread()
+
+
+def test_that_blocking_within_loop_thread_is_refused():
+    loop_thread = EventLoopThread()
+    outcome = concurrent.futures.Future()
+
+    async def invoke_blocking():
+        async def noop():
+            pass
+        try:
+            loop_thread.invoke(noop())
+        except RuntimeError as err:
+            outcome.set_result(err)
+
+    try:
+        loop_thread.invoke(invoke_blocking())
+        assert isinstance(outcome.result(1.0), RuntimeError)
+    finally:
+        loop_thread.stop()
+    assert not loop_thread.is_running
+
+
+def test_that_iterators_block(STAND_IN_NODE_THREADED: StandInNode):
+    STAND_IN_NODE_THREADED.handlers["state_get_auction_info"] = \
+        lambda _: _get_auction_info(50)
+    with _get_client(STAND_IN_NODE_THREADED) as client:
+        bids = client.iter_auction_bids(decode=False)
+        assert next(bids) == _get_bid(0)
+        assert len(list(bids)) == 49
+
+        # Abandoned iterators are closed.
+        bids = client.iter_auction_bids(decode=False)
+        next(bids)
+        bids.close()
+
+
+def test_that_batches_block(STAND_IN_NODE_THREADED: StandInNode):
+    with _get_client(STAND_IN_NODE_THREADED) as client:
+        with client.batch() as batch:
+            futures = [batch.get_state_root_hash() for _ in range(5)]
+        assert [i.result() for i in futures] == [bytes.fromhex("ab" * 32)] * 5
+        assert STAND_IN_NODE_THREADED.posts == 1
+
+        with pytest.raises(AttributeError):
+            client.batch().batch
+
+
+def test_that_state_queries_are_cached(STAND_IN_NODE_THREADED: StandInNode, tmp_path):
+    # Cache is opened upon calling thread but queried from the client's loop thread.
+    cache = NodeRpcGlobalStateCache(NodeRpcStateCachePolicy(str(tmp_path / "cache.db")))
+    key, state_root_hash = "hash-" + "33" * 32, bytes.fromhex("ab" * 32)
+    try:
+        connection_info = NodeRpcConnectionInfo("127.0.0.1", STAND_IN_NODE_THREADED.port)
+        with NodeRpcSyncClient(connection_info, state_cache=cache) as client:
+            for _ in range(3):
+                assert client.get_state_item(key, [], state_root_hash) == {"key": key}
+        assert len([i for i in STAND_IN_NODE_THREADED.requests if i[0] == "state_get_item"]) == 1
+        assert cache.stats.hits == 2
+        assert len(cache) == 1
+    finally:
+        cache.close()
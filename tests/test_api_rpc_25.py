@@ -0,0 +1,68 @@
+from pycspr import NodeSession
+from pycspr import NodeSessionConnectionInfo
+from pycspr.api import constants
+from tests.fixtures.deploys import create_deploy
+from tests.utils.stand_in import StandInNode
+
+
+def _get_session(node: StandInNode, **kwargs) -> NodeSession:
+    node.handlers[constants.SPECULATIVE_RPC_EXEC_DEPLOY] = \
+        lambda _: {"execution_result": {"Success": {}}}
+
+    return NodeSession(
+        NodeSessionConnectionInfo(
+            "127.0.0.1",
+            port_rpc=node.port,
+            port_speculative_rpc=node.port,
+            headers={"X-Api-Key": "a-key"},
+            **kwargs
+        )
+    )
+
+
+async def test_that_clients_share_connection_pools(STAND_IN_NODE: StandInNode):
+    async with _get_session(STAND_IN_NODE) as session:
+        assert session.rpc.proxy.pool.nodes[0].transport is session.transport
+        assert session.speculative_rpc.proxy.transport is session.transport
+        assert session.rest.proxy.transport is session.transport
+        assert session.sse.proxy.session is session.http_session
+        assert session.sse.rpc is session.rpc
+
+        await session.rpc.get_state_root_hash()
+        await session.speculative_rpc.speculative_exec(create_deploy())
+        await session.rpc.get_state_root_hash()
+
+    assert STAND_IN_NODE.posts == 3
+    assert len(STAND_IN_NODE.connections) == 1
+    assert all(i["X-Api-Key"] == "a-key" for i in STAND_IN_NODE.headers)
+
+
+async def test_that_closing_clients_leaves_shared_pools_open(STAND_IN_NODE: StandInNode):
+    session = _get_session(STAND_IN_NODE)
+    try:
+        await session.open()
+        await session.rpc.get_state_root_hash()
+        await session.speculative_rpc.close()
+        await session.rpc.get_state_root_hash()
+        assert len(STAND_IN_NODE.connections) == 1
+    finally:
+        await session.close()
+    assert session.transport._session is None
+
+
+def test_that_node_description_is_projected_per_api():
+    session = NodeSession(
+        NodeSessionConnectionInfo(
+            "node.example",
+            scheme="https",
+            base_path="/casper",
+            verify=False,
+            pool_size=4
+        )
+    )
+    assert session.rpc.proxy.address == "https://node.example:7777/casper/rpc"
+    assert session.speculative_rpc.proxy.address == "https://node.example:7778/casper/rpc"
+    assert session.rest.proxy.address == "https://node.example:8888/casper"
+    assert session.sse.proxy.address == "https://node.example:9999/casper/events"
+    assert session.transport.pool_size == 4
+    assert session.http_session.verify is False
@@ -0,0 +1,76 @@
+import time
+
+import pytest
+
+from pycspr import NodeRpcCassette
+from pycspr import NodeRpcCassetteError
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr import NodeRpcReplayTransport
+from tests.utils.stand_in import StandInNode
+
+
+def _get_replay_client(cassette: NodeRpcCassette, speed: float = None) -> NodeRpcClient:
+    return NodeRpcClient(
+        NodeRpcConnectionInfo("127.0.0.1", 1),
+        transport=NodeRpcReplayTransport(cassette, speed)
+    )
+
+
+async def _record(node: StandInNode) -> NodeRpcCassette:
+    cassette = NodeRpcCassette()
+    client = NodeRpcClient(NodeRpcConnectionInfo("127.0.0.1", node.port), cassette=cassette)
+    try:
+        await client.get_state_root_hash()
+        await client.get_state_item("hash-" + "cd" * 32)
+        async with client.batch() as batch:
+            items = [batch.get_state_item(f"hash-{i:064x}") for i in range(3)]
+        assert [i.result()["key"] for i in items] == [f"hash-{i:064x}" for i in range(3)]
+    finally:
+        await client.close()
+
+    return cassette
+
+
+async def test_that_recorded_calls_are_replayed_without_a_node(
+    STAND_IN_NODE: StandInNode,
+    tmp_path
+):
+    cassette = await _record(STAND_IN_NODE)
+    assert STAND_IN_NODE.posts == 5
+    assert len(cassette) == 9
+    assert all(i.latency > 0 for i in cassette.interactions)
+
+    cassette.save(tmp_path / "session.cassette")
+    client = _get_replay_client(NodeRpcCassette.load(tmp_path / "session.cassette"))
+    try:
+        assert await client.get_state_root_hash() == bytes.fromhex("ab" * 32)
+        assert (await client.get_state_item("hash-" + "cd" * 32))["key"] == "hash-" + "cd" * 32
+        async with client.batch() as batch:
+            items = [batch.get_state_item(f"hash-{i:064x}") for i in range(3)]
+        assert [i.result()["key"] for i in items] == [f"hash-{i:064x}" for i in range(3)]
+    finally:
+        await client.close()
+    assert STAND_IN_NODE.posts == 5
+
+
+async def test_that_replay_honours_recorded_timings(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.delay = 0.1
+    cassette = await _record(STAND_IN_NODE)
+
+    for speed, lower, upper in ((None, 0.0, 0.05), (1.0, 0.1, 1.0), (10.0, 0.01, 0.05)):
+        client = _get_replay_client(cassette, speed)
+        started = time.perf_counter()
+        await client.get_state_root_hash()
+        elapsed = time.perf_counter() - started
+        await client.close()
+        assert lower <= elapsed < upper
+
+
+async def test_that_unrecorded_call_raises_error(STAND_IN_NODE: StandInNode):
+    client = _get_replay_client(await _record(STAND_IN_NODE))
+    try:
+        with pytest.raises(NodeRpcCassetteError):
+            await client.get_state_item("hash-" + "ef" * 32)
+    finally:
+        await client.close()
@@ -0,0 +1,91 @@
+import asyncio
+import time
+
+import pytest
+
+from pycspr import NodeRestClient
+from pycspr import NodeRestConnectionInfo
+from pycspr.api.rest import scrape_many
+from tests.utils.stand_in import StandInNode
+
+
+@pytest.fixture()
+async def STAND_IN_NODES() -> list:
+    nodes = [StandInNode() for _ in range(4)]
+    for node in nodes:
+        await node.start()
+    yield nodes
+    for node in nodes:
+        await node.stop()
+
+
+async def test_that_rest_calls_are_non_blocking_and_pooled(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.compress = True
+    STAND_IN_NODE.delay = 0.1
+    client = NodeRestClient(NodeRestConnectionInfo("127.0.0.1", STAND_IN_NODE.port))
+    try:
+        started = time.monotonic()
+        status, metrics, changes = await asyncio.gather(
+            client.get_node_status(decode=False),
+            client.get_node_metrics(),
+            client.get_validator_changes(decode=False)
+        )
+        assert time.monotonic() - started < 0.25
+        assert status == {"api_version": "1.0.0"}
+        assert metrics == ["a_metric 1", "b_metric 2"]
+        assert changes == []
+        assert STAND_IN_NODE.max_in_flight == 3
+
+        await client.get_node_metric("b_metric")
+        assert client.stats.requests == 4
+        assert client.stats.compressed_responses == 4
+    finally:
+        await client.close()
+
+
+async def test_that_scrapes_stream_back_as_each_completes(STAND_IN_NODES: list):
+    STAND_IN_NODES[0].delay = 0.2
+    STAND_IN_NODES[1].resources.pop("metrics")
+    connection_infos = [NodeRestConnectionInfo("127.0.0.1", i.port) for i in STAND_IN_NODES]
+    connection_infos.append(NodeRestConnectionInfo("127.0.0.1", 1))
+
+    results = [i async for i in scrape_many(connection_infos, timeout=0.1)]
+
+    assert len(results) == 5
+    assert results[-1].connection_info == connection_infos[0]
+    assert isinstance(results[-1].error, asyncio.TimeoutError)
+    by_port = {i.connection_info.port: i for i in results}
+    assert by_port[1].error is not None
+    assert by_port[STAND_IN_NODES[1].port].error is not None
+    for node in STAND_IN_NODES[2:]:
+        result = by_port[node.port]
+        assert result.error is None
+        assert result.status == {"api_version": "1.0.0"}
+        assert result.metrics == ["a_metric 1", "b_metric 2"]
+        assert result.validator_changes == []
+
+
+async def test_that_scrape_parallelism_is_bounded(STAND_IN_NODES: list):
+    for node in STAND_IN_NODES:
+        node.delay = 0.05
+    connection_infos = [NodeRestConnectionInfo("127.0.0.1", i.port) for i in STAND_IN_NODES]
+
+    started = time.monotonic()
+    results = [i async for i in scrape_many(connection_infos, max_concurrent=2)]
+
+    assert time.monotonic() - started >= 0.1
+    assert all(i.error is None for i in results)
+    assert all(i.gets == 3 for i in STAND_IN_NODES)
+
+
+async def test_that_each_node_is_scraped_as_per_its_connection_info(STAND_IN_NODES: list):
+    connection_infos = [
+        NodeRestConnectionInfo("127.0.0.1", node.port, headers={"Authorization": f"key-{i}"})
+        for i, node in enumerate(STAND_IN_NODES)
+    ]
+
+    results = [i async for i in scrape_many(connection_infos)]
+
+    assert all(i.error is None for i in results)
+    for i, node in enumerate(STAND_IN_NODES):
+        assert [j["Authorization"] for j in node.headers] == [f"key-{i}"] * 3
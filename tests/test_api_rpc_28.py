@@ -0,0 +1,92 @@
+import pytest
+
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr import NodeRpcProxyError
+from pycspr import serializer
+from pycspr.api.rpc import OffloadPolicy
+from pycspr.types.node import Block
+from tests.utils.stand_in import StandInError
+from tests.utils.stand_in import StandInNode
+
+
+_PUBLIC_KEY = "01" + "aa" * 32
+
+
+def _get_block(deploys: int) -> dict:
+    return {
+        "hash": "11" * 32,
+        "header": {
+            "accumulated_seed": "22" * 32,
+            "body_hash": "33" * 32,
+            "era_end": None,
+            "era_id": 7,
+            "height": 100,
+            "parent_hash": "44" * 32,
+            "protocol_version": "1.5.2",
+            "random_bit": True,
+            "state_root_hash": "55" * 32,
+            "timestamp": "2023-01-01T00:00:00.000Z"
+        },
+        "body": {
+            "proposer": _PUBLIC_KEY,
+            "deploy_hashes": [f"{i:064x}" for i in range(deploys)],
+            "transfer_hashes": []
+        },
+        "proofs": [{"public_key": _PUBLIC_KEY, "signature": "01" + "77" * 64}],
+    }
+
+
+def _get_client(node: StandInNode, block: dict, **kwargs) -> NodeRpcClient:
+    node.handlers["chain_get_block"] = lambda _: {"block": block}
+
+    return NodeRpcClient(
+        NodeRpcConnectionInfo("127.0.0.1", node.port),
+        offload=OffloadPolicy(max_workers=1, **kwargs)
+    )
+
+
+async def test_that_large_responses_are_decoded_in_worker(STAND_IN_NODE: StandInNode):
+    block = _get_block(1000)
+    client = _get_client(STAND_IN_NODE, block, min_size=16 * 1024)
+    try:
+        assert await client.get_block() == serializer.from_json(Block, block)
+        assert client.proxy.offloader.offloaded == 1
+
+        assert await client.get_block(decode=False) == block
+        assert client.proxy.offloader.offloaded == 1
+
+        STAND_IN_NODE.handlers["chain_get_block"] = lambda _: {"block": _get_block(10)}
+        assert len((await client.get_block()).body.deploy_hashes) == 10
+        assert client.proxy.offloader.offloaded == 1
+    finally:
+        await client.close()
+
+
+async def test_that_endpoint_responses_are_decoded_in_worker(STAND_IN_NODE: StandInNode):
+    block = _get_block(10)
+    client = _get_client(STAND_IN_NODE, block, endpoints={"chain_get_block"}, min_size=None)
+    try:
+        assert await client.get_block_height() == 100
+        assert await client.get_block() == serializer.from_json(Block, block)
+        assert client.proxy.offloader.offloaded == 2
+
+        # Workers are spawned, not forked from a process running an event loop.
+        assert client.proxy.offloader._executor._mp_context.get_start_method() == "spawn"
+    finally:
+        await client.close()
+
+
+async def test_that_errors_are_raised_from_worker(STAND_IN_NODE: StandInNode):
+    client = _get_client(STAND_IN_NODE, None, endpoints={"chain_get_block"})
+
+    def fail(_):
+        raise StandInError(-32001, "block not known")
+
+    STAND_IN_NODE.handlers["chain_get_block"] = fail
+    try:
+        with pytest.raises(NodeRpcProxyError) as err:
+            await client.get_block(10)
+        assert err.value.code == -32001
+    finally:
+        await client.close()
@@ -0,0 +1,115 @@
+import asyncio
+import json
+
+import pytest
+
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr import NodeRpcProxyError
+from pycspr import serializer
+from pycspr.api.rpc import ArrayStream
+from pycspr.types.node import AuctionBidByValidator
+from tests.utils.stand_in import StandInError
+from tests.utils.stand_in import StandInNode
+
+
+def _get_bid(index: int) -> dict:
+    return {
+        "public_key": "01" + f"{index:064x}",
+        "bid": {
+            "bonding_purse": f"uref-{index:064x}-007",
+            "delegation_rate": index % 100,
+            "delegators": [],
+            "inactive": False,
+            "staked_amount": str(index * 1000)
+        }
+    }
+
+
+def _get_auction_info(bids: int) -> dict:
+    return {
+        "auction_state": {
+            "block_height": 100,
+            "bids": [_get_bid(i) for i in range(bids)],
+            "era_validators": [],
+            "state_root_hash": "55" * 32
+        }
+    }
+
+
+def _get_client(node: StandInNode) -> NodeRpcClient:
+    return NodeRpcClient(NodeRpcConnectionInfo("127.0.0.1", node.port))
+
+
+async def test_that_bids_are_streamed_and_decoded(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.compress = True
+    STAND_IN_NODE.handlers["state_get_auction_info"] = lambda _: _get_auction_info(500)
+    client = _get_client(STAND_IN_NODE)
+    try:
+        bids = [i async for i in client.iter_auction_bids()]
+        assert len(bids) == 500
+        assert bids[7] == serializer.from_json(AuctionBidByValidator, _get_bid(7))
+
+        bids = [i async for i in client.iter_auction_bids(decode=False)]
+        assert bids == _get_auction_info(500)["auction_state"]["bids"]
+    finally:
+        await client.close()
+
+
+async def test_that_first_items_precede_end_of_response(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.release = asyncio.Event()
+    STAND_IN_NODE.handlers["state_get_auction_info"] = lambda _: _get_auction_info(100)
+    client = _get_client(STAND_IN_NODE)
+    try:
+        bids = client.iter_auction_bids(decode=False)
+        assert await bids.__anext__() == _get_bid(0)
+        STAND_IN_NODE.release.set()
+        assert len([i async for i in bids]) == 99
+    finally:
+        await client.close()
+
+
+async def test_that_transforms_are_streamed(STAND_IN_NODE: StandInNode):
+    transforms = [{"key": f"hash-{i:064x}", "transform": "Identity"} for i in range(50)]
+    STAND_IN_NODE.handlers["info_get_deploy"] = lambda _: {
+        "deploy": {"hash": "11" * 32},
+        "execution_results": [{
+            "block_hash": "22" * 32,
+            "result": {"Success": {"cost": "1", "effect": {"transforms": transforms}}}
+        }]
+    }
+    client = _get_client(STAND_IN_NODE)
+    try:
+        assert [i async for i in client.iter_deploy_transforms("11" * 32)] == transforms
+    finally:
+        await client.close()
+
+
+async def test_that_errors_and_absent_arrays_are_handled(STAND_IN_NODE: StandInNode):
+    def fail(_):
+        raise StandInError(-32003, "no such block")
+
+    STAND_IN_NODE.handlers["state_get_auction_info"] = fail
+    STAND_IN_NODE.handlers["info_get_deploy"] = lambda _: {"execution_results": []}
+    client = _get_client(STAND_IN_NODE)
+    try:
+        with pytest.raises(NodeRpcProxyError) as err:
+            [i async for i in client.iter_auction_bids()]
+        assert err.value.code == -32003
+        assert [i async for i in client.iter_deploy_transforms("11" * 32)] == []
+    finally:
+        await client.close()
+
+
+def test_that_stream_buffers_a_single_item():
+    obj = {"jsonrpc": "2.0", "id": 1, "result": _get_auction_info(200)}
+    body = json.dumps(obj).encode()
+    stream = ArrayStream(("result", "auction_state", "bids"))
+    items, peak = [], 0
+    for i in range(0, len(body), 64):
+        items += stream.feed(body[i:i + 64])
+        peak = max(peak, len(stream._buffer))
+
+    assert items == obj["result"]["auction_state"]["bids"]
+    assert stream.is_finished
+    assert peak < 2 * len(json.dumps(_get_bid(199))) + 64
@@ -0,0 +1,164 @@
+import os
+import threading
+
+import pytest
+
+from pycspr import NodeRpcCachePolicy
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr import NodeRpcResponseCache
+from pycspr.api.rpc import OffloadPolicy
+from tests.test_api_rpc_28 import _get_block
+from tests.utils.stand_in import StandInNode
+
+
+_BLOCK_HASH = "11" * 32
+_DEPLOY_HASH = "22" * 32
+
+
+@pytest.fixture()
+def CACHED_NODE(STAND_IN_NODE: StandInNode) -> StandInNode:
+    STAND_IN_NODE.handlers["chain_get_block"] = lambda _: {"block": _get_block(10)}
+    STAND_IN_NODE.handlers["chain_get_block_transfers"] = \
+        lambda _: {"block_hash": _BLOCK_HASH, "transfers": []}
+    STAND_IN_NODE.handlers["info_get_deploy"] = lambda _: {
+        "deploy": {"hash": _DEPLOY_HASH},
+        "execution_results": []
+    }
+
+    return STAND_IN_NODE
+
+
+def _get_client(node: StandInNode, cache: NodeRpcResponseCache, **kwargs) -> NodeRpcClient:
+    return NodeRpcClient(NodeRpcConnectionInfo("127.0.0.1", node.port), cache=cache, **kwargs)
+
+
+def _get_calls(node: StandInNode, endpoint: str) -> int:
+    return len([i for i in node.requests if i[0] == endpoint])
+
+
+async def test_that_immutable_queries_are_cached(CACHED_NODE: StandInNode):
+    cache = NodeRpcResponseCache()
+    client = _get_client(CACHED_NODE, cache)
+    try:
+        for block_id in (_BLOCK_HASH, 100, _BLOCK_HASH, 100):
+            assert (await client.get_block(block_id)).height == 100
+            assert await client.get_block_transfers(block_id, decode=False) == \
+                {"block_hash": _BLOCK_HASH, "transfers": []}
+        assert _get_calls(CACHED_NODE, "chain_get_block") == 2
+        assert _get_calls(CACHED_NODE, "chain_get_block_transfers") == 2
+        assert cache.stats.hits == 4
+        assert cache.stats.misses == 4
+
+        # Latest block is mutable.
+        await client.get_block()
+        await client.get_block()
+        assert _get_calls(CACHED_NODE, "chain_get_block") == 4
+        assert cache.stats.hits == 4
+    finally:
+        await client.close()
+
+
+async def test_that_deploys_are_cached_once_processed(CACHED_NODE: StandInNode):
+    cache = NodeRpcResponseCache()
+    client = _get_client(CACHED_NODE, cache)
+    try:
+        await client.get_deploy(_DEPLOY_HASH, decode=False)
+        await client.get_deploy(_DEPLOY_HASH, decode=False)
+        assert len(cache) == 0
+
+        CACHED_NODE.handlers["info_get_deploy"] = lambda _: {
+            "deploy": {"hash": _DEPLOY_HASH},
+            "execution_results": [{"block_hash": _BLOCK_HASH, "result": {}}]
+        }
+        for _ in range(3):
+            deploy = await client.get_deploy(_DEPLOY_HASH, decode=False)
+            assert deploy["execution_info"] == [{"block_hash": _BLOCK_HASH, "result": {}}]
+        assert _get_calls(CACHED_NODE, "info_get_deploy") == 3
+        assert len(cache) == 1
+    finally:
+        await client.close()
+
+
+async def test_that_memory_tier_is_size_bounded(CACHED_NODE: StandInNode):
+    cache = NodeRpcResponseCache(NodeRpcCachePolicy(max_bytes=5000))
+    client = _get_client(CACHED_NODE, cache)
+    try:
+        for height in range(10):
+            await client.get_block(height)
+        assert cache.size <= 5000
+        assert cache.stats.evictions == 10 - len(cache)
+
+        await client.get_block(9)
+        await client.get_block(0)
+        assert cache.stats.hits == 1
+    finally:
+        await client.close()
+
+
+async def test_that_disk_tier_outlives_process(CACHED_NODE: StandInNode, tmp_path):
+    policy = NodeRpcCachePolicy(max_bytes=5000, path=str(tmp_path))
+    client = _get_client(CACHED_NODE, NodeRpcResponseCache(policy))
+    try:
+        for height in range(10):
+            await client.get_block(height)
+    finally:
+        await client.close()
+
+    cache = NodeRpcResponseCache(policy)
+    client = _get_client(CACHED_NODE, cache, offload=OffloadPolicy(min_size=0))
+    try:
+        for height in range(10):
+            assert (await client.get_block(height)).height == 100
+        assert _get_calls(CACHED_NODE, "chain_get_block") == 10
+        assert cache.stats.disk_hits == 10
+        assert client.proxy.offloader.offloaded == 0
+    finally:
+        await client.close()
+
+
+async def test_that_disk_tier_is_read_off_event_loop(CACHED_NODE: StandInNode, tmp_path):
+    cache = NodeRpcResponseCache(NodeRpcCachePolicy(max_bytes=0, path=str(tmp_path)))
+    threads = set()
+    read = cache._disk._read
+
+    def _read(key: str) -> bytes:
+        threads.add(threading.get_ident())
+        return read(key)
+
+    cache._disk._read = _read
+    client = _get_client(CACHED_NODE, cache)
+    try:
+        for _ in range(2):
+            assert (await client.get_block(_BLOCK_HASH)).height == 100
+        assert cache.stats.disk_hits == 1
+        assert threads and threading.get_ident() not in threads
+    finally:
+        await client.close()
+
+
+def test_that_abandoned_temporary_files_are_removed(tmp_path):
+    stale, fresh = tmp_path / "aa.1.tmp", tmp_path / "bb.2.tmp"
+    for fpath in (stale, fresh):
+        fpath.write_bytes(b"{}")
+    os.utime(stale, (0, 0))
+
+    NodeRpcResponseCache(NodeRpcCachePolicy(path=str(tmp_path)))
+
+    assert not stale.exists()
+    assert fresh.exists()
+
+
+def test_that_disk_tier_is_shared_between_processes(tmp_path):
+    policy = NodeRpcCachePolicy(max_bytes=0, path=str(tmp_path))
+    cache_1, cache_2 = NodeRpcResponseCache(policy), NodeRpcResponseCache(policy)
+
+    # Entries written by another process are read although not indexed.
+    cache_1.put(b"a", b"1")
+    assert cache_2.get(b"a") == b"1"
+
+    # Entries evicted by another process are misses & may be rewritten.
+    cache_2.clear()
+    assert cache_1.get(b"a") is None
+    cache_1.put(b"a", b"2")
+    assert cache_2.get(b"a") == b"2"
@@ -0,0 +1,98 @@
+import pytest
+
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr import NodeRpcGlobalStateCache
+from pycspr import NodeRpcStateCachePolicy
+from pycspr.types.node import GlobalStateID
+from pycspr.types.node import GlobalStateIDType
+from pycspr.types.node import PurseID
+from pycspr.types.node import PurseIDType
+from tests.utils.stand_in import StandInNode
+
+
+_KEY = "hash-" + "33" * 32
+
+_STATE_ROOT_HASH = bytes.fromhex("ab" * 32)
+
+
+@pytest.fixture()
+def STATE_CACHE_POLICY(tmp_path) -> NodeRpcStateCachePolicy:
+    return NodeRpcStateCachePolicy(str(tmp_path / "state" / "cache.db"))
+
+
+def _get_client(node: StandInNode, cache: NodeRpcGlobalStateCache) -> NodeRpcClient:
+    return NodeRpcClient(NodeRpcConnectionInfo("127.0.0.1", node.port), state_cache=cache)
+
+
+def _get_calls(node: StandInNode, endpoint: str) -> int:
+    return len([i for i in node.requests if i[0] == endpoint])
+
+
+async def test_that_state_queries_are_cached_across_restarts(
+    STAND_IN_NODE: StandInNode,
+    STATE_CACHE_POLICY: NodeRpcStateCachePolicy
+):
+    purse_id = PurseID("01" + "aa" * 32, PurseIDType.PUBLIC_KEY)
+    state_id = GlobalStateID(_STATE_ROOT_HASH, GlobalStateIDType.STATE_ROOT_HASH)
+    for _ in range(2):
+        cache = NodeRpcGlobalStateCache(STATE_CACHE_POLICY)
+        client = _get_client(STAND_IN_NODE, cache)
+        try:
+            for path in (["a"], ["b"], ["a"]):
+                assert await client.get_state_item(_KEY, path, _STATE_ROOT_HASH) == \
+                    {"key": _KEY}
+            assert await client.get_account_balance(purse_id, state_id) == 1000000
+            assert await client.get_account_balance(purse_id, state_id) == 1000000
+        finally:
+            await client.close()
+            cache.close()
+
+    assert _get_calls(STAND_IN_NODE, "state_get_item") == 2
+    assert _get_calls(STAND_IN_NODE, "query_balance") == 1
+    assert cache.stats.hits == 5
+    assert cache.stats.misses == 0
+    assert STAND_IN_NODE.posts == 3
+
+
+async def test_that_latest_root_is_resolved_prior_to_lookup(
+    STAND_IN_NODE: StandInNode,
+    STATE_CACHE_POLICY: NodeRpcStateCachePolicy
+):
+    cache = NodeRpcGlobalStateCache(STATE_CACHE_POLICY)
+    client = _get_client(STAND_IN_NODE, cache)
+    try:
+        for _ in range(3):
+            assert await client.get_state_item(_KEY) == {"key": _KEY}
+        assert _get_calls(STAND_IN_NODE, "chain_get_state_root_hash") == 3
+        assert _get_calls(STAND_IN_NODE, "state_get_item") == 1
+
+        STAND_IN_NODE.handlers["chain_get_state_root_hash"] = \
+            lambda _: {"state_root_hash": "cd" * 32}
+        await client.get_state_item(_KEY)
+        assert _get_calls(STAND_IN_NODE, "state_get_item") == 2
+        assert len(cache) == 2
+    finally:
+        await client.close()
+        cache.close()
+
+
+async def test_that_cache_is_size_bounded(
+    STAND_IN_NODE: StandInNode,
+    STATE_CACHE_POLICY: NodeRpcStateCachePolicy
+):
+    STATE_CACHE_POLICY.max_bytes = 1000
+    cache = NodeRpcGlobalStateCache(STATE_CACHE_POLICY)
+    client = _get_client(STAND_IN_NODE, cache)
+    try:
+        for i in range(50):
+            await client.get_state_item(f"hash-{i:064x}", [], _STATE_ROOT_HASH)
+        assert cache.size <= 1000
+        assert cache.stats.evictions == 50 - len(cache)
+
+        # Most recently used results are retained.
+        await client.get_state_item(f"hash-{49:064x}", [], _STATE_ROOT_HASH)
+        assert cache.stats.hits == 1
+    finally:
+        await client.close()
+        cache.close()
@@ -0,0 +1,59 @@
+import asyncio
+import time
+
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr.api.transport import Transport
+from pycspr.types.node import PurseID
+from pycspr.types.node import PurseIDType
+from tests.utils.stand_in import StandInNode
+
+
+async def test_that_concurrent_calls_are_not_serialised(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.delay = 0.2
+    client = NodeRpcClient(NodeRpcConnectionInfo("127.0.0.1", STAND_IN_NODE.port))
+
+    started = time.monotonic()
+    data = await asyncio.gather(*[client.get_state_root_hash() for _ in range(50)])
+    assert time.monotonic() - started < 1.0
+    assert data == [bytes.fromhex("ab" * 32)] * 50
+
+    await client.close()
+
+
+async def test_that_connections_are_pooled(STAND_IN_NODE: StandInNode):
+    client = NodeRpcClient(NodeRpcConnectionInfo("127.0.0.1", STAND_IN_NODE.port))
+    for _ in range(10):
+        await client.get_state_root_hash()
+    assert STAND_IN_NODE.posts == 10
+    assert len(STAND_IN_NODE.connections) == 1
+
+    await client.close()
+
+
+async def test_that_connection_pool_size_is_bounded(STAND_IN_NODE: StandInNode):
+    STAND_IN_NODE.delay = 0.05
+    client = NodeRpcClient(NodeRpcConnectionInfo("127.0.0.1", STAND_IN_NODE.port, pool_size=4))
+    purse_id = PurseID(bytes(32), PurseIDType.ACCOUNT_HASH)
+    await asyncio.gather(*[client.get_account_balance(purse_id) for _ in range(20)])
+    assert len(STAND_IN_NODE.connections) <= 4
+
+    await client.close()
+
+
+def test_that_sessions_bound_to_other_loops_are_closed():
+    transport = Transport()
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(transport.open())
+        session = transport._session
+
+        # Session of a loop that has since closed is discarded.
+        asyncio.run(transport.open())
+        assert transport._session is not session
+
+        loop.run_until_complete(transport.close())
+        assert session.closed
+        assert transport._session is None
+    finally:
+        loop.close()
@@ -55,14 +55,30 @@ def _has_member(mod, member):
 # Expected interface.
 _INTERFACE_OF_LIBRARY = {
     _has_class: {
+        "NodeCircuitBreakerPolicy",
+        "NodeCircuitOpenError",
+        "NodeDeadlineExceededError",
         "NodeEventInfo",
         "NodeRestClient",
         "NodeRestConnectionInfo",
+        "NodeRestSyncClient",
+        "NodeRpcCachePolicy",
+        "NodeRpcCassette",
+        "NodeRpcCassetteError",
         "NodeRpcClient",
         "NodeRpcConnectionInfo",
+        "NodeRpcGlobalStateCache",
         "NodeRpcProxyError",
+        "NodeRpcReplayTransport",
+        "NodeRpcResponseCache",
+        "NodeRpcStateCachePolicy",
+        "NodeRpcSyncClient",
+        "NodeRetryPolicy",
+        "NodeSession",
+        "NodeSessionConnectionInfo",
         "NodeSpeculativeRpcClient",
         "NodeSpeculativeRpcConnectionInfo",
+        "NodeSpeculativeRpcSyncClient",
         "NodeSseClient",
         "NodeSseConnectionInfo",
         "PublicKey",
@@ -73,6 +89,8 @@ _INTERFACE_OF_LIBRARY = {
         "KeyAlgorithm",
         "NodeEventChannel",
         "NodeEventType",
+        "NodeRpcPriority",
+        "NodeRpcSelectionStrategy",
     },
     _has_constant: {
         "DEFAULT_HASH_ALGO",
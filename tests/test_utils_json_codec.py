@@ -0,0 +1,56 @@
+import pytest
+
+from pycspr import NodeRpcClient
+from pycspr import NodeRpcConnectionInfo
+from pycspr.utils import json_codec
+from tests.utils.stand_in import StandInNode
+
+
+_OBJ = {"b": [1, "é", None, True, 2 ** 63], "a": {"y": "1", "x": [{}]}}
+
+
+@pytest.fixture(params=sorted(json_codec.CODECS))
+def CODEC(request) -> json_codec.JsonCodec:
+    codec = json_codec.get_codec()
+    json_codec.set_codec(request.param)
+    yield json_codec.get_codec()
+    json_codec.set_codec(codec)
+
+
+def test_that_codecs_round_trip_bytes(CODEC: json_codec.JsonCodec):
+    encoded = json_codec.dumps(_OBJ)
+    assert isinstance(encoded, bytes)
+    assert json_codec.loads(encoded) == _OBJ
+    assert json_codec.loads(bytearray(encoded)) == _OBJ
+    assert json_codec.loads(memoryview(encoded)) == _OBJ
+    assert json_codec.loads(encoded.decode("utf-8")) == _OBJ
+    assert json_codec.loads(json_codec.dumps(_OBJ, indent=True)) == _OBJ
+
+
+def test_that_codecs_agree_upon_canonical_encoding():
+    encoded = {i.dumps(_OBJ, sort_keys=True) for i in json_codec.CODECS.values()}
+    assert encoded == {
+        '{"a":{"x":[{}],"y":"1"},"b":[1,"é",null,true,9223372036854775808]}'.encode()
+    }
+
+    encoded = {i.dumps(_OBJ, indent=True) for i in json_codec.CODECS.values()}
+    assert len(encoded) == 1
+
+
+def test_that_default_codec_decodes_large_integers_losslessly():
+    assert json_codec.get_codec().name == "json"
+    assert json_codec.loads(b"[18446744073709551616]") == [2 ** 64]
+
+
+def test_that_unavailable_codecs_are_rejected():
+    with pytest.raises(ValueError):
+        json_codec.set_codec("simdjson")
+
+
+async def test_that_rpc_calls_use_codec(CODEC: json_codec.JsonCodec, STAND_IN_NODE: StandInNode):
+    client = NodeRpcClient(NodeRpcConnectionInfo("127.0.0.1", STAND_IN_NODE.port))
+    try:
+        assert await client.get_state_root_hash() == bytes.fromhex("ab" * 32)
+        assert STAND_IN_NODE.requests[-1] == ("chain_get_state_root_hash", {})
+    finally:
+        await client.close()
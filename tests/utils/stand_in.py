@@ -0,0 +1,160 @@
+import asyncio
+import json
+import ssl
+import typing
+
+from aiohttp import web
+
+
+class StandInError(Exception):
+    """Raised by a stand-in handler in order to emit a JSON-RPC error response.
+
+    """
+    def __init__(self, code: int, message: str):
+        super(StandInError, self).__init__(message)
+        self.code = code
+        self.message = message
+
+
+# Default endpoint handlers: params -> result.
+_DEFAULT_HANDLERS: typing.Dict[str, typing.Callable[[dict], dict]] = {
+    "chain_get_state_root_hash": lambda _: {"state_root_hash": "ab" * 32},
+    "info_get_peers": lambda _: {"peers": []},
+    "query_balance": lambda _: {"balance": "1000000"},
+    "state_get_item": lambda params: {"stored_value": {"key": params["key"]}},
+}
+
+
+# Default REST endpoint response bodies.
+_DEFAULT_RESOURCES: typing.Dict[str, str] = {
+    "metrics": "# HELP a_metric A metric.\na_metric 1\nb_metric 2",
+    "status": '{"api_version": "1.0.0"}',
+    "validator-changes": '{"changes": []}',
+}
+
+
+class StandInNode():
+    """Local stand-in for a node's JSON-RPC & REST servers.
+
+    """
+    def __init__(
+        self,
+        handlers: dict = None,
+        delay: float = 0.0,
+        base_path: str = "",
+        ssl_context: ssl.SSLContext = None
+    ):
+        self.base_path = base_path
+        self.compress = False
+        self.compressed_posts = 0
+        self.connections: typing.Set[tuple] = set()
+        self.delay = delay
+        self.gets = 0
+        self.handlers = dict(_DEFAULT_HANDLERS) | (handlers or dict())
+        self.headers: typing.List[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.posts = 0
+        self.release: asyncio.Event = None
+        self.requests: typing.List[typing.Tuple[str, dict]] = []
+        self.resources: typing.Dict[str, str] = dict(_DEFAULT_RESOURCES)
+        self.ssl_context = ssl_context
+        self._runner: web.AppRunner = None
+        self._site: web.TCPSite = None
+
+    @property
+    def port(self) -> int:
+        return self._site._server.sockets[0].getsockname()[1]
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post(f"{self.base_path}/rpc", self._on_post)
+        app.router.add_get(f"{self.base_path}/{{resource}}", self._on_get)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        self._site = web.TCPSite(self._runner, "127.0.0.1", 0, ssl_context=self.ssl_context)
+        await self._site.start()
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+    async def _on_get(self, request: web.Request) -> web.Response:
+        self.gets += 1
+        self.headers.append(dict(request.headers))
+        self.connections.add(request.transport.get_extra_info("peername"))
+        self.in_flight += 1
+        self.max_in_flight = max(self.in_flight, self.max_in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        try:
+            response = web.Response(text=self.resources[request.match_info["resource"]])
+        except KeyError:
+            raise web.HTTPNotFound()
+        if self.compress:
+            response.enable_compression()
+
+        return response
+
+    async def _on_post(self, request: web.Request) -> web.Response:
+        self.posts += 1
+        self.headers.append(dict(request.headers))
+        self.connections.add(request.transport.get_extra_info("peername"))
+        if request.headers.get("Content-Encoding") == "gzip":
+            self.compressed_posts += 1
+        payload = await request.json()
+        self.in_flight += 1
+        self.max_in_flight = max(self.in_flight, self.max_in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        if isinstance(payload, list):
+            response = web.json_response([self._get_response(i) for i in payload])
+        elif self.release is not None:
+            return await self._stream_response(request, self._get_response(payload))
+        else:
+            response = web.json_response(self._get_response(payload))
+        if self.compress:
+            response.enable_compression()
+
+        return response
+
+    async def _stream_response(self, request: web.Request, obj: dict) -> web.StreamResponse:
+        # Withholds 2nd half of response body until released.
+        body = json.dumps(obj).encode()
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        await response.prepare(request)
+        await response.write(body[:len(body) // 2])
+        await self.release.wait()
+        await response.write(body[len(body) // 2:])
+        await response.write_eof()
+
+        return response
+
+    def _get_response(self, request: dict) -> dict:
+        method, params = request["method"], request.get("params", dict())
+        self.requests.append((method, params))
+        try:
+            handler = self.handlers[method]
+        except KeyError:
+            return _get_error(request, -32601, "Method not found")
+        try:
+            result = handler(params)
+        except StandInError as err:
+            return _get_error(request, err.code, err.message)
+
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+
+def _get_error(request: dict, code: int, message: str) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": request["id"],
+        "error": {"code": code, "message": message},
+    }